@@ -3,40 +3,146 @@ Access Management Request DTO
 Data transfer object for access management requests
 """
 
-from dataclasses import dataclass, field
-from typing import List, Optional
+import re
+from dataclasses import dataclass, replace
+from typing import List, Optional, Sequence, Tuple, Union
 from enum import Enum
 
 
+# Loose shape check; full validation happens in the Email value object
+_EMAIL_RE = re.compile(r"[^@]+@[^@]+\.[^@]+")
+
+# Shared immutable default; no per-request list allocation
+_DEFAULT_FORMATS: Tuple[str, ...] = ('csv', 'excel')
+
+
 class OperationMode(Enum):
     """Access management operation modes"""
     REVOKE_ALL = "revoke_all"
     AUDIT_ONLY = "audit_only"
     DOWNGRADE_PERMISSIONS = "downgrade_permissions"
     GRANT_ACCESS = "grant_access"
+    
+    @classmethod
+    def from_str(cls, value: str) -> 'OperationMode':
+        """
+        Look up an operation mode by its value
+        
+        Args:
+            value: Operation mode value (e.g. "revoke_all")
+            
+        Returns:
+            Matching OperationMode
+            
+        Raises:
+            ValueError: If value is not a valid operation mode
+        """
+        try:
+            return _OP_BY_VALUE[value]
+        except KeyError:
+            raise ValueError(f"Invalid operation mode: {value}") from None
+
 
+_OP_BY_VALUE = {mode.value: mode for mode in OperationMode}
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class AccessManagementRequest:
     """
     Access Management Request DTO
     
     Encapsulates all parameters for an access management operation.
     Uses Builder pattern for complex construction.
+    
+    Requests are immutable and hashable, so they can key result caches
+    (e.g. memoized dry runs).
     """
     
+    _VALID_FORMATS = frozenset({'csv', 'excel', 'json', 'html'})
+    
     target_email: str
     operation_mode: OperationMode = OperationMode.REVOKE_ALL
     dry_run: bool = False
-    report_formats: List[str] = field(default_factory=lambda: ['csv', 'excel'])
+    report_formats: Tuple[str, ...] = _DEFAULT_FORMATS
     skip_errors: bool = False
     use_admin_access: bool = False
     cache_enabled: bool = True
     force_cache_refresh: bool = False
+    results_path: Optional[str] = None
+    
+    @classmethod
+    def revoking(
+        cls,
+        target_email: str,
+        formats: Sequence[str] = _DEFAULT_FORMATS,
+        **options
+    ) -> 'AccessManagementRequest':
+        """
+        Create a validated request that revokes all access
+        
+        Args:
+            target_email: Target user email
+            formats: Report formats
+            **options: Any other request field (e.g. skip_errors=True)
+            
+        Returns:
+            AccessManagementRequest instance
+        """
+        request = cls(
+            target_email,
+            OperationMode.REVOKE_ALL,
+            report_formats=tuple(formats),
+            **options
+        )
+        request.validate()
+        return request
+    
+    @classmethod
+    def for_dry_run(
+        cls,
+        target_email: str,
+        formats: Sequence[str] = _DEFAULT_FORMATS,
+        **options
+    ) -> 'AccessManagementRequest':
+        """
+        Create a validated revoke-all request in dry run mode
+        
+        Args:
+            target_email: Target user email
+            formats: Report formats
+            **options: Any other request field
+            
+        Returns:
+            AccessManagementRequest instance
+        """
+        return cls.revoking(target_email, formats, dry_run=True, **options)
     
-    def __post_init__(self):
-        """Post-initialization processing"""
-        pass  # field default_factory handles initialization
+    @classmethod
+    def for_audit(
+        cls,
+        target_email: str,
+        formats: Sequence[str] = _DEFAULT_FORMATS,
+        **options
+    ) -> 'AccessManagementRequest':
+        """
+        Create a validated audit-only request
+        
+        Args:
+            target_email: Target user email
+            formats: Report formats
+            **options: Any other request field
+            
+        Returns:
+            AccessManagementRequest instance
+        """
+        request = cls(
+            target_email,
+            OperationMode.AUDIT_ONLY,
+            report_formats=tuple(formats),
+            **options
+        )
+        request.validate()
+        return request
     
     def validate(self) -> None:
         """
@@ -45,20 +151,23 @@ class AccessManagementRequest:
         Raises:
             ValueError: If parameters are invalid
         """
-        if not self.target_email or '@' not in self.target_email:
+        if not self.target_email or not _EMAIL_RE.match(self.target_email):
             raise ValueError(f"Invalid target email: {self.target_email}")
         
-        valid_formats = {'csv', 'excel', 'json', 'html'}
-        for fmt in self.report_formats:
-            if fmt.lower() not in valid_formats:
-                raise ValueError(f"Invalid report format: {fmt}")
+        lowered = [fmt.lower() for fmt in self.report_formats]
+        if not self._VALID_FORMATS.issuperset(lowered):
+            invalid = [fmt for fmt in lowered if fmt not in self._VALID_FORMATS]
+            raise ValueError(f"Invalid report format(s): {', '.join(invalid)}")
 
 
 class AccessManagementRequestBuilder:
     """
     Builder for AccessManagementRequest (Builder Pattern)
     
-    Provides fluent API for constructing complex requests.
+    Provides fluent API for constructing complex requests. Kept for
+    backward compatibility; prefer the AccessManagementRequest classmethod
+    constructors. Each step replaces an immutable draft request, so no
+    state is shared between builders.
     """
     
     def __init__(self, target_email: str):
@@ -68,49 +177,46 @@ class AccessManagementRequestBuilder:
         Args:
             target_email: Target user email (required)
         """
-        self._target_email = target_email
-        self._operation_mode = OperationMode.REVOKE_ALL
-        self._dry_run = False
-        self._report_formats = ['csv', 'excel']
-        self._skip_errors = False
-        self._use_admin_access = False
-        self._cache_enabled = True
-        self._force_cache_refresh = False
-    
-    def with_operation(self, mode: OperationMode) -> 'AccessManagementRequestBuilder':
-        """Set operation mode"""
-        self._operation_mode = mode
+        self._draft = AccessManagementRequest(target_email)
+    
+    def _set(self, **changes) -> 'AccessManagementRequestBuilder':
+        """Replace fields on the draft request"""
+        self._draft = replace(self._draft, **changes)
         return self
     
+    def with_operation(self, mode: Union[OperationMode, str]) -> 'AccessManagementRequestBuilder':
+        """Set operation mode (enum member or its string value)"""
+        return self._set(
+            operation_mode=OperationMode.from_str(mode) if isinstance(mode, str) else mode
+        )
+    
     def as_dry_run(self) -> 'AccessManagementRequestBuilder':
         """Enable dry run mode"""
-        self._dry_run = True
-        return self
+        return self._set(dry_run=True)
     
-    def with_formats(self, formats: List[str]) -> 'AccessManagementRequestBuilder':
+    def with_formats(self, formats: Sequence[str]) -> 'AccessManagementRequestBuilder':
         """Set report formats"""
-        self._report_formats = formats
-        return self
+        return self._set(report_formats=tuple(formats))
     
     def skip_errors(self) -> 'AccessManagementRequestBuilder':
         """Enable skip errors mode"""
-        self._skip_errors = True
-        return self
+        return self._set(skip_errors=True)
     
     def use_admin_access(self) -> 'AccessManagementRequestBuilder':
         """Enable admin access override"""
-        self._use_admin_access = True
-        return self
+        return self._set(use_admin_access=True)
     
     def without_cache(self) -> 'AccessManagementRequestBuilder':
         """Disable caching"""
-        self._cache_enabled = False
-        return self
+        return self._set(cache_enabled=False)
     
     def force_refresh_cache(self) -> 'AccessManagementRequestBuilder':
         """Force cache refresh"""
-        self._force_cache_refresh = True
-        return self
+        return self._set(force_cache_refresh=True)
+    
+    def stream_results_to(self, path: str) -> 'AccessManagementRequestBuilder':
+        """Stream revocation results to a file instead of keeping them in memory"""
+        return self._set(results_path=path)
     
     def build(self) -> AccessManagementRequest:
         """
@@ -119,16 +225,5 @@ class AccessManagementRequestBuilder:
         Returns:
             AccessManagementRequest instance
         """
-        request = AccessManagementRequest(
-            target_email=self._target_email,
-            operation_mode=self._operation_mode,
-            dry_run=self._dry_run,
-            report_formats=self._report_formats,
-            skip_errors=self._skip_errors,
-            use_admin_access=self._use_admin_access,
-            cache_enabled=self._cache_enabled,
-            force_cache_refresh=self._force_cache_refresh
-        )
-        
-        request.validate()
-        return request
+        self._draft.validate()
+        return self._draft
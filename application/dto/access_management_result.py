@@ -3,12 +3,19 @@ Access Management Result DTO
 Data transfer object for access management results
 """
 
+import sys
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, TYPE_CHECKING
 from datetime import datetime
 
+if TYPE_CHECKING:
+    from application.interfaces.services import IResultSink
 
-@dataclass
+
+_SEP = "=" * 60
+
+
+@dataclass(slots=True)
 class RevocationResult:
     """Result of a single permission revocation"""
     file_id: str
@@ -17,14 +24,23 @@ class RevocationResult:
     status: str  # 'success', 'failed', 'skipped'
     error: Optional[str] = None
     error_reason: Optional[str] = None
+    
+    def __post_init__(self):
+        """Intern Drive IDs; the same file ID recurs once per permission"""
+        self.file_id = sys.intern(self.file_id)
+        self.permission_id = sys.intern(self.permission_id)
 
 
-@dataclass
+@dataclass(slots=True)
 class AccessManagementResult:
     """
     Access Management Result DTO
     
     Encapsulates all results from an access management operation.
+    
+    Counts are tracked incrementally by add_result/add_skipped. When a
+    sink is supplied, revocation results are streamed to it instead of
+    being retained in the result lists.
     """
     
     target_email: str
@@ -49,25 +65,34 @@ class AccessManagementResult:
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
     
+    # Optional streaming destination for revocation results
+    sink: Optional['IResultSink'] = field(default=None, repr=False, compare=False)
+    
+    # Incremental counters
+    _success_n: int = field(default=0, init=False, repr=False)
+    _failure_n: int = field(default=0, init=False, repr=False)
+    _skipped_n: int = field(default=0, init=False, repr=False)
+    _denied_n: int = field(default=0, init=False, repr=False)
+    
     @property
     def success_count(self) -> int:
         """Number of successful revocations"""
-        return len(self.successful_revocations)
+        return self._success_n
     
     @property
     def failure_count(self) -> int:
         """Number of failed revocations"""
-        return len(self.failed_revocations)
+        return self._failure_n
     
     @property
     def skipped_count(self) -> int:
         """Number of skipped files"""
-        return len(self.skipped_files)
+        return self._skipped_n
     
     @property
     def permission_denied_count(self) -> int:
         """Number of permission denied errors"""
-        return len(self.permission_denied)
+        return self._denied_n
     
     @property
     def is_successful(self) -> bool:
@@ -79,6 +104,68 @@ class AccessManagementResult:
         """Check if there were any errors"""
         return self.failure_count > 0 or self.permission_denied_count > 0
     
+    def add_result(self, revocation: RevocationResult) -> None:
+        """
+        Record a single revocation result
+        
+        Updates the counter matching the result status and either streams
+        the result to the sink or retains it in the matching list.
+        
+        Args:
+            revocation: Revocation result to record
+        """
+        status = revocation.status
+        
+        if self.sink is not None:
+            self.sink.write(revocation)
+        
+        if status == 'skipped':
+            if self.sink is None:
+                self.add_skipped({
+                    'file_id': revocation.file_id,
+                    'file_name': revocation.file_name,
+                    'reason': revocation.error or 'Permission not found'
+                })
+            else:
+                self._skipped_n += 1
+            return
+        
+        if status == 'failed':
+            self._failure_n += 1
+            target = self.failed_revocations
+        elif status == 'permission_denied':
+            self._denied_n += 1
+            target = self.permission_denied
+        else:
+            self._success_n += 1
+            target = self.successful_revocations
+        
+        if self.sink is None:
+            target.append(revocation)
+    
+    def add_skipped(self, entry: Dict[str, Any]) -> None:
+        """
+        Record a skipped file
+        
+        Args:
+            entry: Skipped file details (file_id, file_name, reason, ...)
+        """
+        self._skipped_n += 1
+        self.skipped_files.append(entry)
+    
+    def record_revocations(self, revocations: List[RevocationResult]) -> None:
+        """
+        Aggregate a list of revocation results by status
+        
+        Consumes the output of a batch revocation directly instead of
+        requiring one call per permission.
+        
+        Args:
+            revocations: Revocation results to record
+        """
+        for revocation in revocations:
+            self.add_result(revocation)
+    
     def get_summary(self) -> Dict[str, Any]:
         """
         Get summary dictionary
@@ -104,23 +191,33 @@ class AccessManagementResult:
     
     def print_summary(self) -> None:
         """Print formatted summary to console"""
-        print("\n" + "="*60)
-        print(f"ACCESS MANAGEMENT {'DRY RUN ' if self.dry_run else ''}RESULTS")
-        print("="*60)
-        print(f"Target User: {self.target_email}")
-        print(f"Operation: {self.operation_mode}")
-        print(f"\nFiles Scanned: {self.total_files_scanned}")
-        print(f"Files with Access: {self.total_files_with_access}")
-        print(f"\n✓ Successful Revocations: {self.success_count}")
-        print(f"✗ Failed Revocations: {self.failure_count}")
-        print(f"⊘ Skipped Files: {self.skipped_count}")
-        print(f"⚠ Permission Denied: {self.permission_denied_count}")
-        print(f"\nExecution Time: {self.execution_time_seconds:.2f}s")
-        print(f"Cache Used: {'Yes' if self.cache_used else 'No'}")
+        lines = [
+            "",
+            _SEP,
+            f"ACCESS MANAGEMENT {'DRY RUN ' if self.dry_run else ''}RESULTS",
+            _SEP,
+            f"Target User: {self.target_email}",
+            f"Operation: {self.operation_mode}",
+            "",
+            f"Files Scanned: {self.total_files_scanned}",
+            f"Files with Access: {self.total_files_with_access}",
+            "",
+            f"✓ Successful Revocations: {self.success_count}",
+            f"✗ Failed Revocations: {self.failure_count}",
+            f"⊘ Skipped Files: {self.skipped_count}",
+            f"⚠ Permission Denied: {self.permission_denied_count}",
+            "",
+            f"Execution Time: {self.execution_time_seconds:.2f}s",
+            f"Cache Used: {'Yes' if self.cache_used else 'No'}"
+        ]
         
         if self.report_paths:
-            print(f"\nReports Generated:")
-            for path in self.report_paths:
-                print(f"  • {path}")
+            lines.append("")
+            lines.append("Reports Generated:")
+            lines.extend(f"  • {path}" for path in self.report_paths)
+        
+        lines.append(_SEP)
+        lines.append("")
         
-        print("="*60 + "\n")
+        # Single write instead of one print() per line
+        sys.stdout.write("\n".join(lines) + "\n")
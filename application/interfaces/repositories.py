@@ -1,16 +1,29 @@
 """
 Repository Interfaces
 Abstract data access layer following Repository pattern
+
+Drive lookups by user must be filtered server-side rather than by listing
+every file and filtering locally. For Google Drive the required ``q``
+filters are:
+
+    find_files_shared_with: "'<email>' in readers or '<email>' in writers"
+    find_files_owned_by:    "'<email>' in owners"
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional, Any
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import AsyncIterator, Dict, Iterator, List, Optional, Any, Tuple
 from datetime import timedelta
 
 from domain.entities.drive_file import DriveFile
 from domain.entities.permission import Permission
 from domain.value_objects.email import Email
 from domain.value_objects.identifiers import FileId, PermissionId
+from domain.exceptions.access_manager_errors import (
+    PermissionDeniedError,
+    FileNotFoundError as DomainFileNotFoundError
+)
+from application.dto.access_management_result import RevocationResult
 
 
 class IDriveRepository(ABC):
@@ -23,18 +36,84 @@ class IDriveRepository(ABC):
     """
     
     @abstractmethod
-    def list_all_files(self, page_size: int = 100) -> List[DriveFile]:
+    def list_all_files(self, page_size: Optional[int] = None) -> List[DriveFile]:
         """
         List all accessible Drive files
         
+        Implementations must follow page tokens until the listing is
+        exhausted; callers rely on complete results.
+        
         Args:
             page_size: Number of files to fetch per API request
+                (implementation default if None)
             
         Returns:
             List of DriveFile entities
         """
         pass
     
+    @abstractmethod
+    def iter_all_files(self, page_size: Optional[int] = None) -> Iterator[DriveFile]:
+        """
+        Iterate over all accessible Drive files, one page at a time
+        
+        Only the current page is held in memory, so callers can filter
+        and aggregate while the listing is still in progress.
+        
+        Args:
+            page_size: Number of files to fetch per API request
+                (implementation default if None)
+            
+        Returns:
+            Iterator of DriveFile entities
+        """
+        pass
+    
+    @abstractmethod
+    def list_all_files_async(self, page_size: Optional[int] = None) -> AsyncIterator[DriveFile]:
+        """
+        Stream all accessible Drive files asynchronously
+        
+        Implementations should request the next page while the current
+        one is being consumed, so total time approaches one round-trip
+        per page rather than round-trip plus processing.
+        
+        Args:
+            page_size: Number of files to fetch per API request
+                (implementation default if None)
+            
+        Returns:
+            Async iterator of DriveFile entities
+        """
+        pass
+    
+    @abstractmethod
+    def get_start_page_token(self) -> str:
+        """
+        Get the change-log position representing "now"
+        
+        Take it before a full listing so that changes made during the
+        listing are picked up by the next list_changes call.
+        
+        Returns:
+            Start page token for list_changes
+        """
+        pass
+    
+    @abstractmethod
+    def list_changes(self, page_token: str) -> Tuple[List[DriveFile], List[str], str]:
+        """
+        List files changed since a change-log position
+        
+        Args:
+            page_token: Token from get_start_page_token or a previous call
+            
+        Returns:
+            Tuple of (added or updated files, removed file IDs, new start
+            page token)
+        """
+        pass
+    
     @abstractmethod
     def get_file_by_id(self, file_id: FileId) -> Optional[DriveFile]:
         """
@@ -48,13 +127,37 @@ class IDriveRepository(ABC):
         """
         pass
     
+    def get_files_by_ids(self, file_ids: List[FileId]) -> List[Optional[DriveFile]]:
+        """
+        Get several files by ID
+        
+        The default implementation loops over get_file_by_id(); backends
+        with a batch endpoint should override it.
+        
+        Args:
+            file_ids: File identifiers
+            
+        Returns:
+            List aligned with file_ids: DriveFile entity, or None if not found
+        """
+        return [self.get_file_by_id(file_id) for file_id in file_ids]
+    
     @abstractmethod
-    def find_files_shared_with(self, email: Email) -> List[DriveFile]:
+    def find_files_shared_with(
+        self,
+        email: Email,
+        fields: Optional[str] = None
+    ) -> List[DriveFile]:
         """
         Find all files shared with a specific user
         
+        Implementations must push the selection to the backend (see the
+        module docstring) instead of scanning every file.
+        
         Args:
             email: User email address
+            fields: Optional partial-response projection, e.g.
+                "nextPageToken, files(id, name, permissions)"
             
         Returns:
             List of DriveFile entities shared with the user
@@ -62,12 +165,21 @@ class IDriveRepository(ABC):
         pass
     
     @abstractmethod
-    def find_files_owned_by(self, email: Email) -> List[DriveFile]:
+    def find_files_owned_by(
+        self,
+        email: Email,
+        fields: Optional[str] = None
+    ) -> List[DriveFile]:
         """
         Find all files owned by a specific user
         
+        Implementations must push the selection to the backend (see the
+        module docstring) instead of scanning every file.
+        
         Args:
             email: Owner email address
+            fields: Optional partial-response projection, e.g.
+                "nextPageToken, files(id, name, owners)"
             
         Returns:
             List of DriveFile entities owned by the user
@@ -119,6 +231,84 @@ class IPermissionRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    def revoke_permissions_batch(
+        self,
+        items: List[Tuple[FileId, PermissionId]],
+        use_admin_access: bool = False
+    ) -> List[RevocationResult]:
+        """
+        Revoke many permissions with as few round-trips as possible
+        
+        Implementations should group requests (the Drive batch endpoint
+        accepts up to 100 sub-requests per HTTP call) rather than issuing
+        one call per permission. Per-item failures never raise; they are
+        reported through the status of the matching result.
+        
+        Args:
+            items: (file_id, permission_id) pairs to revoke
+            use_admin_access: Use domain admin access override
+            
+        Returns:
+            List of RevocationResult aligned with ``items``. Status is
+            'success', 'permission_denied', 'skipped' (not found) or 'failed'.
+            ``file_name`` is left empty for the caller to fill in.
+        """
+        pass
+    
+    def revoke_permissions_concurrent(
+        self,
+        items: List[Tuple[FileId, PermissionId]],
+        max_in_flight: int = 8,
+        use_admin_access: bool = False
+    ) -> Iterator[RevocationResult]:
+        """
+        Revoke permissions with bounded concurrency
+        
+        Revocations are I/O-bound, so up to ``max_in_flight`` calls to
+        revoke_permission overlap their network round-trips. Drive accepts
+        roughly 10 concurrent requests per user, so keep the bound below
+        that. Implementations whose client is not thread-safe must
+        override this (or lower the bound). Per-item failures never raise;
+        they are reported through the status of the yielded result.
+        
+        Args:
+            items: (file_id, permission_id) pairs to revoke
+            max_in_flight: Maximum concurrent revocations
+            use_admin_access: Use domain admin access override
+            
+        Returns:
+            Iterator of RevocationResult in completion order. Status is
+            'success', 'permission_denied', 'skipped' (not found) or 'failed'.
+            ``file_name`` is left empty for the caller to fill in.
+        """
+        def revoke(file_id: FileId, permission_id: PermissionId) -> RevocationResult:
+            try:
+                self.revoke_permission(file_id, permission_id, use_admin_access)
+                status, error = 'success', None
+            except DomainFileNotFoundError as e:
+                status, error = 'skipped', str(e)
+            except PermissionDeniedError as e:
+                status, error = 'permission_denied', str(e)
+            except Exception as e:
+                status, error = 'failed', str(e)
+            
+            return RevocationResult(
+                file_id=str(file_id),
+                file_name='',
+                permission_id=str(permission_id),
+                status=status,
+                error=error
+            )
+        
+        with ThreadPoolExecutor(max_workers=max(1, max_in_flight)) as executor:
+            futures = [
+                executor.submit(revoke, file_id, permission_id)
+                for file_id, permission_id in items
+            ]
+            for future in as_completed(futures):
+                yield future.result()
+    
     @abstractmethod
     def update_permission_role(
         self,
@@ -209,3 +399,53 @@ class ICacheRepository(ABC):
         Clear all cached data
         """
         pass
+    
+    def mget(self, keys: List[str]) -> Dict[str, Any]:
+        """
+        Load several cache entries at once
+        
+        The default implementation loops over load(); backends with a
+        native multi-get (e.g. Redis MGET) should override it.
+        
+        Args:
+            keys: Cache keys
+            
+        Returns:
+            Mapping of key to cached data for entries that were found
+        """
+        found = {}
+        for key in keys:
+            data = self.load(key)
+            if data is not None:
+                found[key] = data
+        return found
+    
+    def mset(self, items: Dict[str, Tuple[Any, Optional[timedelta]]]) -> None:
+        """
+        Save several cache entries at once
+        
+        The default implementation loops over save(); backends with
+        pipelining should override it.
+        
+        Args:
+            items: Mapping of key to (data, ttl)
+            
+        Raises:
+            CacheError: If a save operation fails
+        """
+        for key, (data, ttl) in items.items():
+            self.save(key, data, ttl)
+    
+    @abstractmethod
+    def invalidate_prefix(self, prefix: str) -> None:
+        """
+        Invalidate every entry whose key starts with prefix
+        
+        This is the hook to call after administrative changes that make a
+        family of entries stale (e.g. all Drive listings). Entries under
+        other keys, such as revocation checkpoints, must be left intact.
+        
+        Args:
+            prefix: Cache key prefix
+        """
+        pass
@@ -3,11 +3,14 @@ Service Interfaces
 Abstract contracts for infrastructure services
 """
 
+import base64
+import io
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from typing import IO, Iterable, List, Dict, Any, Optional, Sequence, Tuple
 from enum import Enum
 
 from domain.entities.drive_file import DriveFile
+from application.dto.access_management_result import RevocationResult
 
 
 class IAuthenticationService(ABC):
@@ -60,6 +63,18 @@ class IAuthenticationService(ABC):
             True if authenticated
         """
         pass
+    
+    def create_http(self) -> Any:
+        """
+        Create a new authorized HTTP object with its own connection
+        
+        HTTP objects are not thread-safe; concurrent callers should each
+        use their own.
+        
+        Returns:
+            Authorized HTTP object, or None if not supported
+        """
+        return None
 
 
 class ReportFormat(Enum):
@@ -68,6 +83,28 @@ class ReportFormat(Enum):
     EXCEL = "excel"
     JSON = "json"
     HTML = "html"
+    
+    @classmethod
+    def from_str(cls, value: str) -> 'ReportFormat':
+        """
+        Look up a report format by its value
+        
+        Args:
+            value: Report format value (e.g. "csv")
+            
+        Returns:
+            Matching ReportFormat
+            
+        Raises:
+            ValueError: If value is not a valid report format
+        """
+        try:
+            return _FORMAT_BY_VALUE[value]
+        except KeyError:
+            raise ValueError(f"Invalid report format: {value}") from None
+
+
+_FORMAT_BY_VALUE = {fmt.value: fmt for fmt in ReportFormat}
 
 
 class IReportFormatter(ABC):
@@ -79,9 +116,46 @@ class IReportFormatter(ABC):
     """
     
     @abstractmethod
-    def format(self, data: Dict[str, Any]) -> str:
+    def format(self, data: Dict[str, Any], out: IO) -> None:
         """
-        Format data into report content
+        Format data into report content, writing it to a stream
+        
+        Implementations should write incrementally rather than building
+        the whole report in memory first.
+        
+        Args:
+            data: Report data
+            out: Destination stream (binary if is_binary() is True,
+                text otherwise)
+        """
+        pass
+    
+    def is_binary(self) -> bool:
+        """
+        Check if this format writes bytes rather than text
+        
+        Returns:
+            True if format() expects a binary stream
+        """
+        return False
+    
+    def supports_streaming(self) -> bool:
+        """
+        Check if format() can consume 'files' as a one-shot iterator
+        
+        Formats that need the complete file list (e.g. for totals or
+        multi-sheet layouts) return False.
+        
+        Returns:
+            True if files are written as they are read
+        """
+        return False
+    
+    def format_to_str(self, data: Dict[str, Any]) -> str:
+        """
+        Format data into an in-memory string (backward compatibility)
+        
+        Binary formats are returned base64-encoded.
         
         Args:
             data: Report data
@@ -89,7 +163,14 @@ class IReportFormatter(ABC):
         Returns:
             Formatted report content
         """
-        pass
+        if self.is_binary():
+            buffer = io.BytesIO()
+            self.format(data, buffer)
+            return base64.b64encode(buffer.getvalue()).decode('ascii')
+        
+        buffer = io.StringIO()
+        self.format(data, buffer)
+        return buffer.getvalue()
     
     @abstractmethod
     def get_extension(self) -> str:
@@ -141,6 +222,64 @@ class IReportService(ABC):
         """
         pass
     
+    @abstractmethod
+    def generate_report_streaming(
+        self,
+        files: Iterable[DriveFile],
+        output_path: str,
+        report_format: ReportFormat,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """
+        Generate a report from an iterable of files
+        
+        Files are consumed as they arrive, so report writing can overlap
+        with Drive pagination when the format supports streaming.
+        
+        Args:
+            files: Iterable of files to include in report
+            output_path: Path to save report
+            report_format: Desired output format
+            metadata: Additional metadata to include
+            
+        Returns:
+            Path to generated report file
+        """
+        pass
+    
+    def generate_multi_format_reports(
+        self,
+        files: List[DriveFile],
+        base_name: str,
+        formats: List[ReportFormat],
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> List[str]:
+        """
+        Generate the same report in several formats
+        
+        The default generates each format in turn with generate_report;
+        implementations may share work across formats. A format that
+        fails is left out of the result.
+        
+        Args:
+            files: List of files to include in reports
+            base_name: Report path; each format adds its own extension
+            formats: Desired output formats
+            metadata: Additional metadata to include
+            
+        Returns:
+            Paths to the generated report files
+        """
+        report_paths = []
+        
+        for fmt in formats:
+            try:
+                report_paths.append(self.generate_report(files, base_name, fmt, metadata))
+            except Exception:
+                continue
+        
+        return report_paths
+    
     @abstractmethod
     def set_formatter(self, formatter: IReportFormatter) -> None:
         """
@@ -152,6 +291,32 @@ class IReportService(ABC):
         pass
 
 
+class IResultSink(ABC):
+    """
+    Result Sink Interface
+    
+    Receives revocation results as they are produced so they can be
+    streamed to storage instead of being held in memory.
+    """
+    
+    @abstractmethod
+    def write(self, result: RevocationResult) -> None:
+        """
+        Write a single revocation result
+        
+        Args:
+            result: Revocation result to persist
+        """
+        pass
+    
+    @abstractmethod
+    def close(self) -> None:
+        """
+        Flush and release any underlying resources
+        """
+        pass
+
+
 class IProgressObserver(ABC):
     """
     Progress Observer Interface (Observer Pattern)
@@ -186,6 +351,27 @@ class IProgressObserver(ABC):
         """
         pass
     
+    def on_files_scanned_batch(
+        self,
+        file_names: Sequence[str],
+        start: int,
+        total: int
+    ) -> None:
+        """
+        Called when a batch of files is scanned
+        
+        The default implementation fans out to on_file_scanned; observers
+        that redraw or write output should override it to update once
+        per batch.
+        
+        Args:
+            file_names: Names of scanned files
+            start: File number of the first file in the batch
+            total: Total files
+        """
+        for offset, file_name in enumerate(file_names):
+            self.on_file_scanned(file_name, start + offset, total)
+    
     @abstractmethod
     def on_scan_completed(self, total_files: int) -> None:
         """
@@ -225,6 +411,25 @@ class IProgressObserver(ABC):
         """
         pass
     
+    def on_permissions_revoked_batch(
+        self,
+        results: Sequence[Tuple[str, bool]],
+        start: int,
+        total: int
+    ) -> None:
+        """
+        Called when a batch of permissions is revoked
+        
+        The default implementation fans out to on_permission_revoked.
+        
+        Args:
+            results: (file_name, success) pairs
+            start: Permission number of the first result in the batch
+            total: Total permissions
+        """
+        for offset, (file_name, success) in enumerate(results):
+            self.on_permission_revoked(file_name, start + offset, total, success)
+    
     @abstractmethod
     def on_revocation_completed(
         self,
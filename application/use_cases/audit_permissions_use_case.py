@@ -3,19 +3,55 @@ Audit Permissions Use Case
 Read-only use case for auditing user permissions without making changes
 """
 
-from typing import List, Optional
-from datetime import datetime
+import time
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from datetime import datetime, timedelta
 
 from domain.entities.drive_file import DriveFile
+from domain.entities.permission import Permission
 from domain.value_objects.email import Email
+from domain.value_objects.permission_role import PermissionRole
 from domain.services.file_analysis_service import FileAnalysisService
-from application.dto.access_management_request import AccessManagementRequest
+from application.dto.access_management_request import AccessManagementRequest, OperationMode
 from application.dto.access_management_result import AccessManagementResult, RevocationResult
+from application.use_cases.drive_listing_cache import (
+    ALL_FILES_CACHE_KEY,
+    CHANGE_TOKEN_CACHE_KEY,
+    EMAIL_INDEX_CACHE_KEY,
+    LISTING_TTL,
+    apply_changes,
+    build_email_index,
+    find_positions_shared_with
+)
 from application.interfaces.repositories import IDriveRepository, ICacheRepository
-from application.interfaces.services import IReportService, IProgressObserver
+from application.interfaces.services import IReportService, IProgressObserver, ReportFormat
 from infrastructure.logging.audit_logger import AuditLogger
 
 
+# Files per progress notification
+_PROGRESS_BATCH_SIZE = 1000
+
+# Longest time (seconds) scanned files wait before progress is reported
+_PROGRESS_INTERVAL = 0.05
+
+# How each role is treated by the audit ('owner' or 'revocable'); deleted
+# permissions of a revocable role are still reported as not revocable
+_ROLE_DISPOSITION = {
+    role: 'owner' if role.is_ownership_role else 'revocable'
+    for role in PermissionRole
+}
+
+# Email -> report file name slug, in one pass
+_EMAIL_SLUG_TABLE = str.maketrans({'@': '_at_', '.': '_'})
+
+# Requested format name -> report format (unknown names fall back to CSV)
+_FORMAT_MAPPING = {
+    'csv': ReportFormat.CSV,
+    'excel': ReportFormat.EXCEL,
+    'json': ReportFormat.JSON
+}
+
+
 class AuditPermissionsUseCase:
     """
     Audit Permissions Use Case
@@ -72,8 +108,6 @@ class AuditPermissionsUseCase:
         Raises:
             ValueError: If request is not in AUDIT_ONLY mode
         """
-        from application.dto.access_management_request import OperationMode
-        
         # Validate request is audit-only
         if request.operation_mode != OperationMode.AUDIT_ONLY:
             raise ValueError(
@@ -82,6 +116,7 @@ class AuditPermissionsUseCase:
             )
         
         started_at = datetime.now()
+        start_counter = time.perf_counter()
         
         # Create result object
         result = AccessManagementResult(
@@ -92,37 +127,32 @@ class AuditPermissionsUseCase:
         )
         
         try:
-            # 1. Get all Drive files
-            all_files = self._get_files(
+            # 1-2. Find files shared with target user
+            target_email = Email(request.target_email)
+            user_permissions, files_scanned = self._get_user_permissions(
+                target_email,
                 request.cache_enabled,
                 request.force_cache_refresh
             )
-            result.total_files_scanned = len(all_files)
-            
-            # 2. Find files shared with target user
-            target_email = Email(request.target_email)
-            shared_files = self._file_analysis_service.find_files_shared_with(
-                all_files,
-                target_email
-            )
+            shared_files = [file for file, _ in user_permissions]
+            result.total_files_scanned = files_scanned
             result.total_files_with_access = len(shared_files)
             
             # 3. Analyze permissions (read-only)
-            self._analyze_permissions(shared_files, target_email, result)
+            self._analyze_permissions(user_permissions, result)
             
             # 4. Generate reports
             if request.report_formats:
                 result.report_paths = self._generate_reports(
                     shared_files,
                     target_email,
-                    request.report_formats
+                    request.report_formats,
+                    started_at
                 )
             
-            # 5. Log completion
-            result.completed_at = datetime.now()
-            result.execution_time_seconds = (
-                result.completed_at - started_at
-            ).total_seconds()
+            # 5. Log completion (timed on the monotonic clock)
+            result.execution_time_seconds = time.perf_counter() - start_counter
+            result.completed_at = started_at + timedelta(seconds=result.execution_time_seconds)
             
             return result
             
@@ -138,107 +168,298 @@ class AuditPermissionsUseCase:
             )
             raise
     
-    def _get_files(
+    def _get_user_permissions(
         self,
+        target_email: Email,
         cache_enabled: bool,
         force_refresh: bool
-    ) -> List[DriveFile]:
+    ) -> Tuple[List[Tuple[DriveFile, Permission]], int]:
         """
-        Get all Drive files (with caching)
+        Get files shared with the target user, paired with the user's permission
+        
+        With caching enabled, a warm full-Drive cache is brought up to date
+        from the Drive change log and filtered locally, while a cold cache
+        or a forced refresh rescans the whole Drive and saves the listing.
+        Without caching, a targeted server-side query fetches only the
+        user's files, and only those count as scanned.
         
         Args:
+            target_email: Target user email
             cache_enabled: Whether to use cache
             force_refresh: Force cache refresh
             
         Returns:
-            List of DriveFile entities
+            Tuple of ((file, permission) pairs, number of files scanned)
         """
-        cache_key = "all_drive_files"
+        if cache_enabled and force_refresh:
+            all_files, user_permissions = self._scan_files(target_email, cache_enabled)
+            return user_permissions, len(all_files)
         
-        # Try cache first
-        if cache_enabled and not force_refresh:
-            cached_files = self._cache_repo.load(cache_key)
-            if cached_files:
+        if cache_enabled:
+            cached = self._cache_repo.mget([
+                ALL_FILES_CACHE_KEY,
+                EMAIL_INDEX_CACHE_KEY,
+                CHANGE_TOKEN_CACHE_KEY
+            ])
+            columns = cached.get(ALL_FILES_CACHE_KEY)
+            if columns:
+                change_token = cached.get(CHANGE_TOKEN_CACHE_KEY)
+                if change_token:
+                    columns, cached[EMAIL_INDEX_CACHE_KEY] = self._apply_drive_changes(
+                        columns,
+                        cached.get(EMAIL_INDEX_CACHE_KEY),
+                        change_token
+                    )
+                
+                files_scanned = len(columns['file_id'])
                 if self._progress_observer:
-                    self._progress_observer.on_scan_started(len(cached_files))
-                    self._progress_observer.on_scan_completed(len(cached_files))
-                return cached_files
+                    self._progress_observer.on_scan_started(files_scanned)
+                    self._progress_observer.on_scan_completed(files_scanned)
+                
+                return self._find_in_listing(
+                    columns,
+                    cached.get(EMAIL_INDEX_CACHE_KEY),
+                    target_email
+                ), files_scanned
+            
+            # Cold cache: scan everything and warm the cache
+            all_files, user_permissions = self._scan_files(target_email, cache_enabled)
+            return user_permissions, len(all_files)
         
-        # Scan Drive
+        # Targeted query: only the user's files cross the wire
         if self._progress_observer:
             self._progress_observer.on_scan_started(0)
         
-        all_files = self._drive_repo.list_all_files()
+        shared_files = self._drive_repo.find_files_shared_with(target_email)
+        
+        if self._progress_observer:
+            self._progress_observer.on_scan_completed(len(shared_files))
+        
+        user_permissions = self._file_analysis_service.find_user_permissions(
+            shared_files,
+            target_email
+        )
+        return user_permissions, len(shared_files)
+    
+    def _scan_files(
+        self,
+        target_email: Email,
+        cache_enabled: bool
+    ) -> Tuple[List[DriveFile], List[Tuple[DriveFile, Permission]]]:
+        """
+        Scan all Drive files and refresh the full-Drive cache
+        
+        Files are matched against the target user as pages arrive, so the
+        scan and the filter share a single traversal.
+        
+        Args:
+            target_email: Target user email
+            cache_enabled: Whether to save the scan to cache
+            
+        Returns:
+            Tuple of (all files, (file, permission) pairs for the user)
+        """
+        if self._progress_observer:
+            self._progress_observer.on_scan_started(0)
+        
+        # Taken before listing so changes made during the scan are replayed
+        change_token = self._drive_repo.get_start_page_token() if cache_enabled else None
+        
+        all_files: List[DriveFile] = []
+        user_permissions = self._file_analysis_service.find_user_permissions(
+            self._iter_scan(all_files),
+            target_email
+        )
         
         if self._progress_observer:
-            for i, file in enumerate(all_files, 1):
-                self._progress_observer.on_file_scanned(
-                    file.name,
-                    i,
-                    len(all_files)
-                )
             self._progress_observer.on_scan_completed(len(all_files))
         
-        # Cache results
+        # Cache results along with the per-user index
         if cache_enabled:
-            self._cache_repo.save(cache_key, all_files)
+            self._cache_repo.mset({
+                ALL_FILES_CACHE_KEY: (DriveFile.to_columns(all_files), LISTING_TTL),
+                EMAIL_INDEX_CACHE_KEY: (
+                    build_email_index(all_files),
+                    LISTING_TTL
+                ),
+                CHANGE_TOKEN_CACHE_KEY: (change_token, LISTING_TTL)
+            })
+        
+        return all_files, user_permissions
+    
+    def _apply_drive_changes(
+        self,
+        columns: Dict[str, List[Any]],
+        index: Optional[Dict[str, List[int]]],
+        change_token: str
+    ) -> Tuple[Dict[str, List[Any]], Optional[Dict[str, List[int]]]]:
+        """
+        Bring a cached full listing up to date from the Drive change log
+        
+        Only files changed since the cached token are fetched, and the
+        listing is only materialized when there is something to merge. If
+        the change log cannot be read, the cached listing is used as is.
+        
+        Args:
+            columns: Cached full-Drive listing (DriveFile.to_columns layout)
+            index: Cached email index for the listing
+            change_token: Cached change-log position
+            
+        Returns:
+            Tuple of (updated listing columns, updated index)
+        """
+        try:
+            changed, removed, new_token = self._drive_repo.list_changes(change_token)
+        except Exception as e:
+            self._audit_logger.log_error(
+                error_type="ChangeLogError",
+                error_message=str(e),
+                context={'operation': 'list_changes'}
+            )
+            return columns, index
+        
+        if not changed and not removed:
+            if new_token != change_token:
+                self._cache_repo.save(CHANGE_TOKEN_CACHE_KEY, new_token, ttl=LISTING_TTL)
+            return columns, index
+        
+        all_files = apply_changes(
+            DriveFile.from_columns(columns),
+            changed,
+            removed
+        )
+        columns = DriveFile.to_columns(all_files)
+        index = build_email_index(all_files)
+        
+        self._cache_repo.mset({
+            ALL_FILES_CACHE_KEY: (columns, LISTING_TTL),
+            EMAIL_INDEX_CACHE_KEY: (index, LISTING_TTL),
+            CHANGE_TOKEN_CACHE_KEY: (new_token, LISTING_TTL)
+        })
+        
+        return columns, index
+    
+    def _find_in_listing(
+        self,
+        columns: Dict[str, List[Any]],
+        index: Optional[Dict[str, List[int]]],
+        target_email: Email
+    ) -> List[Tuple[DriveFile, Permission]]:
+        """
+        Find the user's files and permissions in a cached full listing
+        
+        Only the user's files are materialized, located through the email
+        index or, without one, by scanning the permission email column.
+        
+        Args:
+            columns: Cached full-Drive listing (DriveFile.to_columns layout)
+            index: Cached email index for the listing (None if missing)
+            target_email: Target user email
+            
+        Returns:
+            List of (file, user permission) pairs
+        """
+        if index is not None:
+            positions = index.get(target_email.value, ())
+        else:
+            positions = find_positions_shared_with(
+                columns,
+                target_email
+            )
+        
+        files = DriveFile.from_columns(columns, positions)
+        return self._file_analysis_service.find_user_permissions(files, target_email)
+    
+    def _iter_scan(self, collected: List[DriveFile]) -> Iterator[DriveFile]:
+        """
+        Stream Drive files, collecting them and reporting progress
+        
+        Progress is reported in batches of _PROGRESS_BATCH_SIZE files, or
+        sooner once _PROGRESS_INTERVAL has passed, rather than per file.
+        
+        Args:
+            collected: List that receives every scanned file
+            
+        Returns:
+            Iterator of DriveFile entities
+        """
+        names: List[str] = []
+        deadline = time.monotonic() + _PROGRESS_INTERVAL
+        
+        for file in self._drive_repo.iter_all_files():
+            collected.append(file)
+            
+            if self._progress_observer:
+                names.append(file.name)
+                if len(names) == _PROGRESS_BATCH_SIZE or time.monotonic() >= deadline:
+                    self._progress_observer.on_files_scanned_batch(
+                        names,
+                        len(collected) - len(names) + 1,
+                        0
+                    )
+                    names = []
+                    deadline = time.monotonic() + _PROGRESS_INTERVAL
+            
+            yield file
         
-        return all_files
+        if names:
+            self._progress_observer.on_files_scanned_batch(
+                names,
+                len(collected) - len(names) + 1,
+                0
+            )
     
     def _analyze_permissions(
         self,
-        files: List[DriveFile],
-        target_email: Email,
+        user_permissions: List[Tuple[DriveFile, Permission]],
         result: AccessManagementResult
     ) -> None:
         """
         Analyze permissions for audit report
         
         Args:
-            files: Files to analyze
-            target_email: Target user email
+            user_permissions: (file, target user's permission) pairs
             result: Result object to populate
         """
-        for file in files:
-            # Get user's permission on this file (singular)
-            user_permission = file.get_permission_for_user(target_email)
-            
-            if not user_permission:
-                continue  # User doesn't have permission on this file
+        for file, user_permission in user_permissions:
+            file_id = str(file.file_id)
+            file_name = file.name
+            role = user_permission.role
             
             # Classify permission
-            if user_permission.is_owner_permission():
+            if _ROLE_DISPOSITION[role] == 'owner':
                 # User owns this file - cannot revoke
-                result.skipped_files.append({
-                    'file_id': str(file.file_id),
-                    'file_name': file.name,
+                result.add_skipped({
+                    'file_id': file_id,
+                    'file_name': file_name,
                     'reason': 'User is owner',
-                    'permission_role': user_permission.role.value
+                    'permission_role': role.value
                 })
-            elif user_permission.can_be_revoked():
+            elif not user_permission.deleted:
                 # Permission could be revoked (for informational purposes)
                 revocation = RevocationResult(
-                    file_id=str(file.file_id),
-                    file_name=file.name,
+                    file_id=file_id,
+                    file_name=file_name,
                     permission_id=str(user_permission.permission_id),
                     status='revocable',
                     error=None
                 )
-                result.successful_revocations.append(revocation)
+                result.add_result(revocation)
             else:
                 # Permission exists but cannot be revoked
-                result.skipped_files.append({
-                    'file_id': str(file.file_id),
-                    'file_name': file.name,
+                result.add_skipped({
+                    'file_id': file_id,
+                    'file_name': file_name,
                     'reason': 'Permission not revocable',
-                    'permission_role': user_permission.role.value
+                    'permission_role': role.value
                 })
     
     def _generate_reports(
         self,
         files: List[DriveFile],
         target_email: Email,
-        formats: List[str]
+        formats: List[str],
+        started_at: datetime
     ) -> List[str]:
         """
         Generate audit reports
@@ -247,66 +468,36 @@ class AuditPermissionsUseCase:
             files: Files to include in report
             target_email: Target user email
             formats: Report formats to generate
+            started_at: Audit start time, used to stamp the reports
             
         Returns:
             List of generated report file paths
         """
-        from application.interfaces.services import ReportFormat
-        
-        # Map format strings to enums
-        format_mapping = {
-            'csv': ReportFormat.CSV,
-            'excel': ReportFormat.EXCEL,
-            'json': ReportFormat.JSON
-        }
-        
         report_formats = [
-            format_mapping.get(fmt.lower(), ReportFormat.CSV)
+            _FORMAT_MAPPING.get(fmt.lower(), ReportFormat.CSV)
             for fmt in formats
         ]
         
         # Generate base name
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        safe_email = target_email.value.replace('@', '_at_').replace('.', '_')
+        timestamp = started_at.strftime("%Y%m%d_%H%M%S")
+        safe_email = target_email.value.translate(_EMAIL_SLUG_TABLE)
         base_name = f"audit_report_{safe_email}_{timestamp}"
         
         # Metadata
         metadata = {
             'report_type': 'Permission Audit',
             'target_user': target_email.value,
-            'generated_at': datetime.now().isoformat(),
+            'generated_at': started_at.isoformat(),
             'total_files': len(files),
             'read_only': True
         }
         
-        # Generate reports using interface method
-        from infrastructure.reporting.report_generator import ReportGenerator
-        
-        # Note: Using concrete implementation directly since interface doesn't have this method
-        if isinstance(self._report_service, ReportGenerator):
-            report_paths = self._report_service.generate_multi_format_reports(
-                files=files,
-                base_name=base_name,
-                formats=report_formats,
-                metadata=metadata
-            )
-        else:
-            # Fallback: generate reports one by one
-            report_paths = []
-            for fmt in report_formats:
-                try:
-                    path = self._report_service.generate_report(
-                        files=files,
-                        output_path=f"{base_name}.{fmt.value}",
-                        report_format=fmt,
-                        metadata=metadata
-                    )
-                    report_paths.append(path)
-                except Exception as e:
-                    # Log warning but continue
-                    pass
-        
-        return report_paths
+        return self._report_service.generate_multi_format_reports(
+            files=files,
+            base_name=base_name,
+            formats=report_formats,
+            metadata=metadata
+        )
     
     def audit_user_access(
         self,
@@ -323,19 +514,10 @@ class AuditPermissionsUseCase:
         Returns:
             AccessManagementResult with audit findings
         """
-        from application.dto.access_management_request import (
-            AccessManagementRequestBuilder,
-            OperationMode
-        )
-        
-        # Build request
-        builder = AccessManagementRequestBuilder(user_email)
-        builder.with_operation(OperationMode.AUDIT_ONLY)
-        
         if report_formats:
-            builder.with_formats(report_formats)
-        
-        request = builder.build()
+            request = AccessManagementRequest.for_audit(user_email, report_formats)
+        else:
+            request = AccessManagementRequest.for_audit(user_email)
         
         # Execute audit
         return self.execute(request)
@@ -0,0 +1,126 @@
+"""
+Drive Listing Cache
+Cache keys, lifetime and index helpers shared by the use cases that cache
+the full Drive listing
+"""
+
+from bisect import bisect_right
+from datetime import timedelta
+from typing import Any, Dict, List
+
+from domain.entities.drive_file import DriveFile
+from domain.value_objects.email import Email
+
+
+# Cache key for the full-Drive file listing (DriveFile.to_columns layout;
+# the suffix changes with the layout so older listings are not misread)
+ALL_FILES_CACHE_KEY = "all_drive_files_v2"
+
+# Cache key for the email -> file positions index of the full listing
+EMAIL_INDEX_CACHE_KEY = "drive_files_by_email"
+
+# Cache key for the Drive change-log position of the full listing
+CHANGE_TOKEN_CACHE_KEY = "drive_start_page_token"
+
+# Lifetime of the cached full listing, its index and its change token
+LISTING_TTL = timedelta(days=7)
+
+
+def build_email_index(files: List[DriveFile]) -> Dict[str, List[int]]:
+    """
+    Build an inverted index from user email to file positions
+    
+    Built once per scan, it turns each per-user lookup into a dict hit
+    instead of a pass over every file's permissions.
+    
+    Args:
+        files: List of files to index
+        
+    Returns:
+        Mapping of email address to indexes into files
+    """
+    index: Dict[str, List[int]] = {}
+    
+    for position, file in enumerate(files):
+        for permission in file.permissions:
+            if permission.email is None:
+                continue
+            
+            positions = index.setdefault(permission.email.value, [])
+            # A user can hold several permissions on one file
+            if not positions or positions[-1] != position:
+                positions.append(position)
+    
+    return index
+
+
+def find_positions_shared_with(columns: Dict[str, List[Any]], user_email: Email) -> List[int]:
+    """
+    Find rows of a columnar listing that are shared with a user
+    
+    Looks up the user's code in the string dictionary, then scans the
+    flattened permission email codes with list.index, which compares
+    in C, and maps each hit back to its file through the permission
+    offsets. Only the returned rows need materializing.
+    
+    Args:
+        columns: Listing in DriveFile.to_columns layout
+        user_email: User email to find
+        
+    Returns:
+        Sorted, de-duplicated row indexes of matching files
+    """
+    emails = columns['perm_email']
+    offsets = columns['perm_offsets']
+    try:
+        target = columns['strings'].index(user_email.value)
+    except ValueError:
+        return []
+    
+    positions: List[int] = []
+    row = -1
+    while True:
+        try:
+            row = emails.index(target, row + 1)
+        except ValueError:
+            return positions
+        
+        position = bisect_right(offsets, row) - 1
+        # A user can hold several permissions on one file
+        if not positions or positions[-1] != position:
+            positions.append(position)
+
+
+def apply_changes(
+    files: List[DriveFile],
+    changed: List[DriveFile],
+    removed_ids: List[str]
+) -> List[DriveFile]:
+    """
+    Merge a change-log delta into a file listing
+    
+    Args:
+        files: Current file listing
+        changed: Added or updated files
+        removed_ids: IDs of files that no longer exist or are inaccessible
+        
+    Returns:
+        New listing with updates in place, additions appended and
+        removals dropped
+    """
+    removed = set(removed_ids)
+    updates = {
+        str(file.file_id): file
+        for file in changed
+        if str(file.file_id) not in removed
+    }
+    
+    merged = []
+    for file in files:
+        file_id = str(file.file_id)
+        if file_id in removed:
+            continue
+        merged.append(updates.pop(file_id, file))
+    
+    merged.extend(updates.values())
+    return merged
@@ -3,19 +3,62 @@ Manage User Access Use Case
 Main orchestration logic for access management workflows
 """
 
-from datetime import datetime
-from typing import List, Optional
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Callable, List, Optional, Tuple
 
 from application.interfaces.repositories import IDriveRepository, IPermissionRepository, ICacheRepository
-from application.interfaces.services import IReportService, IProgressObserver, ReportFormat
+from application.interfaces.services import (
+    IReportService, IProgressObserver, IResultSink, ReportFormat
+)
 from application.dto.access_management_request import AccessManagementRequest, OperationMode
 from application.dto.access_management_result import AccessManagementResult, RevocationResult
+from application.use_cases.drive_listing_cache import (
+    ALL_FILES_CACHE_KEY,
+    CHANGE_TOKEN_CACHE_KEY,
+    EMAIL_INDEX_CACHE_KEY,
+    LISTING_TTL,
+    apply_changes,
+    build_email_index,
+    find_positions_shared_with
+)
+from domain.entities.drive_file import DriveFile
+from domain.exceptions.access_manager_errors import CacheError
 from domain.value_objects.email import Email
 from domain.services.permission_service import PermissionService
-from domain.services.file_analysis_service import FileAnalysisService
+from domain.services.file_analysis_service import FileAnalysisService, FileClassification
 from infrastructure.logging.audit_logger import AuditLogger
 
 
+# Permissions per revocation batch (Drive batch endpoint limit)
+_REVOCATION_CHUNK_SIZE = 100
+
+# Below this many permissions, concurrent single calls finish sooner than a
+# batch, which waits for its slowest sub-request
+_BATCH_THRESHOLD = 50
+
+# Concurrent revocations when not batching (Drive allows ~10 per user)
+_MAX_IN_FLIGHT = 8
+
+# Cache key prefix for in-progress revocation checkpoints (+ target email)
+_CHECKPOINT_CACHE_KEY_PREFIX = "revoke_progress_"
+
+# Completed revocations between checkpoint writes
+_CHECKPOINT_INTERVAL = 200
+
+# Lifetime of an abandoned revocation checkpoint
+_CHECKPOINT_TTL = timedelta(days=1)
+
+# Requested format name -> report format (unknown names are skipped)
+_FORMAT_MAPPING = {
+    'csv': ReportFormat.CSV,
+    'excel': ReportFormat.EXCEL,
+    'xlsx': ReportFormat.EXCEL,
+    'json': ReportFormat.JSON
+}
+
+
 class ManageUserAccessUseCase:
     """
     Manage User Access Use Case
@@ -31,7 +74,8 @@ class ManageUserAccessUseCase:
         report_service: IReportService,
         cache_repository: Optional[ICacheRepository] = None,
         audit_logger: Optional[AuditLogger] = None,
-        progress_observer: Optional[IProgressObserver] = None
+        progress_observer: Optional[IProgressObserver] = None,
+        result_sink_factory: Optional[Callable[[str], IResultSink]] = None
     ):
         """
         Initialize use case with dependencies
@@ -43,6 +87,8 @@ class ManageUserAccessUseCase:
             cache_repository: Optional cache repository
             audit_logger: Optional audit logger
             progress_observer: Optional progress observer
+            result_sink_factory: Optional factory opening a result sink on
+                a path, used for requests with a results_path
         """
         self._drive_repo = drive_repository
         self._permission_repo = permission_repository
@@ -50,25 +96,41 @@ class ManageUserAccessUseCase:
         self._cache_repo = cache_repository
         self._audit_logger = audit_logger
         self._progress_observer = progress_observer
+        self._result_sink_factory = result_sink_factory
         
         # Domain services
         self._permission_service = PermissionService()
         self._file_analysis_service = FileAnalysisService()
     
+    def set_progress_observer(self, observer: IProgressObserver) -> None:
+        """Set progress observer"""
+        self._progress_observer = observer
+    
     def execute(self, request: AccessManagementRequest) -> AccessManagementResult:
         """
         Execute access management workflow
         
+        When the request has a results_path, revocation results are
+        streamed to a sink opened on it (and closed when the run ends)
+        instead of being kept in the result lists.
+        
         Args:
             request: Access management request
             
         Returns:
             Access management result
+            
+        Raises:
+            ValueError: If the request is invalid, or has a results_path
+                but no result sink factory was configured
         """
         start_time = datetime.now()
+        start_counter = time.perf_counter()
         
         # Validate request
         request.validate()
+        if request.results_path and self._result_sink_factory is None:
+            raise ValueError("Streaming results requires a result sink factory")
         
         # Convert email to value object
         target_email = Email(request.target_email)
@@ -90,25 +152,31 @@ class ManageUserAccessUseCase:
             started_at=start_time
         )
         
+        if request.results_path:
+            result.sink = self._result_sink_factory(request.results_path)
+        
         try:
             # Step 1: Scan Drive files
             if self._progress_observer:
                 self._progress_observer.on_scan_started(0)
             
-            all_files = self._get_files(request.cache_enabled, request.force_cache_refresh)
-            result.total_files_scanned = len(all_files)
+            # Step 2: Find and classify files shared with target user
+            classifications, files_scanned = self._get_shared_files(
+                target_email,
+                request.cache_enabled,
+                request.force_cache_refresh
+            )
+            shared_files = [classification.file for classification in classifications]
+            result.total_files_scanned = files_scanned
+            result.total_files_with_access = len(shared_files)
             
             if self._progress_observer:
-                self._progress_observer.on_scan_completed(len(all_files))
-            
-            # Step 2: Find files shared with target user
-            shared_files = self._file_analysis_service.find_files_shared_with(all_files, target_email)
-            result.total_files_with_access = len(shared_files)
+                self._progress_observer.on_scan_completed(files_scanned)
             
             # Step 3: Execute operation based on mode
             if request.operation_mode == OperationMode.REVOKE_ALL:
                 self._execute_revocation(
-                    shared_files,
+                    classifications,
                     target_email,
                     request.dry_run,
                     request.use_admin_access,
@@ -127,10 +195,9 @@ class ManageUserAccessUseCase:
                     result
                 )
             
-            # Calculate execution time
-            end_time = datetime.now()
-            result.completed_at = end_time
-            result.execution_time_seconds = (end_time - start_time).total_seconds()
+            # Calculate execution time on the monotonic clock
+            result.execution_time_seconds = time.perf_counter() - start_counter
+            result.completed_at = start_time + timedelta(seconds=result.execution_time_seconds)
             
             # Log completion
             if self._audit_logger:
@@ -154,138 +221,386 @@ class ManageUserAccessUseCase:
                     context={'target_email': str(target_email)}
                 )
             raise
+        
+        finally:
+            if result.sink is not None:
+                result.sink.close()
     
-    def _get_files(self, use_cache: bool, force_refresh: bool):
-        """Get all Drive files, using cache if available"""
-        cache_key = "all_drive_files"
-        
-        # Try cache first
-        if use_cache and self._cache_repo and not force_refresh:
-            cached_files = self._cache_repo.load(cache_key)
-            if cached_files:
+    def _get_shared_files(
+        self,
+        target_email: Email,
+        use_cache: bool,
+        force_refresh: bool
+    ) -> Tuple[List[FileClassification], int]:
+        """
+        Get files shared with the target user, classified for revocation
+        
+        With caching enabled, a warm full-Drive cache is brought up to date
+        from the Drive change log and filtered locally, while a cold cache
+        or a forced refresh rescans the whole Drive and saves the listing.
+        Without caching, a targeted server-side query fetches only the
+        user's files, and only those count as scanned.
+        
+        Returns:
+            Tuple of (shared file classifications, number of files scanned)
+        """
+        if use_cache and self._cache_repo:
+            if force_refresh:
+                all_files, classifications = self._scan_files(target_email, use_cache)
+                return classifications, len(all_files)
+            
+            cached = self._cache_repo.mget([
+                ALL_FILES_CACHE_KEY,
+                EMAIL_INDEX_CACHE_KEY,
+                CHANGE_TOKEN_CACHE_KEY
+            ])
+            columns = cached.get(ALL_FILES_CACHE_KEY)
+            if columns:
+                change_token = cached.get(CHANGE_TOKEN_CACHE_KEY)
+                if change_token:
+                    columns, cached[EMAIL_INDEX_CACHE_KEY] = self._apply_drive_changes(
+                        columns,
+                        cached.get(EMAIL_INDEX_CACHE_KEY),
+                        change_token
+                    )
+                
                 if self._audit_logger:
                     self._audit_logger.log_cache_operation(
                         operation="load",
-                        cache_key=cache_key,
+                        cache_key=ALL_FILES_CACHE_KEY,
                         success=True,
                         hit=True
                     )
-                return cached_files
+                
+                # Only the user's files are materialized
+                index = cached.get(EMAIL_INDEX_CACHE_KEY)
+                if index is None:
+                    positions = find_positions_shared_with(
+                        columns,
+                        target_email
+                    )
+                else:
+                    positions = index.get(target_email.value, ())
+                classifications = list(self._file_analysis_service.classify_for_user(
+                    DriveFile.from_columns(columns, positions),
+                    target_email
+                ))
+                return classifications, len(columns['file_id'])
+            
+            # Cold cache: scan everything and warm the cache
+            all_files, classifications = self._scan_files(target_email, use_cache)
+            return classifications, len(all_files)
+        
+        # Targeted query: only the user's files cross the wire
+        shared_files = self._drive_repo.find_files_shared_with(target_email)
+        classifications = list(
+            self._file_analysis_service.classify_for_user(shared_files, target_email)
+        )
+        return classifications, len(shared_files)
+    
+    def _scan_files(self, target_email: Email, use_cache: bool):
+        """
+        Scan all Drive files and refresh the full-Drive cache
+        
+        Files are classified for the target user as pages arrive, so the
+        scan and the classification share a single traversal.
+        
+        Returns:
+            Tuple of (all files, classifications of files shared with the user)
+        """
+        # Taken before listing so changes made during the scan are replayed
+        change_token = self._drive_repo.get_start_page_token() if use_cache and self._cache_repo else None
+        
+        files: List[DriveFile] = []
         
-        # Fetch from repository
-        files = self._drive_repo.list_all_files()
+        def collect():
+            for file in self._drive_repo.iter_all_files():
+                files.append(file)
+                yield file
+        
+        classifications = list(
+            self._file_analysis_service.classify_for_user(collect(), target_email)
+        )
         
         # Save to cache
         if use_cache and self._cache_repo:
-            from datetime import timedelta
-            self._cache_repo.save(cache_key, files, ttl=timedelta(days=7))
+            self._cache_repo.mset({
+                ALL_FILES_CACHE_KEY: (DriveFile.to_columns(files), LISTING_TTL),
+                EMAIL_INDEX_CACHE_KEY: (build_email_index(files), LISTING_TTL),
+                CHANGE_TOKEN_CACHE_KEY: (change_token, LISTING_TTL)
+            })
             if self._audit_logger:
                 self._audit_logger.log_cache_operation(
                     operation="save",
-                    cache_key=cache_key,
+                    cache_key=ALL_FILES_CACHE_KEY,
                     success=True
                 )
         
-        return files
+        return files, classifications
+    
+    def _apply_drive_changes(self, columns, index, change_token: str):
+        """
+        Bring a cached full listing up to date from the Drive change log
+        
+        Only files changed since the cached token are fetched, and the
+        listing is only materialized when there is something to merge. If
+        the change log cannot be read, the cached listing is used as is.
+        
+        Returns:
+            Tuple of (updated listing columns, updated email index)
+        """
+        try:
+            changed, removed, new_token = self._drive_repo.list_changes(change_token)
+        except Exception as error:
+            if self._audit_logger:
+                self._audit_logger.log_error(
+                    error_type=type(error).__name__,
+                    error_message=str(error),
+                    context={'operation': 'list_changes'}
+                )
+            return columns, index
+        
+        if not changed and not removed:
+            if new_token != change_token:
+                self._cache_repo.save(CHANGE_TOKEN_CACHE_KEY, new_token, ttl=LISTING_TTL)
+            return columns, index
+        
+        all_files = apply_changes(
+            DriveFile.from_columns(columns),
+            changed,
+            removed
+        )
+        columns = DriveFile.to_columns(all_files)
+        index = build_email_index(all_files)
+        
+        self._cache_repo.mset({
+            ALL_FILES_CACHE_KEY: (columns, LISTING_TTL),
+            EMAIL_INDEX_CACHE_KEY: (index, LISTING_TTL),
+            CHANGE_TOKEN_CACHE_KEY: (new_token, LISTING_TTL)
+        })
+        
+        if self._audit_logger:
+            self._audit_logger.log_cache_operation(
+                operation="save",
+                cache_key=ALL_FILES_CACHE_KEY,
+                success=True
+            )
+        
+        return columns, index
     
     def _execute_revocation(
         self,
-        shared_files,
+        classifications: List[FileClassification],
         target_email: Email,
         dry_run: bool,
         use_admin_access: bool,
         result: AccessManagementResult
     ):
-        """Execute permission revocation"""
-        if self._progress_observer:
-            self._progress_observer.on_revocation_started(len(shared_files))
+        """
+        Execute permission revocation
+        
+        Revocable permissions come straight from the classification pass
+        and are collected first, then revoked in chunks
+        through the repository batch API (one HTTP round-trip per chunk).
+        Small runs, and repositories without batch support, use bounded
+        concurrent calls instead.
         
-        for idx, file in enumerate(shared_files, 1):
+        Real runs checkpoint completed revocations to the cache every
+        _CHECKPOINT_INTERVAL results. A rerun for the same user after an
+        interrupted run restores those results and skips their
+        permissions; the checkpoint is removed once a run completes.
+        """
+        pending = []
+        for classification in classifications:
+            file = classification.file
+            
             # Skip if user is owner
-            if file.is_owned_by(target_email):
-                result.skipped_files.append({
+            if classification.skip_reason:
+                result.add_skipped({
                     'file_id': str(file.file_id),
                     'file_name': file.name,
-                    'reason': 'User is owner - cannot revoke ownership'
+                    'reason': classification.skip_reason
                 })
                 continue
             
-            # Get revocable permissions
-            revocable_perms = file.get_revocable_permissions_for_user(target_email)
+            pending.extend((file, perm) for perm in classification.revocable_permissions)
+        
+        user_email = str(target_email)
+        checkpoint_key = None
+        completed = []
+        if self._cache_repo and not dry_run:
+            checkpoint_key = _CHECKPOINT_CACHE_KEY_PREFIX + user_email
+            completed = self._restore_checkpoint(checkpoint_key, result)
+            if completed:
+                done = {(file_id, permission_id) for file_id, _, permission_id, _ in completed}
+                pending = [
+                    (file, perm) for file, perm in pending
+                    if (str(file.file_id), str(perm.permission_id)) not in done
+                ]
+        
+        total = len(pending)
+        use_batch = total >= _BATCH_THRESHOLD
+        unsaved = 0
+        
+        if self._progress_observer:
+            self._progress_observer.on_revocation_started(total)
+        
+        for start in range(0, total, _REVOCATION_CHUNK_SIZE):
+            chunk = pending[start:start + _REVOCATION_CHUNK_SIZE]
             
-            for perm in revocable_perms:
-                if dry_run:
-                    # Simulate revocation
-                    revocation_result = RevocationResult(
+            if dry_run:
+                # Simulate revocation
+                revocations = [
+                    RevocationResult(
                         file_id=str(file.file_id),
                         file_name=file.name,
                         permission_id=str(perm.permission_id),
                         status='would_revoke'
                     )
-                    result.successful_revocations.append(revocation_result)
-                else:
-                    # Actually revoke
-                    try:
-                        success = self._permission_repo.revoke_permission(
-                            file.file_id,
-                            perm.permission_id,
-                            use_admin_access
-                        )
-                        
-                        if success:
-                            revocation_result = RevocationResult(
-                                file_id=str(file.file_id),
-                                file_name=file.name,
-                                permission_id=str(perm.permission_id),
-                                status='success'
-                            )
-                            result.successful_revocations.append(revocation_result)
-                            
-                            if self._audit_logger:
-                                self._audit_logger.log_permission_revocation(
-                                    file_id=str(file.file_id),
-                                    file_name=file.name,
-                                    permission_id=str(perm.permission_id),
-                                    user_email=str(target_email),
-                                    performed_by="system",
-                                    success=True
-                                )
-                    except Exception as error:
-                        revocation_result = RevocationResult(
-                            file_id=str(file.file_id),
-                            file_name=file.name,
-                            permission_id=str(perm.permission_id),
-                            status='failed',
-                            error=str(error)
-                        )
-                        result.failed_revocations.append(revocation_result)
-                        
-                        if self._audit_logger:
-                            self._audit_logger.log_permission_revocation(
-                                file_id=str(file.file_id),
-                                file_name=file.name,
-                                permission_id=str(perm.permission_id),
-                                user_email=str(target_email),
-                                performed_by="system",
-                                success=False,
-                                error=str(error)
-                            )
+                    for file, perm in chunk
+                ]
+            else:
+                revocations = self._revoke_chunk(chunk, use_admin_access, use_batch)
+            
+            progress = []
+            for (file, perm), revocation in zip(chunk, revocations):
+                file_name = file.name
+                revocation.file_name = file_name
+                result.add_result(revocation)
+                succeeded = revocation.status in ('success', 'would_revoke')
+                progress.append((file_name, succeeded))
+                
+                if self._audit_logger and not dry_run:
+                    self._audit_logger.log_permission_revocation(
+                        file_id=revocation.file_id,
+                        file_name=file_name,
+                        permission_id=revocation.permission_id,
+                        user_email=user_email,
+                        performed_by="system",
+                        success=succeeded,
+                        error=revocation.error
+                    )
+                
+                # Failed revocations are retried on resume
+                if checkpoint_key and revocation.status in ('success', 'skipped'):
+                    completed.append([
+                        revocation.file_id,
+                        file_name,
+                        revocation.permission_id,
+                        revocation.status
+                    ])
+                    unsaved += 1
+            
+            if checkpoint_key and unsaved >= _CHECKPOINT_INTERVAL:
+                self._save_checkpoint(checkpoint_key, completed)
+                unsaved = 0
             
             if self._progress_observer:
-                self._progress_observer.on_permission_revoked(
-                    file.name,
-                    idx,
-                    len(shared_files),
-                    len(revocable_perms) > 0
-                )
+                self._progress_observer.on_permissions_revoked_batch(progress, start + 1, total)
+        
+        if checkpoint_key:
+            self._cache_repo.invalidate(checkpoint_key)
         
         if self._progress_observer:
             self._progress_observer.on_revocation_completed(
-                len(shared_files),
+                total,
                 result.success_count,
                 result.failure_count
             )
     
+    def _save_checkpoint(self, checkpoint_key: str, completed: list) -> None:
+        """
+        Save revocation progress, logging rather than raising on failure
+        
+        A checkpoint only shortens a rerun, so failing to write one must
+        never interrupt the revocations themselves.
+        """
+        try:
+            # Snapshot the list; the cache may serialize it in the background
+            self._cache_repo.save(checkpoint_key, {'completed': completed[:]}, ttl=_CHECKPOINT_TTL)
+        except CacheError as error:
+            if self._audit_logger:
+                self._audit_logger.log_error(
+                    error_type=type(error).__name__,
+                    error_message=str(error),
+                    context={'operation': 'save_checkpoint'}
+                )
+    
+    def _restore_checkpoint(self, checkpoint_key: str, result: AccessManagementResult) -> list:
+        """
+        Re-record revocations completed by an interrupted earlier run
+        
+        Returns:
+            Completed [file_id, file_name, permission_id, status] entries
+            (empty if there is no checkpoint)
+        """
+        checkpoint = self._cache_repo.load(checkpoint_key)
+        if not checkpoint:
+            return []
+        
+        completed = checkpoint['completed']
+        for file_id, file_name, permission_id, status in completed:
+            result.add_result(RevocationResult(
+                file_id=file_id,
+                file_name=file_name,
+                permission_id=permission_id,
+                status=status
+            ))
+        
+        return completed
+    
+    def _revoke_chunk(
+        self,
+        chunk,
+        use_admin_access: bool,
+        use_batch: bool = True
+    ) -> List[RevocationResult]:
+        """
+        Revoke a chunk of (file, permission) pairs
+        
+        Uses one batch request when use_batch is set and the repository
+        supports it, otherwise bounded concurrent single calls. Results
+        are consumed on this thread, so no locking is needed. A failure
+        of the whole chunk (e.g. rate limiting) marks every item in it as
+        failed.
+        
+        Returns:
+            RevocationResult list aligned with the chunk
+        """
+        items = [(file.file_id, perm.permission_id) for file, perm in chunk]
+        # String IDs, converted once for realignment and failure results
+        keys = [(str(file_id), str(permission_id)) for file_id, permission_id in items]
+        
+        try:
+            if use_batch:
+                try:
+                    return self._permission_repo.revoke_permissions_batch(items, use_admin_access)
+                except NotImplementedError:
+                    pass
+            
+            # Concurrent results arrive in completion order; realign them
+            by_key = {
+                (revocation.file_id, revocation.permission_id): revocation
+                for revocation in self._permission_repo.revoke_permissions_concurrent(
+                    items,
+                    _MAX_IN_FLIGHT,
+                    use_admin_access
+                )
+            }
+            return [by_key[key] for key in keys]
+        
+        except Exception as error:
+            return [
+                RevocationResult(
+                    file_id=file_id,
+                    file_name='',
+                    permission_id=permission_id,
+                    status='failed',
+                    error=str(error)
+                )
+                for file_id, permission_id in keys
+            ]
+    
     def _generate_reports(
         self,
         files,
@@ -296,55 +611,60 @@ class ManageUserAccessUseCase:
         """Generate reports in requested formats"""
         report_paths = []
         
-        # Base filename with timestamp
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # Base filename with the run's start timestamp
+        timestamp = result.started_at.strftime("%Y%m%d_%H%M%S")
         base_name = f"access_report_{target_email.local_part}_{timestamp}"
         
         # Metadata for report
         metadata = {
             'target_email': str(target_email),
-            'generated_at': datetime.now().isoformat(),
+            'generated_at': result.started_at.isoformat(),
             'total_files': len(files),
             'dry_run': result.dry_run
         }
         
         # Convert format strings to enum
-        format_enums = []
-        for fmt_str in formats:
-            try:
-                if fmt_str.lower() == 'csv':
-                    format_enums.append(ReportFormat.CSV)
-                elif fmt_str.lower() in ['excel', 'xlsx']:
-                    format_enums.append(ReportFormat.EXCEL)
-                elif fmt_str.lower() == 'json':
-                    format_enums.append(ReportFormat.JSON)
-            except:
-                continue
+        format_enums = [
+            _FORMAT_MAPPING[fmt_str.lower()]
+            for fmt_str in formats
+            if fmt_str.lower() in _FORMAT_MAPPING
+        ]
         
-        # Generate reports
-        for fmt in format_enums:
-            try:
-                path = self._report_service.generate_report(
+        if not format_enums:
+            return report_paths
+        
+        # Formats are written concurrently; outcomes are collected (and
+        # logged) on this thread in request order
+        with ThreadPoolExecutor(max_workers=len(format_enums)) as executor:
+            futures = [
+                (fmt, executor.submit(
+                    self._report_service.generate_report,
                     files,
                     base_name,
                     fmt,
                     metadata
-                )
-                report_paths.append(path)
-                
-                if self._audit_logger:
-                    self._audit_logger.log_report_generation(
-                        report_format=fmt.value,
-                        file_path=path,
-                        files_included=len(files),
-                        success=True
-                    )
-            except Exception as error:
-                if self._audit_logger:
-                    self._audit_logger.log_error(
-                        error_type="ReportGenerationError",
-                        error_message=str(error),
-                        context={'format': fmt.value}
-                    )
+                ))
+                for fmt in format_enums
+            ]
+            
+            for fmt, future in futures:
+                try:
+                    path = future.result()
+                    report_paths.append(path)
+                    
+                    if self._audit_logger:
+                        self._audit_logger.log_report_generation(
+                            report_format=fmt.value,
+                            file_path=path,
+                            files_included=len(files),
+                            success=True
+                        )
+                except Exception as error:
+                    if self._audit_logger:
+                        self._audit_logger.log_error(
+                            error_type="ReportGenerationError",
+                            error_message=str(error),
+                            context={'format': fmt.value}
+                        )
         
         return report_paths
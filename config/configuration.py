@@ -5,26 +5,100 @@ Centralized configuration with validation
 
 import os
 import yaml
-from typing import Optional, List, Dict, Any
+from typing import Optional, Dict, Any, Set, Tuple
 from pathlib import Path
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 
 from domain.exceptions.access_manager_errors import ConfigurationError
 
+# Prefer the libyaml C bindings when PyYAML was built with them
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
 
-@dataclass
+
+# Shared immutable defaults for sequence-valued settings
+_DEFAULT_SCOPES = (
+    'https://www.googleapis.com/auth/drive',
+    'https://www.googleapis.com/auth/drive.metadata.readonly',
+    'https://www.googleapis.com/auth/spreadsheets'
+)
+_DEFAULT_REPORT_FORMATS = ("csv", "excel")
+
+# Directories already created by AppConfiguration.ensure_directories
+_ENSURED_DIRS: Set[str] = set()
+
+# Default configuration files, written verbatim on first run (keep in step
+# with the dataclass defaults below)
+_DEFAULT_YAML_TEMPLATE = """\
+app_name: Google Drive Access Manager
+version: 2.0.0
+debug_mode: false
+google_api:
+  credentials_path: credentials.json
+  token_path: token.json
+  page_size: 1000
+  rate_limit_delay: 0.1
+  max_retries: 3
+cache:
+  enabled: true
+  cache_dir: cache
+  default_ttl_days: 7
+  max_size_mb: 100
+reporting:
+  output_dir: reports
+  default_formats:
+  - csv
+  - excel
+  include_metadata: true
+logging:
+  enabled: true
+  log_dir: logs
+  log_level: INFO
+  audit_enabled: true
+"""
+
+_DEFAULT_TOML_TEMPLATE = """\
+app_name = "Google Drive Access Manager"
+version = "2.0.0"
+debug_mode = false
+
+[google_api]
+credentials_path = "credentials.json"
+token_path = "token.json"
+page_size = 1000
+rate_limit_delay = 0.1
+max_retries = 3
+
+[cache]
+enabled = true
+cache_dir = "cache"
+default_ttl_days = 7
+max_size_mb = 100
+
+[reporting]
+output_dir = "reports"
+default_formats = ["csv", "excel"]
+include_metadata = true
+
+[logging]
+enabled = true
+log_dir = "logs"
+log_level = "INFO"
+audit_enabled = true
+"""
+
+
+@dataclass(slots=True, frozen=True)
 class GoogleAPIConfig:
     """Google API configuration"""
     credentials_path: str = "credentials.json"
     token_path: str = "token.json"
     service_account_path: Optional[str] = None
     admin_email: Optional[str] = None
-    scopes: List[str] = field(default_factory=lambda: [
-        'https://www.googleapis.com/auth/drive',
-        'https://www.googleapis.com/auth/drive.metadata.readonly',
-        'https://www.googleapis.com/auth/spreadsheets'
-    ])
-    page_size: int = 100
+    scopes: Tuple[str, ...] = _DEFAULT_SCOPES
+    page_size: int = 1000
     rate_limit_delay: float = 0.1
     max_retries: int = 3
     timeout_seconds: int = 30
@@ -50,7 +124,7 @@ class GoogleAPIConfig:
             )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CacheConfig:
     """Cache configuration"""
     enabled: bool = True
@@ -74,11 +148,13 @@ class CacheConfig:
             )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ReportingConfig:
     """Reporting configuration"""
+    _VALID_FORMATS = frozenset({"csv", "excel", "json", "html"})
+    
     output_dir: str = "reports"
-    default_formats: List[str] = field(default_factory=lambda: ["csv", "excel"])
+    default_formats: Tuple[str, ...] = _DEFAULT_REPORT_FORMATS
     include_metadata: bool = True
     timestamp_format: str = "%Y%m%d_%H%M%S"
     excel_engine: str = "openpyxl"
@@ -87,13 +163,12 @@ class ReportingConfig:
     
     def validate(self) -> None:
         """Validate reporting configuration"""
-        valid_formats = {"csv", "excel", "json", "html"}
-        for fmt in self.default_formats:
-            if fmt.lower() not in valid_formats:
-                raise ConfigurationError(
-                    f"Invalid report format: {fmt}",
-                    config_key="reporting.default_formats"
-                )
+        invalid = [fmt for fmt in self.default_formats if fmt.lower() not in self._VALID_FORMATS]
+        if invalid:
+            raise ConfigurationError(
+                f"Invalid report format: {', '.join(invalid)}",
+                config_key="reporting.default_formats"
+            )
         
         if self.json_indent < 0:
             raise ConfigurationError(
@@ -102,9 +177,11 @@ class ReportingConfig:
             )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LoggingConfig:
     """Logging configuration"""
+    _VALID_LEVELS = frozenset({"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"})
+    
     enabled: bool = True
     log_dir: str = "logs"
     log_level: str = "INFO"
@@ -116,21 +193,23 @@ class LoggingConfig:
     
     def validate(self) -> None:
         """Validate logging configuration"""
-        valid_levels = {"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"}
-        if self.log_level.upper() not in valid_levels:
+        if self.log_level.upper() not in self._VALID_LEVELS:
             raise ConfigurationError(
                 f"Invalid log_level: {self.log_level}",
                 config_key="logging.log_level"
             )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AppConfiguration:
     """
     Application configuration
     
     Central configuration object for the entire application.
     Supports loading from multiple sources with priority.
+    
+    Configuration objects are immutable; derive modified copies with
+    dataclasses.replace().
     """
     google_api: GoogleAPIConfig = field(default_factory=GoogleAPIConfig)
     cache: CacheConfig = field(default_factory=CacheConfig)
@@ -155,15 +234,53 @@ class AppConfiguration:
         self.logging.validate()
     
     def ensure_directories(self) -> None:
-        """Create necessary directories if they don't exist"""
-        directories = [
+        """
+        Create necessary directories if they don't exist
+        
+        Each distinct directory is created at most once per process.
+        """
+        directories = {
             self.cache.cache_dir,
             self.reporting.output_dir,
             self.logging.log_dir
-        ]
+        }
         
-        for directory in directories:
-            Path(directory).mkdir(parents=True, exist_ok=True)
+        for directory in directories - _ENSURED_DIRS:
+            os.makedirs(directory, exist_ok=True)
+            _ENSURED_DIRS.add(directory)
+
+
+# Config section name -> section dataclass; settings under 'app' are top-level
+# fields of AppConfiguration
+_SECTION_TYPES = {
+    'google_api': GoogleAPIConfig,
+    'cache': CacheConfig,
+    'reporting': ReportingConfig,
+    'logging': LoggingConfig,
+}
+
+# Settings explicitly supplied by one source, keyed by section then field
+_Settings = Dict[str, Dict[str, Any]]
+
+
+def _to_bool(value: str) -> bool:
+    """Parse an environment variable flag ('true', case-insensitive)"""
+    return value.lower() == 'true'
+
+
+# Environment variable -> (config section, field, converter); 'app' is the
+# top level of AppConfiguration
+_ENV_BINDINGS = (
+    ('GDAM_CACHE_ENABLED', 'cache', 'enabled', _to_bool),
+    ('GDAM_CACHE_DIR', 'cache', 'cache_dir', str),
+    ('GDAM_CACHE_TTL_DAYS', 'cache', 'default_ttl_days', int),
+    ('GDAM_CREDENTIALS_PATH', 'google_api', 'credentials_path', str),
+    ('GDAM_SERVICE_ACCOUNT_PATH', 'google_api', 'service_account_path', str),
+    ('GDAM_ADMIN_EMAIL', 'google_api', 'admin_email', str),
+    ('GDAM_REPORT_DIR', 'reporting', 'output_dir', str),
+    ('GDAM_LOG_LEVEL', 'logging', 'log_level', str),
+    ('GDAM_DEBUG', 'app', 'debug_mode', _to_bool),
+)
 
 
 class ConfigurationLoader:
@@ -173,19 +290,28 @@ class ConfigurationLoader:
     Loads configuration from multiple sources with priority:
     1. Command-line arguments (highest priority)
     2. Environment variables
-    3. Configuration file (YAML)
+    3. Configuration file (YAML, or TOML for .toml files)
     4. Hardcoded defaults (lowest priority)
     """
     
     DEFAULT_CONFIG_FILE = "config.yaml"
     
+    # Parsed files keyed by path, with the (mtime_ns, size) they were parsed at
+    _file_cache: Dict[str, Tuple[int, int, AppConfiguration, _Settings]] = {}
+    _default_config: Optional[AppConfiguration] = None
+    
     @classmethod
     def load_from_file(cls, config_path: str) -> AppConfiguration:
         """
-        Load configuration from YAML file
+        Load configuration from a YAML or TOML file
+        
+        Files ending in .toml are parsed with tomllib (or tomli on
+        Python 3.10); anything else is parsed as YAML. The result is reused
+        until the file's modification time or size changes, so returned
+        configurations are shared and must not be modified.
         
         Args:
-            config_path: Path to YAML configuration file
+            config_path: Path to configuration file
             
         Returns:
             AppConfiguration object
@@ -193,18 +319,49 @@ class ConfigurationLoader:
         Raises:
             ConfigurationError: If file cannot be loaded
         """
-        if not os.path.exists(config_path):
+        try:
+            st = os.stat(config_path)
+        except FileNotFoundError:
             raise ConfigurationError(
                 f"Configuration file not found: {config_path}",
                 config_file=config_path
             )
         
-        try:
-            with open(config_path, 'r') as f:
-                data = yaml.safe_load(f)
+        return cls._load_file_stat(config_path, st)[0]
+    
+    @classmethod
+    def _load_file_stat(
+        cls,
+        config_path: str,
+        st: os.stat_result
+    ) -> Tuple[AppConfiguration, _Settings]:
+        """
+        Load a configuration file whose stat() result is already known
+        
+        Args:
+            config_path: Path to configuration file
+            st: Result of os.stat(config_path)
+            
+        Returns:
+            Tuple of (AppConfiguration, settings present in the file),
+            cached while mtime and size match
             
-            return cls._parse_config_data(data or {})
+        Raises:
+            ConfigurationError: If file cannot be loaded
+        """
+        cached = cls._file_cache.get(config_path)
+        if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+            return cached[2], cached[3]
         
+        try:
+            data = cls._load_config_data(config_path)
+            settings = cls._file_settings(data or {})
+            config = cls._build_config(settings)
+            cls._file_cache[config_path] = (st.st_mtime_ns, st.st_size, config, settings)
+            return config, settings
+        
+        except ConfigurationError:
+            raise
         except yaml.YAMLError as e:
             raise ConfigurationError(
                 f"Failed to parse YAML configuration: {e}",
@@ -216,6 +373,45 @@ class ConfigurationLoader:
                 config_file=config_path
             )
     
+    @staticmethod
+    def _load_config_data(config_path: str) -> Optional[Dict[str, Any]]:
+        """
+        Read a configuration file into a dictionary
+        
+        Args:
+            config_path: Path to a .toml or YAML configuration file
+            
+        Returns:
+            Parsed data (None for an empty YAML file)
+            
+        Raises:
+            ConfigurationError: If a TOML file cannot be parsed, or no TOML
+                parser is available
+        """
+        with open(config_path, 'rb') as f:
+            if not config_path.endswith('.toml'):
+                return yaml.load(f, Loader=_SafeLoader)
+            
+            # tomllib is standard from Python 3.11; tomli is its 3.10 backport
+            try:
+                import tomllib
+            except ImportError:
+                try:
+                    import tomli as tomllib  # type: ignore
+                except ImportError:
+                    raise ConfigurationError(
+                        "TOML configuration requires Python 3.11+ or the tomli package",
+                        config_file=config_path
+                    )
+            
+            try:
+                return tomllib.load(f)
+            except tomllib.TOMLDecodeError as e:
+                raise ConfigurationError(
+                    f"Failed to parse TOML configuration: {e}",
+                    config_file=config_path
+                )
+    
     @classmethod
     def load_from_env(cls) -> AppConfiguration:
         """
@@ -227,57 +423,37 @@ class ConfigurationLoader:
         Returns:
             AppConfiguration object
         """
-        config = AppConfiguration()
-        
-        # Cache settings
-        cache_enabled = os.getenv('GDAM_CACHE_ENABLED')
-        if cache_enabled:
-            config.cache.enabled = cache_enabled.lower() == 'true'
-        cache_dir = os.getenv('GDAM_CACHE_DIR')
-        if cache_dir:
-            config.cache.cache_dir = cache_dir
-        cache_ttl = os.getenv('GDAM_CACHE_TTL_DAYS')
-        if cache_ttl:
-            config.cache.default_ttl_days = int(cache_ttl)
-        
-        # Google API settings
-        creds_path = os.getenv('GDAM_CREDENTIALS_PATH')
-        if creds_path:
-            config.google_api.credentials_path = creds_path
-        sa_path = os.getenv('GDAM_SERVICE_ACCOUNT_PATH')
-        if sa_path:
-            config.google_api.service_account_path = sa_path
-        admin_email = os.getenv('GDAM_ADMIN_EMAIL')
-        if admin_email:
-            config.google_api.admin_email = admin_email
-        
-        # Reporting settings
-        report_dir = os.getenv('GDAM_REPORT_DIR')
-        if report_dir:
-            config.reporting.output_dir = report_dir
-        
-        # Logging settings
-        log_level = os.getenv('GDAM_LOG_LEVEL')
-        if log_level:
-            config.logging.log_level = log_level
-        
-        # Debug mode
-        if os.getenv('GDAM_DEBUG'):
-            config.debug_mode = os.getenv('GDAM_DEBUG', 'false').lower() == 'true'
-        
-        return config
+        return cls._build_config(cls._env_settings())
+    
+    @staticmethod
+    def _env_settings() -> _Settings:
+        """Get the settings supplied through (non-empty) environment variables"""
+        settings: _Settings = {}
+        
+        environ = os.environ
+        for var, section, attr, convert in _ENV_BINDINGS:
+            value = environ.get(var)
+            if value:
+                settings.setdefault(section, {})[attr] = convert(value)
+        
+        return settings
     
     @classmethod
     def load_default(cls) -> AppConfiguration:
         """
         Load default configuration
         
+        The defaults are built and validated once; the same (shared,
+        not to be modified) instance is returned on every call.
+        
         Returns:
             AppConfiguration with default values
         """
-        config = AppConfiguration()
-        config.validate()
-        return config
+        if cls._default_config is None:
+            config = AppConfiguration()
+            config.validate()
+            cls._default_config = config
+        return cls._default_config
     
     @classmethod
     def load(cls, config_file: Optional[str] = None) -> AppConfiguration:
@@ -299,16 +475,18 @@ class ConfigurationLoader:
         config = cls.load_default()
         
         # Merge environment variables
-        env_config = cls.load_from_env()
-        config = cls._merge_configs(config, env_config)
+        config = cls._merge_configs(config, cls._env_settings())
         
         # Merge file configuration if provided
-        if config_file and os.path.exists(config_file):
-            file_config = cls.load_from_file(config_file)
-            config = cls._merge_configs(config, file_config)
-        elif config_file:
-            # File specified but doesn't exist - create default
-            cls._create_default_config_file(config_file)
+        if config_file:
+            try:
+                st = os.stat(config_file)
+            except FileNotFoundError:
+                # File specified but doesn't exist - create default
+                cls._create_default_config_file(config_file)
+            else:
+                _, file_settings = cls._load_file_stat(config_file, st)
+                config = cls._merge_configs(config, file_settings)
         
         # Validate final configuration
         config.validate()
@@ -319,88 +497,64 @@ class ConfigurationLoader:
     @classmethod
     def _parse_config_data(cls, data: Dict[str, Any]) -> AppConfiguration:
         """Parse configuration data dictionary into AppConfiguration"""
-        config = AppConfiguration()
-        
-        # Parse Google API config
-        if 'google_api' in data:
-            api_data = data['google_api']
-            config.google_api = GoogleAPIConfig(**api_data)
-        
-        # Parse cache config
-        if 'cache' in data:
-            cache_data = data['cache']
-            config.cache = CacheConfig(**cache_data)
-        
-        # Parse reporting config
-        if 'reporting' in data:
-            report_data = data['reporting']
-            config.reporting = ReportingConfig(**report_data)
-        
-        # Parse logging config
-        if 'logging' in data:
-            log_data = data['logging']
-            config.logging = LoggingConfig(**log_data)
-        
-        # Parse app-level settings
-        if 'app_name' in data:
-            config.app_name = data['app_name']
-        if 'version' in data:
-            config.version = data['version']
-        if 'debug_mode' in data:
-            config.debug_mode = data['debug_mode']
-        
-        return config
+        return cls._build_config(cls._file_settings(data))
     
     @classmethod
-    def _merge_configs(cls, base: AppConfiguration, override: AppConfiguration) -> AppConfiguration:
+    def _file_settings(cls, data: Dict[str, Any]) -> _Settings:
+        """Get the settings present in a configuration data dictionary"""
+        settings = {name: cls._section(data, name) for name in _SECTION_TYPES}
+        settings['app'] = {
+            key: data[key] for key in ('app_name', 'version', 'debug_mode') if key in data
+        }
+        return settings
+    
+    @staticmethod
+    def _build_config(settings: _Settings) -> AppConfiguration:
+        """Build a configuration from settings, with defaults for the rest"""
+        return AppConfiguration(
+            **{
+                name: section_type(**settings.get(name, {}))
+                for name, section_type in _SECTION_TYPES.items()
+            },
+            **settings.get('app', {})
+        )
+    
+    @staticmethod
+    def _section(data: Dict[str, Any], name: str) -> Dict[str, Any]:
+        """Get a config section's settings, with lists converted to tuples"""
+        return {
+            key: tuple(value) if isinstance(value, list) else value
+            for key, value in (data.get(name) or {}).items()
+        }
+    
+    @staticmethod
+    def _merge_configs(base: AppConfiguration, settings: _Settings) -> AppConfiguration:
         """
-        Merge two configurations (override takes precedence)
+        Merge one source's settings into a configuration
+        
+        Every setting the source supplied replaces the base value, even
+        one equal to its default, so a configuration file can switch back
+        a setting an environment variable changed. Settings the source
+        doesn't mention are kept.
         
         Args:
             base: Base configuration
-            override: Configuration to merge (takes precedence)
+            settings: _Settings supplied by the source (take precedence)
             
         Returns:
-            Merged configuration
+            base itself if the source supplies nothing, otherwise a
+            replaced copy
         """
-        # For now, return override if provided, otherwise base
-        # In a full implementation, would merge field-by-field
-        return override if override else base
+        changes = dict(settings.get('app', {}))
+        for name in _SECTION_TYPES:
+            section_settings = settings.get(name)
+            if section_settings:
+                changes[name] = replace(getattr(base, name), **section_settings)
+        
+        return replace(base, **changes) if changes else base
     
     @classmethod
     def _create_default_config_file(cls, config_path: str) -> None:
-        """Create a default configuration file"""
-        config = cls.load_default()
-        
-        config_data = {
-            'app_name': config.app_name,
-            'version': config.version,
-            'debug_mode': config.debug_mode,
-            'google_api': {
-                'credentials_path': config.google_api.credentials_path,
-                'token_path': config.google_api.token_path,
-                'page_size': config.google_api.page_size,
-                'rate_limit_delay': config.google_api.rate_limit_delay,
-                'max_retries': config.google_api.max_retries,
-            },
-            'cache': {
-                'enabled': config.cache.enabled,
-                'cache_dir': config.cache.cache_dir,
-                'default_ttl_days': config.cache.default_ttl_days,
-                'max_size_mb': config.cache.max_size_mb,
-            },
-            'reporting': {
-                'output_dir': config.reporting.output_dir,
-                'default_formats': config.reporting.default_formats,
-                'include_metadata': config.reporting.include_metadata,
-            },
-            'logging': {
-                'enabled': config.logging.enabled,
-                'log_dir': config.logging.log_dir,
-                'log_level': config.logging.log_level,
-                'audit_enabled': config.logging.audit_enabled,
-            }
-        }
-        
-        with open(config_path, 'w') as f:
-            yaml.dump(config_data, f, default_flow_style=False, sort_keys=False)
+        """Create a default configuration file (TOML for .toml paths, else YAML)"""
+        template = _DEFAULT_TOML_TEMPLATE if config_path.endswith('.toml') else _DEFAULT_YAML_TEMPLATE
+        Path(config_path).write_text(template)
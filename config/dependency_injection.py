@@ -3,22 +3,52 @@ Dependency Injection Container
 Manages object creation and dependencies
 """
 
+import functools
+import importlib
 from typing import Dict, Any, Callable, Optional
 from config.configuration import AppConfiguration, ConfigurationLoader
 
 
+# Infrastructure modules imported by service factories, by dotted name
+_MODULES: Dict[str, Any] = {}
+
+
+def _mod(name: str) -> Any:
+    """
+    Import a module on first use and cache it
+    
+    Args:
+        name: Dotted module name
+        
+    Returns:
+        The imported module
+    """
+    module = _MODULES.get(name)
+    if module is None:
+        module = _MODULES[name] = importlib.import_module(name)
+    return module
+
+
+# Marks "no instance yet" (None is a valid registered instance)
+_UNSET = object()
+
+
 class ServiceContainer:
     """
     Simple dependency injection container
     
     Manages service registration and resolution.
     Supports singleton, transient, and scoped lifetimes.
+    
+    Registered instances and already-created singletons live in one
+    instance map, so resolving them is a single dictionary lookup.
     """
     
     def __init__(self):
         """Initialize the service container"""
+        self._instances: Dict[type, Any] = {}
+        self._singleton_factories: Dict[type, Callable] = {}
         self._services: Dict[type, Callable] = {}
-        self._singletons: Dict[type, Any] = {}
         self._configuration: Optional[AppConfiguration] = None
     
     def register_singleton(self, interface: type, implementation: Callable) -> None:
@@ -29,9 +59,8 @@ class ServiceContainer:
             interface: Interface or base class
             implementation: Factory function or class
         """
-        self._services[interface] = lambda: self._get_or_create_singleton(
-            interface, implementation
-        )
+        self._unregister(interface)
+        self._singleton_factories[interface] = implementation
     
     def register_transient(self, interface: type, implementation: Callable) -> None:
         """
@@ -41,6 +70,7 @@ class ServiceContainer:
             interface: Interface or base class
             implementation: Factory function or class
         """
+        self._unregister(interface)
         self._services[interface] = implementation
     
     def register_instance(self, interface: type, instance: Any) -> None:
@@ -51,8 +81,8 @@ class ServiceContainer:
             interface: Interface or base class
             instance: Instance to register
         """
-        self._singletons[interface] = instance
-        self._services[interface] = lambda: instance
+        self._unregister(interface)
+        self._instances[interface] = instance
     
     def resolve(self, interface: type) -> Any:
         """
@@ -67,16 +97,27 @@ class ServiceContainer:
         Raises:
             KeyError: If service not registered
         """
-        if interface not in self._services:
-            raise KeyError(f"Service not registered: {interface}")
+        instance = self._instances.get(interface, _UNSET)
+        if instance is not _UNSET:
+            return instance
+        
+        factory = self._singleton_factories.get(interface)
+        if factory is not None:
+            # Promote the singleton so later resolves take the fast path
+            instance = self._instances[interface] = factory()
+            del self._singleton_factories[interface]
+            return instance
         
-        return self._services[interface]()
+        factory = self._services.get(interface)
+        if factory is None:
+            raise KeyError(f"Service not registered: {interface}")
+        return factory()
     
-    def _get_or_create_singleton(self, interface: type, factory: Callable) -> Any:
-        """Get or create singleton instance"""
-        if interface not in self._singletons:
-            self._singletons[interface] = factory()
-        return self._singletons[interface]
+    def _unregister(self, interface: type) -> None:
+        """Drop any existing registration for an interface"""
+        self._instances.pop(interface, None)
+        self._singleton_factories.pop(interface, None)
+        self._services.pop(interface, None)
     
     def set_configuration(self, config: AppConfiguration) -> None:
         """
@@ -94,15 +135,17 @@ class ServiceContainer:
         
         Returns:
             Application configuration
+            
+        Raises:
+            RuntimeError: If no configuration has been set
         """
         if self._configuration is None:
-            self._configuration = ConfigurationLoader.load()
-            self.register_instance(AppConfiguration, self._configuration)
+            raise RuntimeError("configuration not set")
         return self._configuration
 
 
-# Global container instance
-_container: Optional[ServiceContainer] = None
+# Global container instance, built once at import
+_container = ServiceContainer()
 
 
 def get_container() -> ServiceContainer:
@@ -112,16 +155,13 @@ def get_container() -> ServiceContainer:
     Returns:
         ServiceContainer instance
     """
-    global _container
-    if _container is None:
-        _container = ServiceContainer()
     return _container
 
 
 def reset_container() -> None:
     """Reset the global container (useful for testing)"""
     global _container
-    _container = None
+    _container = ServiceContainer()
 
 
 def configure_services(config: Optional[AppConfiguration] = None) -> ServiceContainer:
@@ -129,7 +169,14 @@ def configure_services(config: Optional[AppConfiguration] = None) -> ServiceCont
     Configure all services in the container
     
     This is the main composition root for the application.
-    All dependencies are wired up here.
+    All dependencies are wired up here; call it once at startup.
+    
+    The returned container is an instance of a generated ServiceContainer
+    subclass exposing each service as an attribute (e.g.
+    container.drive_repository, container.manage_access_use_case).
+    Singletons are cached properties, so after the first access they are
+    plain instance attribute reads. resolve() keeps working by interface.
+    It also becomes the global container.
     
     Args:
         config: Optional configuration (loads default if not provided)
@@ -137,84 +184,101 @@ def configure_services(config: Optional[AppConfiguration] = None) -> ServiceCont
     Returns:
         Configured ServiceContainer
     """
-    container = get_container()
+    global _container
+    
+    from application.interfaces.repositories import (
+        ICacheRepository,
+        IDriveRepository,
+        IPermissionRepository
+    )
+    from application.interfaces.services import IAuthenticationService, IReportService
+    from application.use_cases.manage_user_access_use_case import ManageUserAccessUseCase
+    from infrastructure.logging.audit_logger import AuditLogger
     
     # Load configuration
     if config is None:
         config = ConfigurationLoader.load()
-    container.set_configuration(config)
     
-    # Register infrastructure services (lazy imports to avoid circular dependencies)
-    def create_auth_service():
-        from infrastructure.google_api.authentication_service import AuthenticationFactory
-        return AuthenticationFactory.create_service(config.google_api)
+    # Infrastructure services (imported through _mod on first use, which
+    # keeps the Google client libraries out of start-up)
+    def create_auth_service(c):
+        auth = _mod('infrastructure.google_api.authentication_service')
+        return auth.AuthenticationFactory.create_from_config(config)
     
-    def create_drive_repository():
-        from infrastructure.google_api.google_drive_repository import GoogleDriveRepository
-        auth_service = container.resolve(object)  # Will be replaced with proper type
-        return GoogleDriveRepository(auth_service.get_drive_service())
+    def create_drive_repository(c):
+        drive = _mod('infrastructure.google_api.google_drive_repository')
+        return drive.GoogleDriveRepository(
+            c.auth_service.get_drive_service(),
+            page_size=config.google_api.page_size,
+            rate_limit_delay=config.google_api.rate_limit_delay
+        )
     
-    def create_permission_repository():
-        from infrastructure.google_api.google_permission_repository import GooglePermissionRepository
-        auth_service = container.resolve(object)  # Will be replaced with proper type
-        return GooglePermissionRepository(auth_service.get_drive_service())
+    def create_permission_repository(c):
+        permissions = _mod('infrastructure.google_api.google_permission_repository')
+        return permissions.GooglePermissionRepository(
+            c.auth_service.get_drive_service(),
+            rate_limit_delay=config.google_api.rate_limit_delay,
+            http_factory=c.auth_service.create_http
+        )
     
-    def create_cache_repository():
-        from infrastructure.cache.file_cache_repository import FileCacheRepository
-        return FileCacheRepository(
+    def create_cache_repository(c):
+        if not config.cache.enabled:
+            return None
+        cache = _mod('infrastructure.cache.file_cache_repository')
+        return cache.FileCacheRepository(
             cache_dir=config.cache.cache_dir,
             compression_enabled=config.cache.compression_enabled
         )
     
-    def create_report_service():
-        from infrastructure.reporting.report_generator import ReportGenerator
-        return ReportGenerator(output_dir=config.reporting.output_dir)
+    def create_report_service(c):
+        reporting = _mod('infrastructure.reporting.report_generator')
+        return reporting.ReportGenerator(output_dir=config.reporting.output_dir)
     
-    def create_audit_logger():
-        from infrastructure.logging.audit_logger import AuditLogger
+    def create_audit_logger(c):
+        if not config.logging.audit_enabled:
+            return None
         return AuditLogger(
             log_dir=config.logging.log_dir,
-            enabled=config.logging.audit_enabled
+            audit_file=config.logging.audit_file,
+            max_bytes=config.logging.max_log_size_mb * 1024 * 1024,
+            backup_count=config.logging.backup_count
         )
     
-    # Register domain services
-    def create_permission_service():
-        from domain.services.permission_service import PermissionService
-        return PermissionService()
-    
-    def create_file_analysis_service():
-        from domain.services.file_analysis_service import FileAnalysisService
-        permission_service = create_permission_service()
-        return FileAnalysisService(permission_service)
-    
-    # Register use cases
-    def create_manage_access_use_case():
-        from application.use_cases.manage_user_access_use_case import ManageUserAccessUseCase
-        # Create dependencies (simplified - in production would use proper DI)
-        drive_repo = create_drive_repository()
-        permission_repo = create_permission_repository()
-        cache_repo = create_cache_repository()
-        report_service = create_report_service()
-        audit_logger = create_audit_logger()
-        permission_service = create_permission_service()
-        file_analysis_service = create_file_analysis_service()
-        
+    # Use cases (transient: a new instance per access)
+    def create_manage_access_use_case(c):
         return ManageUserAccessUseCase(
-            drive_repository=drive_repo,
-            permission_repository=permission_repo,
-            cache_repository=cache_repo,
-            report_service=report_service,
-            audit_logger=audit_logger,
-            permission_service=permission_service,
-            file_analysis_service=file_analysis_service,
-            config=config
+            drive_repository=c.drive_repository,
+            permission_repository=c.permission_repository,
+            report_service=c.report_service,
+            cache_repository=c.cache_repository,
+            audit_logger=c.audit_logger,
+            result_sink_factory=_mod('infrastructure.reporting.result_sinks').CSVResultSink.to_file
         )
     
-    # Register services
-    container.register_singleton(object, create_auth_service)  # Auth service
-    container.register_transient(object, create_manage_access_use_case)  # Use case
+    # Attribute name -> (interface, factory) for singleton services
+    singletons = {
+        'auth_service': (IAuthenticationService, create_auth_service),
+        'drive_repository': (IDriveRepository, create_drive_repository),
+        'permission_repository': (IPermissionRepository, create_permission_repository),
+        'cache_repository': (ICacheRepository, create_cache_repository),
+        'report_service': (IReportService, create_report_service),
+        'audit_logger': (AuditLogger, create_audit_logger),
+    }
+    namespace = {
+        name: functools.cached_property(factory)
+        for name, (_, factory) in singletons.items()
+    }
+    namespace['manage_access_use_case'] = property(create_manage_access_use_case)
     
-    from application.use_cases.manage_user_access_use_case import ManageUserAccessUseCase
-    container.register_transient(ManageUserAccessUseCase, create_manage_access_use_case)
+    container = type('AppContainer', (ServiceContainer,), namespace)()
+    container.set_configuration(config)
+    
+    for name, (interface, _) in singletons.items():
+        container.register_transient(interface, functools.partial(getattr, container, name))
+    container.register_transient(
+        ManageUserAccessUseCase,
+        functools.partial(getattr, container, 'manage_access_use_case')
+    )
     
+    _container = container
     return container
@@ -3,29 +3,60 @@ DriveFile Entity
 Represents a Google Drive file with business logic
 """
 
-from typing import List, Optional
+import sys
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
 from datetime import datetime
 
 from domain.value_objects.email import Email
-from domain.value_objects.identifiers import FileId
+from domain.value_objects.identifiers import FileId, PermissionId
+from domain.value_objects.permission_role import PermissionRole, PermissionType
 from domain.entities.permission import Permission
 
 
+_GOOGLE_MIME_TYPES = frozenset({
+    'application/vnd.google-apps.document',
+    'application/vnd.google-apps.spreadsheet',
+    'application/vnd.google-apps.presentation',
+    'application/vnd.google-apps.form',
+    'application/vnd.google-apps.drawing'
+})
+
+
+def _parse_timestamp(value: str) -> Optional[datetime]:
+    """Parse an API RFC 3339 timestamp, returning None if it is malformed"""
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+
+
 class DriveFile:
     """
     DriveFile domain entity (Aggregate Root)
     
     Represents a Google Drive file with its permissions.
     Contains business logic for permission management.
+    
+    Per-user lookups go through an email -> permissions index that is
+    built on first use, so files that are never queried don't pay for it.
+    Timestamps loaded from the API or from cached columns are kept as raw
+    strings and parsed on first access.
     """
     
+    __slots__ = (
+        '_file_id', '_name', '_mime_type', '_owners', '_owner_set',
+        '_permissions', '_permission_count', '_perm_index', '_created_time',
+        '_modified_time', '_created_time_raw', '_modified_time_raw',
+        '_web_view_link', '_size', '_shared', '_hash'
+    )
+    
     def __init__(
         self,
         file_id: FileId,
         name: str,
         mime_type: str,
-        owners: List[Email],
-        permissions: List[Permission],
+        owners: Sequence[Email],
+        permissions: Sequence[Permission],
         created_time: Optional[datetime] = None,
         modified_time: Optional[datetime] = None,
         web_view_link: Optional[str] = None,
@@ -39,8 +70,8 @@ class DriveFile:
             file_id: Unique file identifier
             name: File name
             mime_type: MIME type of the file
-            owners: List of owner email addresses
-            permissions: List of permissions on the file
+            owners: Owner email addresses
+            permissions: Permissions on the file
             created_time: File creation timestamp
             modified_time: File modification timestamp
             web_view_link: URL to view file in browser
@@ -48,12 +79,21 @@ class DriveFile:
             shared: Whether file is shared
         """
         self._file_id = file_id
+        # The ID never changes, so its hash is computed once
+        self._hash = hash(file_id)
         self._name = name
         self._mime_type = mime_type
-        self._owners = owners
-        self._permissions = permissions
+        # Stored as tuples so the properties can hand them out without copying
+        self._owners = tuple(owners)
+        self._owner_set = frozenset(self._owners)
+        self._permissions = tuple(permissions)
+        self._permission_count = len(self._permissions)
+        self._perm_index: Optional[Dict[Email, List[Permission]]] = None
         self._created_time = created_time
         self._modified_time = modified_time
+        # Unparsed timestamps, set by the loaders and consumed on first access
+        self._created_time_raw: Optional[str] = None
+        self._modified_time_raw: Optional[str] = None
         self._web_view_link = web_view_link
         self._size = size
         self._shared = shared
@@ -74,23 +114,39 @@ class DriveFile:
         return self._mime_type
     
     @property
-    def owners(self) -> List[Email]:
-        """Get the file owners"""
-        return self._owners.copy()
+    def owners(self) -> Tuple[Email, ...]:
+        """Get the file owners (immutable)"""
+        return self._owners
+    
+    @property
+    def has_owners(self) -> bool:
+        """Check if the file has at least one owner"""
+        return bool(self._owners)
     
     @property
-    def permissions(self) -> List[Permission]:
-        """Get the file permissions"""
-        return self._permissions.copy()
+    def permissions(self) -> Tuple[Permission, ...]:
+        """Get the file permissions (immutable)"""
+        return self._permissions
+    
+    @property
+    def permission_count(self) -> int:
+        """Get the number of permissions on the file"""
+        return self._permission_count
     
     @property
     def created_time(self) -> Optional[datetime]:
         """Get the creation time"""
+        if self._created_time_raw is not None:
+            self._created_time = _parse_timestamp(self._created_time_raw)
+            self._created_time_raw = None
         return self._created_time
     
     @property
     def modified_time(self) -> Optional[datetime]:
         """Get the modification time"""
+        if self._modified_time_raw is not None:
+            self._modified_time = _parse_timestamp(self._modified_time_raw)
+            self._modified_time_raw = None
         return self._modified_time
     
     @property
@@ -116,14 +172,7 @@ class DriveFile:
     @property
     def is_google_doc(self) -> bool:
         """Check if file is a Google Workspace document"""
-        google_mime_types = [
-            'application/vnd.google-apps.document',
-            'application/vnd.google-apps.spreadsheet',
-            'application/vnd.google-apps.presentation',
-            'application/vnd.google-apps.form',
-            'application/vnd.google-apps.drawing'
-        ]
-        return self._mime_type in google_mime_types
+        return self._mime_type in _GOOGLE_MIME_TYPES
     
     def is_shared_with(self, email: Email) -> bool:
         """
@@ -135,10 +184,7 @@ class DriveFile:
         Returns:
             True if file is shared with the user
         """
-        for permission in self._permissions:
-            if permission.belongs_to_user(email):
-                return True
-        return False
+        return email in self._permissions_by_email()
     
     def is_owned_by(self, email: Email) -> bool:
         """
@@ -150,7 +196,7 @@ class DriveFile:
         Returns:
             True if user is an owner
         """
-        return email in self._owners
+        return email in self._owner_set
     
     def can_revoke_permission_for(self, email: Email) -> bool:
         """
@@ -164,16 +210,11 @@ class DriveFile:
         Returns:
             True if permission can be revoked
         """
-        # Cannot revoke owner permissions
-        if self.is_owned_by(email):
-            return False
-        
-        # Check if user has any revocable permissions
-        for permission in self._permissions:
-            if permission.belongs_to_user(email) and permission.can_be_revoked():
-                return True
-        
-        return False
+        # Owners are never revocable; otherwise any revocable permission will do
+        return email not in self._owner_set and any(
+            permission.can_be_revoked()
+            for permission in self._permissions_by_email().get(email, ())
+        )
     
     def get_permission_for_user(self, email: Email) -> Optional[Permission]:
         """
@@ -185,10 +226,8 @@ class DriveFile:
         Returns:
             Permission object or None if not found
         """
-        for permission in self._permissions:
-            if permission.belongs_to_user(email):
-                return permission
-        return None
+        permissions = self._permissions_by_email().get(email)
+        return permissions[0] if permissions else None
     
     def get_revocable_permissions_for_user(self, email: Email) -> List[Permission]:
         """
@@ -200,11 +239,11 @@ class DriveFile:
         Returns:
             List of revocable permissions
         """
-        revocable = []
-        for permission in self._permissions:
-            if permission.belongs_to_user(email) and permission.can_be_revoked():
-                revocable.append(permission)
-        return revocable
+        return [
+            permission
+            for permission in self._permissions_by_email().get(email, ())
+            if permission.can_be_revoked()
+        ]
     
     def remove_permission(self, permission: Permission) -> None:
         """
@@ -213,7 +252,9 @@ class DriveFile:
         Args:
             permission: Permission to remove
         """
-        self._permissions = [p for p in self._permissions if p != permission]
+        self._permissions = tuple(p for p in self._permissions if p != permission)
+        self._permission_count = len(self._permissions)
+        self._perm_index = None
     
     def add_permission(self, permission: Permission) -> None:
         """
@@ -224,7 +265,29 @@ class DriveFile:
         """
         # Don't add duplicates
         if permission not in self._permissions:
-            self._permissions.append(permission)
+            self._permissions += (permission,)
+            self._permission_count += 1
+            self._perm_index = None
+    
+    def _permissions_by_email(self) -> Dict[Email, List[Permission]]:
+        """Get the email -> permissions index, building it on first use"""
+        index = self._perm_index
+        if index is None:
+            index = {}
+            for permission in self._permissions:
+                if permission._email is not None:
+                    index.setdefault(permission._email, []).append(permission)
+            self._perm_index = index
+        return index
+    
+    def _parse_times(self) -> None:
+        """Parse both raw API timestamps now rather than on first access"""
+        if self._created_time_raw is not None:
+            self._created_time = _parse_timestamp(self._created_time_raw)
+            self._created_time_raw = None
+        if self._modified_time_raw is not None:
+            self._modified_time = _parse_timestamp(self._modified_time_raw)
+            self._modified_time_raw = None
     
     def __eq__(self, other) -> bool:
         """Check equality based on file ID"""
@@ -234,11 +297,11 @@ class DriveFile:
     
     def __hash__(self) -> int:
         """Hash based on file ID"""
-        return hash(self._file_id)
+        return self._hash
     
     def __str__(self) -> str:
         """String representation"""
-        return f"DriveFile('{self._name}', {len(self._permissions)} permissions)"
+        return f"DriveFile('{self._name}', {self._permission_count} permissions)"
     
     def __repr__(self) -> str:
         """Developer representation"""
@@ -246,72 +309,219 @@ class DriveFile:
                 f"mime_type='{self._mime_type}')")
     
     @classmethod
-    def from_api_response(cls, data: dict) -> 'DriveFile':
+    def from_api_response(cls, data: dict, parse_times: bool = False) -> 'DriveFile':
         """
         Create DriveFile from Google Drive API response
         
         Args:
             data: API response dictionary
+            parse_times: Parse timestamps now instead of on first access
             
         Returns:
             DriveFile entity
         """
-        file_id = FileId(data['id'])
-        name = data.get('name', 'Unknown')
-        mime_type = data.get('mimeType', 'application/octet-stream')
+        file = cls._from_row(data, Email.try_parse, Permission.from_api_response)
+        if parse_times:
+            file._parse_times()
+        return file
+    
+    @classmethod
+    def from_api_responses(cls, rows: Iterable[dict]) -> List['DriveFile']:
+        """
+        Create DriveFiles from a page of Google Drive API file data
         
-        # Parse owners
-        owners = []
-        for owner_data in data.get('owners', []):
-            email = Email.try_parse(owner_data.get('emailAddress', ''))
-            if email:
-                owners.append(email)
+        Rows that fail validation are skipped.
+        
+        Args:
+            rows: API file dictionaries
+            
+        Returns:
+            List of DriveFile entities
+        """
+        # Bind the per-row callables once for the whole page
+        from_row = cls._from_row
+        try_parse_email = Email.try_parse
+        parse_permission = Permission.from_api_response
+        
+        files = []
+        append = files.append
+        for data in rows:
+            try:
+                append(from_row(data, try_parse_email, parse_permission))
+            except (ValueError, KeyError):
+                # Skip invalid files
+                continue
+        return files
+    
+    @classmethod
+    def _from_row(
+        cls,
+        data: dict,
+        try_parse_email: Callable[[str], Optional[Email]],
+        parse_permission: Callable[[dict], Permission]
+    ) -> 'DriveFile':
+        """Build a DriveFile from one API row using pre-bound parsers"""
+        get = data.get
+        owners = [
+            email
+            for owner_data in get('owners') or ()
+            if (email := try_parse_email(owner_data.get('emailAddress', '')))
+        ]
         
-        # Parse permissions
         permissions = []
-        for perm_data in data.get('permissions', []):
+        for perm_data in get('permissions') or ():
             try:
-                permission = Permission.from_api_response(perm_data)
-                permissions.append(permission)
+                permissions.append(parse_permission(perm_data))
             except (ValueError, KeyError):
                 # Skip invalid permissions
                 continue
         
-        # Parse timestamps
-        created_time = None
-        if 'createdTime' in data:
-            try:
-                created_time = datetime.fromisoformat(
-                    data['createdTime'].replace('Z', '+00:00')
-                )
-            except ValueError:
-                pass
+        size = get('size')
+        file = cls(
+            file_id=FileId(data['id']),
+            name=get('name', 'Unknown'),
+            # Interned: a handful of MIME types are repeated across every file
+            mime_type=sys.intern(get('mimeType', 'application/octet-stream')),
+            owners=owners,
+            permissions=permissions,
+            web_view_link=get('webViewLink'),
+            size=int(size) if size is not None else None,
+            shared=get('shared', False)
+        )
         
-        modified_time = None
-        if 'modifiedTime' in data:
-            try:
-                modified_time = datetime.fromisoformat(
-                    data['modifiedTime'].replace('Z', '+00:00')
-                )
-            except ValueError:
-                pass
+        # Timestamps are parsed lazily by the created_time/modified_time properties
+        file._created_time_raw = get('createdTime')
+        file._modified_time_raw = get('modifiedTime')
+        return file
+    
+    @staticmethod
+    def to_columns(files: Iterable['DriveFile']) -> Dict[str, List[Any]]:
+        """
+        Convert files to a columnar (structure of arrays) layout
         
-        web_view_link = data.get('webViewLink')
-        size = data.get('size')
-        if size is not None:
-            size = int(size)
+        Every column holds plain strings, numbers and booleans, so the
+        result serializes far faster and smaller than a list of entities.
+        Permissions are flattened into perm_* columns; the permissions of
+        file i are rows perm_offsets[i] to perm_offsets[i + 1].
         
-        shared = data.get('shared', False)
+        Highly repetitive values (mime_type, owners, perm_role, perm_type,
+        perm_email, perm_domain) are dictionary-encoded: those columns hold
+        indexes into the shared 'strings' column, or None for no value.
         
-        return cls(
-            file_id=file_id,
-            name=name,
-            mime_type=mime_type,
-            owners=owners,
-            permissions=permissions,
-            created_time=created_time,
-            modified_time=modified_time,
-            web_view_link=web_view_link,
-            size=size,
-            shared=shared
-        )
+        Args:
+            files: Files to convert
+            
+        Returns:
+            Dictionary of column name to list of values
+        """
+        columns: Dict[str, List[Any]] = {
+            'file_id': [], 'name': [], 'mime_type': [], 'owners': [],
+            'created_time': [], 'modified_time': [], 'web_view_link': [],
+            'size': [], 'shared': [], 'perm_offsets': [0],
+            'perm_id': [], 'perm_role': [], 'perm_type': [], 'perm_email': [],
+            'perm_display_name': [], 'perm_domain': [], 'perm_deleted': []
+        }
+        # Value -> index into the strings column, in first-seen order
+        codes: Dict[str, int] = {}
+        
+        def encode(value: Optional[str]) -> Optional[int]:
+            return None if value is None else codes.setdefault(value, len(codes))
+        
+        perm_offsets = columns['perm_offsets']
+        perm_id = columns['perm_id']
+        perm_role = columns['perm_role']
+        perm_type = columns['perm_type']
+        perm_email = columns['perm_email']
+        perm_display_name = columns['perm_display_name']
+        perm_domain = columns['perm_domain']
+        perm_deleted = columns['perm_deleted']
+        
+        for file in files:
+            columns['file_id'].append(file._file_id.value)
+            columns['name'].append(file._name)
+            columns['mime_type'].append(encode(file._mime_type))
+            columns['owners'].append([encode(owner.value) for owner in file._owners])
+            # Unparsed timestamps are stored as-is rather than parsed here
+            columns['created_time'].append(
+                file._created_time.isoformat() if file._created_time else file._created_time_raw
+            )
+            columns['modified_time'].append(
+                file._modified_time.isoformat() if file._modified_time else file._modified_time_raw
+            )
+            columns['web_view_link'].append(file._web_view_link)
+            columns['size'].append(file._size)
+            columns['shared'].append(file._shared)
+            
+            for permission in file._permissions:
+                perm_id.append(permission.permission_id.value)
+                perm_role.append(encode(permission.role.value))
+                perm_type.append(encode(permission.permission_type.value))
+                perm_email.append(encode(permission.email.value) if permission.email else None)
+                perm_display_name.append(permission.display_name)
+                perm_domain.append(encode(permission.domain))
+                perm_deleted.append(permission.deleted)
+            perm_offsets.append(len(perm_id))
+        
+        columns['strings'] = list(codes)
+        return columns
+    
+    @classmethod
+    def from_columns(
+        cls,
+        columns: Dict[str, List[Any]],
+        positions: Optional[Sequence[int]] = None
+    ) -> List['DriveFile']:
+        """
+        Materialize files from a to_columns() layout
+        
+        Args:
+            columns: Columnar file data
+            positions: Row indexes to materialize (all rows if None)
+            
+        Returns:
+            List of DriveFile entities, in positions order
+        """
+        if positions is None:
+            positions = range(len(columns['file_id']))
+        
+        strings = columns['strings']
+        perm_offsets = columns['perm_offsets']
+        perm_id = columns['perm_id']
+        perm_role = columns['perm_role']
+        perm_type = columns['perm_type']
+        perm_email = columns['perm_email']
+        perm_display_name = columns['perm_display_name']
+        perm_domain = columns['perm_domain']
+        perm_deleted = columns['perm_deleted']
+        
+        files = []
+        for i in positions:
+            permissions = [
+                Permission(
+                    permission_id=PermissionId(perm_id[row]),
+                    role=PermissionRole(strings[perm_role[row]]),
+                    permission_type=PermissionType(strings[perm_type[row]]),
+                    email=Email(strings[perm_email[row]]) if perm_email[row] is not None else None,
+                    display_name=perm_display_name[row],
+                    domain=strings[perm_domain[row]] if perm_domain[row] is not None else None,
+                    deleted=perm_deleted[row]
+                )
+                for row in range(perm_offsets[i], perm_offsets[i + 1])
+            ]
+            mime_type = columns['mime_type'][i]
+            
+            file = cls(
+                file_id=FileId(columns['file_id'][i]),
+                name=columns['name'][i],
+                mime_type=strings[mime_type] if mime_type is not None else None,
+                owners=[Email(strings[owner]) for owner in columns['owners'][i]],
+                permissions=permissions,
+                web_view_link=columns['web_view_link'][i],
+                size=columns['size'][i],
+                shared=columns['shared'][i]
+            )
+            file._created_time_raw = columns['created_time'][i]
+            file._modified_time_raw = columns['modified_time'][i]
+            files.append(file)
+        
+        return files
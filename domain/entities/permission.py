@@ -11,6 +11,11 @@ from domain.value_objects.identifiers import PermissionId
 from domain.value_objects.permission_role import PermissionRole, PermissionType
 
 
+# API value -> enum member, for the common exact-match case
+_ROLES = {role.value: role for role in PermissionRole}
+_TYPES = {ptype.value: ptype for ptype in PermissionType}
+
+
 class Permission:
     """
     Permission domain entity
@@ -19,6 +24,11 @@ class Permission:
     for determining if it can be revoked.
     """
     
+    __slots__ = (
+        '_permission_id', '_role', '_permission_type', '_email',
+        '_display_name', '_domain', '_deleted', '_is_owner', '_hash'
+    )
+    
     def __init__(
         self,
         permission_id: PermissionId,
@@ -42,12 +52,15 @@ class Permission:
             deleted: Whether the permission has been deleted
         """
         self._permission_id = permission_id
+        self._hash = hash(permission_id)
         self._role = role
         self._permission_type = permission_type
         self._email = email
         self._display_name = display_name
         self._domain = domain
         self._deleted = deleted
+        # Roles never change, so ownership is resolved once
+        self._is_owner = role.is_ownership_role
     
     @property
     def permission_id(self) -> PermissionId:
@@ -91,7 +104,7 @@ class Permission:
         Returns:
             True if permission grants ownership
         """
-        return self._role.is_ownership_role
+        return self._is_owner
     
     def can_be_revoked(self) -> bool:
         """
@@ -102,15 +115,8 @@ class Permission:
         Returns:
             True if permission can be revoked
         """
-        # Cannot revoke owner permissions
-        if self.is_owner_permission():
-            return False
-        
-        # Cannot revoke if already deleted
-        if self._deleted:
-            return False
-        
-        return True
+        # Cannot revoke owner permissions, or permissions already deleted
+        return not (self._is_owner or self._deleted)
     
     def belongs_to_user(self, user_email: Email) -> bool:
         """
@@ -122,10 +128,8 @@ class Permission:
         Returns:
             True if permission belongs to user
         """
-        if not self._email:
-            return False
-        
-        return self._email.equals(user_email)
+        email = self._email
+        return email is not None and email == user_email
     
     def mark_as_deleted(self) -> None:
         """Mark this permission as deleted"""
@@ -139,7 +143,7 @@ class Permission:
     
     def __hash__(self) -> int:
         """Hash based on permission ID"""
-        return hash(self._permission_id)
+        return self._hash
     
     def __str__(self) -> str:
         """String representation"""
@@ -162,24 +166,21 @@ class Permission:
         Returns:
             Permission entity
         """
-        permission_id = PermissionId(data['id'])
-        role = PermissionRole.from_string(data['role'])
-        permission_type = PermissionType.from_string(data['type'])
-        
-        email = None
-        if 'emailAddress' in data and data['emailAddress']:
-            email = Email.try_parse(data['emailAddress'])
-        
-        display_name = data.get('displayName')
-        domain = data.get('domain')
-        deleted = data.get('deleted', False)
+        # Exact API values hit the lookup tables; anything else goes through
+        # from_string for case-insensitive matching and its error messages
+        role_value = data['role']
+        role = _ROLES.get(role_value) or PermissionRole.from_string(role_value)
+        type_value = data['type']
+        permission_type = _TYPES.get(type_value) or PermissionType.from_string(type_value)
         
+        get = data.get
+        email_address = get('emailAddress')
         return cls(
-            permission_id=permission_id,
+            permission_id=PermissionId(data['id']),
             role=role,
             permission_type=permission_type,
-            email=email,
-            display_name=display_name,
-            domain=domain,
-            deleted=deleted
+            email=Email.try_parse(email_address) if email_address else None,
+            display_name=get('displayName'),
+            domain=get('domain'),
+            deleted=get('deleted', False)
         )
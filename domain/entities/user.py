@@ -15,6 +15,8 @@ class User:
     needs to be managed.
     """
     
+    __slots__ = ('_email', '_display_name', '_is_active', '_hash')
+    
     def __init__(
         self,
         email: Email,
@@ -30,6 +32,7 @@ class User:
             is_active: Whether user is active in the organization
         """
         self._email = email
+        self._hash = hash(email)
         self._display_name = display_name or str(email)
         self._is_active = is_active
     
@@ -69,7 +72,7 @@ class User:
     
     def __hash__(self) -> int:
         """Hash based on email"""
-        return hash(self._email)
+        return self._hash
     
     def __str__(self) -> str:
         """String representation"""
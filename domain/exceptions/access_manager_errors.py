@@ -3,6 +3,7 @@ Access Manager Custom Exceptions
 Hierarchical exception structure for better error handling
 """
 
+import time
 from typing import Optional, Dict, Any
 from datetime import datetime
 
@@ -13,6 +14,10 @@ class AccessManagerError(Exception):
     
     All custom exceptions inherit from this base class.
     Provides consistent error handling and context tracking.
+    
+    Only the raw wall-clock time is recorded at construction; the
+    timestamp datetime is built when first read, since most errors are
+    caught and handled without ever looking at it.
     """
     
     def __init__(self, message: str, context: Optional[Dict[str, Any]] = None):
@@ -26,7 +31,15 @@ class AccessManagerError(Exception):
         super().__init__(message)
         self.message = message
         self.context = context or {}
-        self.timestamp = datetime.now()
+        self._created_ns = time.time_ns()
+        self._timestamp: Optional[datetime] = None
+    
+    @property
+    def timestamp(self) -> datetime:
+        """Get the local time at which the error was created"""
+        if self._timestamp is None:
+            self._timestamp = datetime.fromtimestamp(self._created_ns / 1_000_000_000)
+        return self._timestamp
     
     def __str__(self) -> str:
         """String representation"""
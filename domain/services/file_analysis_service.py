@@ -3,21 +3,88 @@ File Analysis Service
 Domain service for analyzing file access patterns
 """
 
-from typing import List, Dict, Any
-from collections import defaultdict
+import heapq
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator, List, Dict, Any, Optional, Tuple
+
+try:
+    import numpy as np  # type: ignore
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    np = None  # type: ignore
+
 from domain.entities.drive_file import DriveFile
+from domain.entities.permission import Permission
 from domain.value_objects.email import Email
 
 
+# Below this many files the NumPy conversion costs more than it saves
+_VECTORIZE_THRESHOLD = 50_000
+
+# Lower bounds of the limited (1-5), moderate (6-20) and wide (21+) levels
+_SHARING_LEVEL_BOUNDS = (1, 6, 21)
+
+
+@dataclass(slots=True)
+class FileClassification:
+    """How a file shared with a user should be handled for that user"""
+    file: DriveFile
+    is_owner: bool
+    revocable_permissions: List[Permission] = field(default_factory=list)
+    skip_reason: Optional[str] = None
+
+
+class UserAccessIndex:
+    """
+    Reverse index from email to the files a user owns or is shared on
+    
+    Built once per file snapshot so that summaries for many users don't
+    each rescan every file. Files appear in snapshot order, and each file
+    is paired with the user's first permission on it.
+    """
+    
+    __slots__ = ('owned', 'shared')
+    
+    def __init__(self, files: Iterable[DriveFile]):
+        """
+        Build the index
+        
+        Args:
+            files: Files to index
+        """
+        self.owned: Dict[Email, List[DriveFile]] = {}
+        self.shared: Dict[Email, List[Tuple[DriveFile, Permission]]] = {}
+        
+        owned = self.owned
+        shared = self.shared
+        for file in files:
+            for owner in file.owners:
+                owner_files = owned.setdefault(owner, [])
+                if not owner_files or owner_files[-1] is not file:
+                    owner_files.append(file)
+            for permission in file.permissions:
+                email = permission.email
+                if email is None:
+                    continue
+                entries = shared.setdefault(email, [])
+                # A file's permissions are contiguous: keep only the first
+                if not entries or entries[-1][0] is not file:
+                    entries.append((file, permission))
+
+
 class FileAnalysisService:
     """
     File Analysis Service (Domain Service)
     
     Analyzes file access patterns and sharing relationships.
+    
+    The service is stateless: every method is a static method, callable on
+    the class or through an injected instance without binding.
     """
     
+    @staticmethod
     def analyze_file_sharing_patterns(
-        self,
         files: List[DriveFile]
     ) -> Dict[str, Any]:
         """
@@ -30,45 +97,132 @@ class FileAnalysisService:
             Dictionary with sharing pattern statistics
         """
         total_files = len(files)
-        shared_files = sum(1 for f in files if f.shared)
-        total_permissions = sum(len(f.permissions) for f in files)
         
-        # Analyze by MIME type
-        files_by_type = defaultdict(int)
-        for file in files:
-            files_by_type[file.mime_type] += 1
+        if NUMPY_AVAILABLE and total_files >= _VECTORIZE_THRESHOLD:
+            stats = FileAnalysisService._sharing_stats_vectorized(files)
+        else:
+            stats = FileAnalysisService._sharing_stats(files)
+        shared_files, total_permissions, files_by_type, levels = stats
+        not_shared, limited, moderate, wide = levels
         
-        # Analyze sharing levels
         sharing_levels = {
-            'not_shared': 0,
-            'limited_sharing': 0,  # 1-5 people
-            'moderate_sharing': 0,  # 6-20 people
-            'wide_sharing': 0  # 20+ people
+            'not_shared': not_shared,
+            'limited_sharing': limited,  # 1-5 people
+            'moderate_sharing': moderate,  # 6-20 people
+            'wide_sharing': wide  # 20+ people
         }
         
-        for file in files:
-            perm_count = len(file.permissions)
-            if perm_count == 0 or not file.shared:
-                sharing_levels['not_shared'] += 1
-            elif perm_count <= 5:
-                sharing_levels['limited_sharing'] += 1
-            elif perm_count <= 20:
-                sharing_levels['moderate_sharing'] += 1
-            else:
-                sharing_levels['wide_sharing'] += 1
-        
         return {
             'total_files': total_files,
             'shared_files': shared_files,
             'unshared_files': total_files - shared_files,
             'total_permissions': total_permissions,
             'avg_permissions_per_file': total_permissions / total_files if total_files > 0 else 0,
-            'files_by_type': dict(files_by_type),
+            'files_by_type': files_by_type,
             'sharing_levels': sharing_levels
         }
     
+    @staticmethod
+    def _sharing_stats(
+        files: List[DriveFile]
+    ) -> Tuple[int, int, Dict[str, int], Tuple[int, int, int, int]]:
+        """
+        Compute sharing statistics in a single pure-Python pass
+        
+        Args:
+            files: List of files to analyze
+            
+        Returns:
+            Tuple of (shared files, total permissions, files by type,
+            (not shared, limited, moderate, wide) sharing level counts)
+        """
+        shared_files = 0
+        total_permissions = 0
+        files_by_type: Dict[str, int] = {}
+        not_shared = limited = moderate = wide = 0
+        
+        for file in files:
+            shared = file.shared
+            perm_count = file.permission_count
+            mime_type = file.mime_type
+            
+            if shared:
+                shared_files += 1
+            total_permissions += perm_count
+            files_by_type[mime_type] = files_by_type.get(mime_type, 0) + 1
+            
+            if perm_count == 0 or not shared:
+                not_shared += 1
+            elif perm_count <= 5:
+                limited += 1
+            elif perm_count <= 20:
+                moderate += 1
+            else:
+                wide += 1
+        
+        return shared_files, total_permissions, files_by_type, (not_shared, limited, moderate, wide)
+    
+    @staticmethod
+    def _to_soa(files: List[DriveFile]) -> Tuple[Any, Any, Any, List[str]]:
+        """
+        Extract the fields used by the sharing statistics into NumPy arrays
+        
+        Args:
+            files: List of files to convert
+            
+        Returns:
+            Tuple of (permission counts, shared flags, MIME type ids, MIME
+            type vocabulary indexed by id, in first-seen order)
+        """
+        count = len(files)
+        mime_ids: Dict[str, int] = {}
+        
+        perm_counts = np.fromiter((f.permission_count for f in files), dtype=np.int32, count=count)
+        shared = np.fromiter((f.shared for f in files), dtype=np.bool_, count=count)
+        mime_type_ids = np.fromiter(
+            (mime_ids.setdefault(f.mime_type, len(mime_ids)) for f in files),
+            dtype=np.int32,
+            count=count
+        )
+        return perm_counts, shared, mime_type_ids, list(mime_ids)
+    
+    @staticmethod
+    def _sharing_stats_vectorized(
+        files: List[DriveFile]
+    ) -> Tuple[int, int, Dict[str, int], Tuple[int, int, int, int]]:
+        """
+        Compute sharing statistics with NumPy reductions
+        
+        Produces the same result as _sharing_stats.
+        
+        Args:
+            files: List of files to analyze
+            
+        Returns:
+            Same tuple as _sharing_stats
+        """
+        perm_counts, shared, mime_type_ids, mime_vocab = FileAnalysisService._to_soa(files)
+        
+        # Level 0 covers unshared files and files without permissions
+        levels = np.digitize(perm_counts, _SHARING_LEVEL_BOUNDS)
+        levels[~shared] = 0
+        level_counts = np.bincount(levels, minlength=4)
+        
+        type_counts = np.bincount(mime_type_ids, minlength=len(mime_vocab))
+        files_by_type = {
+            mime_type: int(type_count)
+            for mime_type, type_count in zip(mime_vocab, type_counts)
+        }
+        
+        return (
+            int(np.count_nonzero(shared)),
+            int(perm_counts.sum(dtype=np.int64)),
+            files_by_type,
+            tuple(int(level_count) for level_count in level_counts)
+        )
+    
+    @staticmethod
     def find_most_shared_files(
-        self,
         files: List[DriveFile],
         limit: int = 10
     ) -> List[DriveFile]:
@@ -82,16 +236,11 @@ class FileAnalysisService:
         Returns:
             List of most shared files
         """
-        sorted_files = sorted(
-            files,
-            key=lambda f: len(f.permissions),
-            reverse=True
-        )
-        
-        return sorted_files[:limit]
+        # Partial selection: O(N log limit) instead of sorting every file
+        return heapq.nlargest(limit, files, key=lambda f: f.permission_count)
     
+    @staticmethod
     def find_files_owned_by(
-        self,
         files: List[DriveFile],
         owner_email: Email
     ) -> List[DriveFile]:
@@ -107,8 +256,8 @@ class FileAnalysisService:
         """
         return [f for f in files if f.is_owned_by(owner_email)]
     
+    @staticmethod
     def find_files_shared_with(
-        self,
         files: List[DriveFile],
         user_email: Email
     ) -> List[DriveFile]:
@@ -122,10 +271,108 @@ class FileAnalysisService:
         Returns:
             List of files shared with the user
         """
-        return [f for f in files if f.is_shared_with(user_email)]
+        return list(FileAnalysisService.iter_files_shared_with(files, user_email))
     
+    @staticmethod
+    def iter_files_shared_with(
+        files: Iterable[DriveFile],
+        user_email: Email
+    ) -> Iterator[DriveFile]:
+        """
+        Lazily filter files shared with a specific user
+        
+        Args:
+            files: Iterable of files to search (may be a one-shot stream)
+            user_email: User email to find
+            
+        Returns:
+            Iterator of files shared with the user
+        """
+        return (f for f in files if f.is_shared_with(user_email))
+    
+    @staticmethod
+    def iter_user_permissions(
+        files: Iterable[DriveFile],
+        user_email: Email
+    ) -> Iterator[Tuple[DriveFile, Permission]]:
+        """
+        Lazily pair each file shared with a user with the user's permission
+        
+        Filtering and permission lookup share one pass over each file's
+        permissions, so callers don't need get_permission_for_user again.
+        
+        Args:
+            files: Iterable of files to search (may be a one-shot stream)
+            user_email: User email to find
+            
+        Returns:
+            Iterator of (file, user permission) pairs
+        """
+        for file in files:
+            permission = file.get_permission_for_user(user_email)
+            if permission is not None:
+                yield file, permission
+    
+    @staticmethod
+    def classify_for_user(
+        files: Iterable[DriveFile],
+        user_email: Email
+    ) -> Iterator[FileClassification]:
+        """
+        Lazily classify the files shared with a user for revocation
+        
+        Filtering, the ownership check and the revocable-permission lookup
+        share one pass over each file's permissions. Files not shared with
+        the user are dropped.
+        
+        Args:
+            files: Iterable of files to search (may be a one-shot stream)
+            user_email: User email to classify for
+            
+        Returns:
+            Iterator of FileClassification, one per shared file
+        """
+        for file in files:
+            is_owner = file.is_owned_by(user_email)
+            shared = False
+            revocable: List[Permission] = []
+            
+            for permission in file.permissions:
+                if not permission.belongs_to_user(user_email):
+                    continue
+                shared = True
+                if not is_owner and permission.can_be_revoked():
+                    revocable.append(permission)
+            
+            if not shared:
+                continue
+            
+            yield FileClassification(
+                file=file,
+                is_owner=is_owner,
+                revocable_permissions=revocable,
+                skip_reason='User is owner - cannot revoke ownership' if is_owner else None
+            )
+    
+    @staticmethod
+    def find_user_permissions(
+        files: Iterable[DriveFile],
+        user_email: Email
+    ) -> List[Tuple[DriveFile, Permission]]:
+        """
+        Pair each file shared with a user with the user's permission
+        
+        Args:
+            files: Files to search
+            user_email: User email to find
+            
+        Returns:
+            List of (file, user permission) pairs
+        """
+        return list(FileAnalysisService.iter_user_permissions(files, user_email))
+    
+    @staticmethod
     def get_user_access_summary(
-        self,
         files: List[DriveFile],
         user_email: Email
     ) -> Dict[str, Any]:
@@ -139,26 +386,76 @@ class FileAnalysisService:
         Returns:
             Dictionary with access summary
         """
-        owned_files = self.find_files_owned_by(files, user_email)
-        shared_files = self.find_files_shared_with(files, user_email)
-        
-        # Analyze permission types for shared files
-        permission_roles = defaultdict(int)
-        for file in shared_files:
+        # One pass: owner check and permission lookup are both O(1) per file
+        owned_count = 0
+        shared_count = 0
+        permission_roles: Dict[str, int] = {}
+        for file in files:
+            if file.is_owned_by(user_email):
+                owned_count += 1
             perm = file.get_permission_for_user(user_email)
-            if perm:
-                permission_roles[str(perm.role)] += 1
+            if perm is not None:
+                shared_count += 1
+                role = str(perm.role)
+                permission_roles[role] = permission_roles.get(role, 0) + 1
         
         return {
             'user_email': str(user_email),
-            'total_owned_files': len(owned_files),
-            'total_shared_files': len(shared_files),
-            'permission_breakdown': dict(permission_roles),
-            'has_ownership_access': len(owned_files) > 0
+            'total_owned_files': owned_count,
+            'total_shared_files': shared_count,
+            'permission_breakdown': permission_roles,
+            'has_ownership_access': owned_count > 0
         }
     
+    @staticmethod
+    def build_user_access_index(files: Iterable[DriveFile]) -> UserAccessIndex:
+        """
+        Index a file snapshot for repeated per-user summaries
+        
+        Args:
+            files: Files to index
+            
+        Returns:
+            UserAccessIndex for use with summarize_user_access
+        """
+        return UserAccessIndex(files)
+    
+    @staticmethod
+    def summarize_user_access(
+        index: UserAccessIndex,
+        user_email: Email
+    ) -> Dict[str, Any]:
+        """
+        Get the access summary for a user from a prebuilt index
+        
+        Returns the same dictionary as get_user_access_summary, in time
+        proportional to the user's own files rather than the snapshot.
+        
+        Args:
+            index: Index built by build_user_access_index
+            user_email: User email
+            
+        Returns:
+            Dictionary with access summary
+        """
+        owned_count = len(index.owned.get(user_email, ()))
+        shared = index.shared.get(user_email, ())
+        
+        permission_roles: Dict[str, int] = {}
+        for _, perm in shared:
+            role = str(perm.role)
+            permission_roles[role] = permission_roles.get(role, 0) + 1
+        
+        return {
+            'user_email': str(user_email),
+            'total_owned_files': owned_count,
+            'total_shared_files': len(shared),
+            'permission_breakdown': permission_roles,
+            'has_ownership_access': owned_count > 0
+        }
+    
+    @staticmethod
     def identify_orphaned_files(
-        self,
         files: List[DriveFile]
     ) -> List[DriveFile]:
         """
@@ -170,10 +467,4 @@ class FileAnalysisService:
         Returns:
             List of potentially orphaned files
         """
-        orphaned = []
-        
-        for file in files:
-            if not file.owners or len(file.owners) == 0:
-                orphaned.append(file)
-        
-        return orphaned
+        return [f for f in files if not f.has_owners]
@@ -7,6 +7,20 @@ from typing import List, Optional
 from domain.entities.drive_file import DriveFile
 from domain.entities.permission import Permission
 from domain.value_objects.email import Email
+from domain.value_objects.permission_role import PermissionRole
+
+
+def _risk_bucket(role: PermissionRole) -> int:
+    """Get the risk bucket for a role: 0 high, 1 medium, 2 low"""
+    if role.is_ownership_role or role.can_edit:
+        return 0
+    if role.can_comment:
+        return 1
+    return 2
+
+
+# Role -> index into (high, medium, low) risk lists
+_RISK_BUCKET = {role: _risk_bucket(role) for role in PermissionRole}
 
 
 class PermissionService:
@@ -64,16 +78,23 @@ class PermissionService:
         revocable_count = 0
         non_revocable_count = 0
         
+        # One visit per file; each check is a lookup in the file's owner set
+        # or email -> permissions index rather than a permission scan
         for file in files:
-            if file.is_shared_with(target_user_email):
-                files_with_access += 1
-                
-                if file.can_revoke_permission_for(target_user_email):
-                    revocable_permissions = file.get_revocable_permissions_for_user(target_user_email)
-                    revocable_count += len(revocable_permissions)
-                else:
-                    # User is owner - cannot revoke
-                    non_revocable_count += 1
+            if not file.is_shared_with(target_user_email):
+                continue
+            files_with_access += 1
+            
+            if file.is_owned_by(target_user_email):
+                revocable_here = 0
+            else:
+                revocable_here = len(file.get_revocable_permissions_for_user(target_user_email))
+            
+            if revocable_here:
+                revocable_count += revocable_here
+            else:
+                # User is owner or holds no revocable permission
+                non_revocable_count += 1
         
         return {
             'total_files': total_files,
@@ -99,13 +120,11 @@ class PermissionService:
         medium_risk = []  # Commenter permissions
         low_risk = []  # Reader permissions
         
+        # One table lookup per permission instead of a chain of role checks
+        appenders = (high_risk.append, medium_risk.append, low_risk.append)
+        bucket_of = _RISK_BUCKET
         for perm in permissions:
-            if perm.role.is_ownership_role or perm.role.can_edit:
-                high_risk.append(perm)
-            elif perm.role.can_comment:
-                medium_risk.append(perm)
-            else:
-                low_risk.append(perm)
+            appenders[bucket_of[perm.role]](perm)
         
         return {
             'high_risk': high_risk,
@@ -133,7 +152,7 @@ class PermissionService:
             return True
         
         # Notify if file has been shared extensively
-        if len(file.permissions) > 10:
+        if file.permission_count > 10:
             return True
         
         return False
@@ -4,7 +4,12 @@ Immutable email address with validation
 """
 
 import re
-from typing import Optional
+import threading
+from typing import Dict, Optional
+
+
+# Upper bound on distinct addresses kept in the intern table
+_INTERN_SIZE = 8192
 
 
 class Email:
@@ -13,20 +18,36 @@ class Email:
     
     Immutable object representing an email address.
     Ensures email format is valid upon creation.
+    
+    Instances are interned by normalized address: constructing an email
+    that was seen recently returns the existing object without validating
+    it again, so equal emails are usually the same object.
     """
     
     # RFC 5322 simplified email pattern
     EMAIL_PATTERN = re.compile(
-        r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
+        r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}',
+        re.ASCII
     )
+    _MATCH = EMAIL_PATTERN.fullmatch
     
-    def __init__(self, value: str):
+    # Longest address allowed by RFC 5321
+    MAX_LENGTH = 254
+    
+    # Normalized address -> instance, evicted oldest-first
+    _INTERN: Dict[str, 'Email'] = {}
+    _INTERN_LOCK = threading.Lock()
+    
+    def __new__(cls, value: str) -> 'Email':
         """
-        Initialize email with validation
+        Get the email for an address, validating it on first sight
         
         Args:
             value: Email address string
             
+        Returns:
+            Interned Email instance
+            
         Raises:
             ValueError: If email format is invalid
         """
@@ -36,10 +57,38 @@ class Email:
         # Normalize email (lowercase)
         normalized = value.strip().lower()
         
-        if not self.EMAIL_PATTERN.match(normalized):
+        email = cls._INTERN.get(normalized)
+        if email is not None and type(email) is cls:
+            return email
+        
+        # Cheap checks reject obvious garbage before running the regex
+        if ('@' not in normalized or len(normalized) > cls.MAX_LENGTH
+                or not cls._MATCH(normalized)):
             raise ValueError(f"Invalid email format: {value}")
         
-        self._value = normalized
+        email = super().__new__(cls)
+        email._value = normalized
+        # Split once here; domain and local_part are read per permission
+        email._local, _, email._domain = normalized.partition('@')
+        
+        with cls._INTERN_LOCK:
+            intern = cls._INTERN
+            if len(intern) >= _INTERN_SIZE:
+                del intern[next(iter(intern))]
+            intern[normalized] = email
+        return email
+    
+    def __init__(self, value: str):
+        """
+        Initialize email (validation and normalization happen in __new__)
+        
+        Args:
+            value: Email address string
+        """
+    
+    def __reduce__(self):
+        """Pickle by address so unpickling goes through the intern table"""
+        return (self.__class__, (self._value,))
     
     @property
     def value(self) -> str:
@@ -49,12 +98,12 @@ class Email:
     @property
     def domain(self) -> str:
         """Extract domain from email"""
-        return self._value.split('@')[1]
+        return self._domain
     
     @property
     def local_part(self) -> str:
         """Extract local part (before @) from email"""
-        return self._value.split('@')[0]
+        return self._local
     
     def equals(self, other: 'Email') -> bool:
         """
@@ -72,6 +121,8 @@ class Email:
     
     def __eq__(self, other) -> bool:
         """Equality operator"""
+        if other is self:
+            return True
         if isinstance(other, Email):
             return self._value == other._value
         if isinstance(other, str):
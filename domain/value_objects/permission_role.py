@@ -7,13 +7,27 @@ from enum import Enum
 from typing import Optional
 
 
+# Role values granting each capability; resolved once per member below
+_EDIT_ROLE_VALUES = frozenset({'owner', 'organizer', 'fileOrganizer', 'writer'})
+_COMMENT_ROLE_VALUES = _EDIT_ROLE_VALUES | {'commenter'}
+_OWNERSHIP_ROLE_VALUES = frozenset({'owner', 'organizer'})
+
+
 class PermissionRole(Enum):
     """
     Google Drive permission roles
     
     Defines the access levels for Drive permissions.
+    
+    Capability flags (can_edit, can_comment, is_ownership_role) are plain
+    member attributes set at class creation, so checking them in
+    per-permission loops is a single attribute load.
     """
     
+    can_edit: bool
+    can_comment: bool
+    is_ownership_role: bool
+    
     OWNER = "owner"
     ORGANIZER = "organizer"  # For shared drives
     FILE_ORGANIZER = "fileOrganizer"  # For shared drives
@@ -21,40 +35,17 @@ class PermissionRole(Enum):
     COMMENTER = "commenter"
     READER = "reader"
     
-    @property
-    def can_edit(self) -> bool:
-        """Check if role can edit content"""
-        return self in [
-            PermissionRole.OWNER,
-            PermissionRole.ORGANIZER,
-            PermissionRole.FILE_ORGANIZER,
-            PermissionRole.WRITER
-        ]
-    
-    @property
-    def can_comment(self) -> bool:
-        """Check if role can add comments"""
-        return self in [
-            PermissionRole.OWNER,
-            PermissionRole.ORGANIZER,
-            PermissionRole.FILE_ORGANIZER,
-            PermissionRole.WRITER,
-            PermissionRole.COMMENTER
-        ]
+    def __init__(self, value: str):
+        """Resolve the capability flags for this role"""
+        self.can_edit = value in _EDIT_ROLE_VALUES
+        self.can_comment = value in _COMMENT_ROLE_VALUES
+        self.is_ownership_role = value in _OWNERSHIP_ROLE_VALUES
     
     @property
     def can_view(self) -> bool:
         """Check if role can view content"""
         return True  # All roles can view
     
-    @property
-    def is_ownership_role(self) -> bool:
-        """Check if role represents ownership"""
-        return self in [
-            PermissionRole.OWNER,
-            PermissionRole.ORGANIZER
-        ]
-    
     @classmethod
     def from_string(cls, value: str) -> 'PermissionRole':
         """
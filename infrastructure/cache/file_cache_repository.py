@@ -0,0 +1,523 @@
+"""
+File Cache Repository
+File-based cache with TTL, stored as one file per cache key
+"""
+
+import atexit
+import functools
+import gzip
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from application.interfaces.repositories import ICacheRepository
+from domain.exceptions.access_manager_errors import CacheError
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+
+_logger = logging.getLogger(__name__)
+
+# Index of cache keys -> shard file name and expiry
+_METADATA_FILE = "cache_metadata.json"
+
+# zstd compression level (fast, with most of the size reduction)
+_ZSTD_LEVEL = 3
+
+# Background threads serializing and writing shards
+_IO_WORKERS = 2
+
+# Repositories not yet closed, closed together at interpreter exit (weak
+# references, so an abandoned repository can still be garbage collected)
+_open_repositories: "weakref.WeakSet[FileCacheRepository]" = weakref.WeakSet()
+
+
+@atexit.register
+def _close_open_repositories() -> None:
+    """Close every repository still open at interpreter exit"""
+    for repository in list(_open_repositories):
+        repository.close()
+
+
+@functools.lru_cache(maxsize=1024)
+def _key_digest(key: str) -> str:
+    """Hash a cache key into a file-name-safe digest (memoized per key)"""
+    return hashlib.blake2s(key.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def _dumps(data: Any) -> bytes:
+    """Serialize data to compact JSON bytes (orjson if available)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def _loads(payload: bytes) -> Any:
+    """Deserialize JSON bytes (orjson if available)"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
+
+def _decompress(file_name: str, payload: bytes) -> bytes:
+    """
+    Decompress a shard according to its file extension
+    
+    Raises:
+        ValueError: If the shard is zstd-compressed and zstandard is not
+            installed, or the data is corrupt
+    """
+    if file_name.endswith('.zst'):
+        if not ZSTD_AVAILABLE:
+            raise ValueError("zstandard is required to read this cache entry")
+        try:
+            return zstandard.ZstdDecompressor().decompress(payload)
+        except zstandard.ZstdError as e:
+            raise ValueError(str(e))
+    if file_name.endswith('.gz'):
+        try:
+            return gzip.decompress(payload)
+        except (OSError, EOFError) as e:
+            raise ValueError(str(e))
+    return payload
+
+
+class FileCacheRepository(ICacheRepository):
+    """
+    File Cache Repository
+    
+    Concrete implementation of ICacheRepository backed by the local
+    filesystem. Each key is stored in its own shard file, so saving,
+    loading or invalidating one key never rewrites the others. A small
+    metadata file records each key's shard and expiry.
+    
+    The metadata index is read once and kept in memory. Changes are
+    written back after each operation, or once at the end of a batch()
+    block, and any unflushed change is written at interpreter exit.
+    
+    Cached data must be JSON-serializable. Serialization uses orjson when
+    it is installed and falls back to the standard json module; shards
+    are compressed with zstd when zstandard is installed, otherwise gzip.
+    Entries written with either compressor remain readable while the
+    matching library is installed; rewriting a key replaces its shard in
+    the current format, and a shard that can no longer be read is dropped
+    on load.
+    
+    save() serializes and writes in a background thread and returns a
+    Future, so the caller can continue while a large entry is persisted.
+    Data passed to save() must not be modified until its write completes.
+    Reads and invalidations of a key wait for that key's pending write;
+    wait() waits for all of them, and close() runs at interpreter exit
+    for repositories still open. Failed writes nobody waited for are
+    logged.
+    """
+    
+    def __init__(self, cache_dir: str = "cache", compression_enabled: bool = True):
+        """
+        Initialize file cache repository
+        
+        Args:
+            cache_dir: Directory for cache files
+            compression_enabled: Whether to compress cached data (zstd if
+                installed, otherwise gzip)
+        """
+        self._cache_dir = Path(cache_dir)
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+        self._compression_enabled = compression_enabled
+        self._metadata_path = self._cache_dir / _METADATA_FILE
+        
+        self._metadata = self._read_metadata()
+        self._dirty = False
+        self._batch_depth = 0
+        self._lock = threading.RLock()
+        
+        self._io_pool = ThreadPoolExecutor(max_workers=_IO_WORKERS, thread_name_prefix="cache-io")
+        self._pending: Dict[str, Future] = {}
+        _open_repositories.add(self)
+    
+    def save(self, key: str, data: Any, ttl: Optional[timedelta] = None) -> Future:
+        """
+        Save data to cache in the background
+        
+        A previous pending write of the same key is completed first, so
+        writes to one key are applied in order. If that write failed, the
+        failure is logged and superseded by this one.
+        
+        Args:
+            key: Cache key
+            data: JSON-serializable data to cache (must not be modified
+                until the write completes)
+            ttl: Time to live (None for no expiry)
+            
+        Returns:
+            Future resolving once the entry is written; result() raises
+            CacheError if the save failed
+        """
+        try:
+            self._wait_for(key)
+        except CacheError as e:
+            _logger.warning("Superseding failed cache write of %s: %s", key, e)
+        future = self._io_pool.submit(self._save_sync, key, data, ttl)
+        self._pending[key] = future
+        return future
+    
+    def _save_sync(self, key: str, data: Any, ttl: Optional[timedelta]) -> None:
+        """
+        Serialize, compress and write one cache entry
+        
+        Args:
+            key: Cache key
+            data: JSON-serializable data to cache
+            ttl: Time to live (None for no expiry)
+            
+        Raises:
+            CacheError: If save operation fails
+        """
+        shard = self._shard_name(key)
+        now = datetime.now()
+        
+        try:
+            payload = self._compress(_dumps(data))
+            self._write_file(self._cache_dir / shard, payload)
+            
+            with self._lock:
+                # A changed naming scheme or compression setting gives the key
+                # a new shard; remove the one the old entry pointed to
+                previous = self._metadata.get(key)
+                if previous is not None and previous['file'] != shard:
+                    (self._cache_dir / previous['file']).unlink(missing_ok=True)
+                
+                self._metadata[key] = {
+                    'file': shard,
+                    'created_at': now.isoformat(),
+                    'expires_at': (now + ttl).isoformat() if ttl else None,
+                    'expires_at_ts': now.timestamp() + ttl.total_seconds() if ttl else None,
+                    'size': len(payload),
+                    'items': len(data) if isinstance(data, (list, dict)) else None
+                }
+                self._mark_dirty()
+            
+            if _logger.isEnabledFor(logging.DEBUG):
+                _logger.debug("Cached %s in %s (%.1f KB)", key, shard, len(payload) / 1024)
+        except (TypeError, ValueError, OSError) as e:
+            raise CacheError(
+                f"Failed to save cache entry: {e}",
+                cache_key=key,
+                operation="save"
+            )
+    
+    def load(self, key: str) -> Optional[Any]:
+        """
+        Load data from cache
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            Cached data or None if not found/expired
+            
+        Raises:
+            CacheError: If a pending write of this key failed
+        """
+        self._wait_for(key)
+        entry = self._metadata.get(key)
+        if entry is None:
+            return None
+        
+        if self._is_expired(entry):
+            _logger.debug("Cache entry %s expired", key)
+            self.invalidate(key)
+            return None
+        
+        try:
+            payload = (self._cache_dir / entry['file']).read_bytes()
+            return _loads(_decompress(entry['file'], payload))
+        except (OSError, ValueError) as e:
+            # Missing, corrupt or (zstd without zstandard) undecodable shard:
+            # treat as a cache miss and drop the entry so the file isn't orphaned
+            _logger.warning("Dropping unreadable cache entry %s: %s", key, e)
+            self.invalidate(key)
+            return None
+    
+    def invalidate(self, key: str) -> None:
+        """
+        Invalidate cached data
+        
+        Args:
+            key: Cache key
+        """
+        self._discard_pending(key)
+        with self._lock:
+            entry = self._metadata.pop(key, None)
+            if entry is None:
+                return
+            
+            (self._cache_dir / entry['file']).unlink(missing_ok=True)
+            self._mark_dirty()
+    
+    def is_valid(self, key: str) -> bool:
+        """
+        Check if cache entry is valid
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            True if cache entry exists and is not expired
+        """
+        self._discard_pending(key)
+        entry = self._metadata.get(key)
+        if entry is None or self._is_expired(entry):
+            return False
+        
+        return (self._cache_dir / entry['file']).exists()
+    
+    def get_info(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Describe a cache entry without reading its data
+        
+        Only the metadata index is read, so this stays cheap however large
+        the cached payload is.
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            Dictionary with created_at, expires_at, size (bytes on disk),
+            items (top-level length, if a list or dict) and valid, or None
+            if the key is not cached
+        """
+        self._discard_pending(key)
+        entry = self._metadata.get(key)
+        if entry is None:
+            return None
+        
+        return {
+            'key': key,
+            'created_at': entry['created_at'],
+            'expires_at': entry.get('expires_at'),
+            'size': entry.get('size'),
+            'items': entry.get('items'),
+            'valid': not self._is_expired(entry)
+        }
+    
+    def clear_all(self) -> None:
+        """Clear all cached data"""
+        self._settle_pending()
+        with self._lock:
+            for entry in self._metadata.values():
+                (self._cache_dir / entry['file']).unlink(missing_ok=True)
+            
+            self._metadata = {}
+            self._dirty = False
+            self._metadata_path.unlink(missing_ok=True)
+    
+    def invalidate_prefix(self, prefix: str) -> None:
+        """
+        Invalidate every entry whose key starts with prefix
+        
+        Args:
+            prefix: Cache key prefix
+        """
+        self._settle_pending()
+        with self._lock:
+            stale = [key for key in self._metadata if key.startswith(prefix)]
+            if not stale:
+                return
+            
+            for key in stale:
+                (self._cache_dir / self._metadata.pop(key)['file']).unlink(missing_ok=True)
+            self._mark_dirty()
+    
+    def mset(self, items: Dict[str, Tuple[Any, Optional[timedelta]]]) -> None:
+        """
+        Save several cache entries with a single metadata write
+        
+        The entries are written concurrently and this returns once all of
+        them are on disk.
+        
+        Args:
+            items: Mapping of key to (data, ttl)
+            
+        Raises:
+            CacheError: If a save operation fails
+        """
+        with self.batch():
+            super().mset(items)
+            self.wait()
+    
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        Defer metadata writes until the outermost batch block exits
+        
+        Example:
+            with cache.batch():
+                for key, data in entries:
+                    cache.save(key, data)
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self.flush_metadata()
+    
+    def flush_metadata(self) -> None:
+        """Write the metadata index if it has unsaved changes"""
+        with self._lock:
+            if not self._dirty:
+                return
+            
+            self._write_file(self._metadata_path, _dumps(self._metadata))
+            self._dirty = False
+    
+    def wait(self) -> None:
+        """
+        Wait for all pending background writes
+        
+        Raises:
+            CacheError: If any pending write failed (the first failure is
+                raised once all writes have finished)
+        """
+        pending, self._pending = self._pending, {}
+        error = None
+        for future in pending.values():
+            try:
+                future.result()
+            except CacheError as e:
+                error = error or e
+        if error is not None:
+            raise error
+    
+    def close(self) -> None:
+        """
+        Finish pending writes, flush metadata and stop the writer threads
+        
+        Failed background writes are logged rather than raised.
+        """
+        _open_repositories.discard(self)
+        self._settle_pending()
+        self.flush_metadata()
+        self._io_pool.shutdown(wait=True)
+    
+    def _wait_for(self, key: str) -> None:
+        """
+        Wait for the pending write of one key, if any
+        
+        Raises:
+            CacheError: If the pending write failed
+        """
+        future = self._pending.pop(key, None)
+        if future is not None:
+            future.result()
+    
+    def _discard_pending(self, key: str) -> None:
+        """Wait for the pending write of one key, logging failure"""
+        try:
+            self._wait_for(key)
+        except CacheError as e:
+            _logger.warning("Discarding failed cache write of %s: %s", key, e)
+    
+    def _settle_pending(self) -> None:
+        """Wait for all pending writes, logging failures"""
+        pending, self._pending = self._pending, {}
+        for key, future in pending.items():
+            try:
+                future.result()
+            except CacheError as e:
+                _logger.warning("Background cache write of %s failed: %s", key, e)
+    
+    def _shard_name(self, key: str) -> str:
+        """
+        Get the shard file name for a cache key
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            File name inside the cache directory
+        """
+        digest = _key_digest(key)
+        if not self._compression_enabled:
+            return f"{digest}.json"
+        return f"{digest}.json.zst" if ZSTD_AVAILABLE else f"{digest}.json.gz"
+    
+    def _compress(self, payload: bytes) -> bytes:
+        """Compress a serialized shard to match _shard_name's extension"""
+        if not self._compression_enabled:
+            return payload
+        if ZSTD_AVAILABLE:
+            return zstandard.ZstdCompressor(level=_ZSTD_LEVEL).compress(payload)
+        return gzip.compress(payload)
+    
+    @staticmethod
+    def _is_expired(entry: Dict[str, Any]) -> bool:
+        """
+        Check whether a metadata entry has passed its expiry
+        
+        Compares the epoch expiry against a single time.time() read.
+        Entries written before expires_at_ts was recorded have expires_at
+        parsed once and the timestamp stored back on the entry.
+        """
+        expires_at_ts = entry.get('expires_at_ts')
+        if expires_at_ts is None:
+            expires_at = entry.get('expires_at')
+            if expires_at is None:
+                return False
+            expires_at_ts = entry['expires_at_ts'] = datetime.fromisoformat(expires_at).timestamp()
+        
+        return expires_at_ts <= time.time()
+    
+    def _read_metadata(self) -> Dict[str, Dict[str, Any]]:
+        """Read the key index (empty if missing or unreadable)"""
+        try:
+            return _loads(self._metadata_path.read_bytes())
+        except (OSError, ValueError):
+            return {}
+    
+    def _mark_dirty(self) -> None:
+        """Record a metadata change, writing it now unless batching"""
+        self._dirty = True
+        if self._batch_depth == 0:
+            self.flush_metadata()
+    
+    @staticmethod
+    def _write_file(path: Path, payload: bytes) -> None:
+        """
+        Replace a file's contents atomically
+        
+        Data is written to a temporary file, synced to disk and then
+        renamed over the target, so neither readers nor a crash mid-write
+        can leave a truncated or partially written file behind.
+        
+        Args:
+            path: File to write
+            payload: New file contents
+        """
+        tmp_path = path.with_name(path.name + '.tmp')
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
@@ -3,9 +3,15 @@ Authentication Service with Factory Pattern
 Handles OAuth2 and Service Account authentication
 """
 
+import functools
 import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from typing import Any, Optional, Union
+import httplib2
 from google.auth.transport.requests import Request
+from google_auth_httplib2 import AuthorizedHttp
 from google.oauth2.credentials import Credentials
 from google.oauth2 import service_account
 from google_auth_oauthlib.flow import InstalledAppFlow
@@ -16,18 +22,28 @@ from application.interfaces.services import IAuthenticationService
 from domain.exceptions.access_manager_errors import AuthenticationError, ConfigurationError
 
 
+# Socket timeout (seconds) for Google API connections
+_HTTP_TIMEOUT = 30
+
+# Refresh OAuth2 credentials in the background once they are this close to expiry
+_REFRESH_MARGIN = timedelta(minutes=5)
+
+
 class OAuth2AuthenticationService(IAuthenticationService):
     """
     OAuth2 Authentication Service
     
     Implements user-based OAuth2 authentication flow.
+    
+    Credentials close to expiry are refreshed on a background thread, so
+    API requests don't stall on a synchronous token refresh.
     """
     
-    SCOPES = [
+    SCOPES = (
         'https://www.googleapis.com/auth/drive',
         'https://www.googleapis.com/auth/drive.metadata.readonly',
         'https://www.googleapis.com/auth/spreadsheets'
-    ]
+    )
     
     def __init__(self, credentials_path: str = 'credentials.json', token_path: str = 'token.json'):
         """
@@ -40,6 +56,15 @@ class OAuth2AuthenticationService(IAuthenticationService):
         self._credentials_path = credentials_path
         self._token_path = token_path
         self._creds: Optional[Union[Credentials, Any]] = None
+        
+        # Services are built once and reused so their HTTP connection is too
+        self._drive_service: Optional[Any] = None
+        self._sheets_service: Optional[Any] = None
+        
+        # Only one refresh (background or inline) runs at a time
+        self._refresh_lock = threading.Lock()
+        self._refresh_pool: Optional[ThreadPoolExecutor] = None
+        self._refresh_future: Optional[Future] = None
     
     def authenticate(self) -> Any:
         """
@@ -51,15 +76,22 @@ class OAuth2AuthenticationService(IAuthenticationService):
         Raises:
             AuthenticationError: If authentication fails
         """
-        # Check if token.json exists with valid credentials
-        if os.path.exists(self._token_path):
+        # New credentials invalidate services built from the old ones
+        self._drive_service = None
+        self._sheets_service = None
+        
+        # Load saved credentials from token.json, if present
+        try:
             self._creds = Credentials.from_authorized_user_file(self._token_path, self.SCOPES)
+        except FileNotFoundError:
+            pass
         
         # If there are no valid credentials, let the user log in
         if not self._creds or not self._creds.valid:
             if self._creds and self._creds.expired and self._creds.refresh_token:
                 try:
-                    self._creds.refresh(Request())
+                    with self._refresh_lock:
+                        self._creds.refresh(Request())
                 except Exception as e:
                     raise AuthenticationError(
                         f"Failed to refresh credentials: {e}",
@@ -67,17 +99,16 @@ class OAuth2AuthenticationService(IAuthenticationService):
                         auth_type="OAuth2"
                     )
             else:
-                if not os.path.exists(self._credentials_path):
+                try:
+                    flow = InstalledAppFlow.from_client_secrets_file(
+                        self._credentials_path, self.SCOPES)
+                    self._creds = flow.run_local_server(port=0)
+                except FileNotFoundError:
                     raise AuthenticationError(
                         f"Credentials file not found at {self._credentials_path}",
                         credentials_path=self._credentials_path,
                         auth_type="OAuth2"
                     )
-                
-                try:
-                    flow = InstalledAppFlow.from_client_secrets_file(
-                        self._credentials_path, self.SCOPES)
-                    self._creds = flow.run_local_server(port=0)
                 except Exception as e:
                     raise AuthenticationError(
                         f"OAuth2 flow failed: {e}",
@@ -87,44 +118,97 @@ class OAuth2AuthenticationService(IAuthenticationService):
             
             # Save the credentials for the next run
             if self._creds:
-                try:
-                    with open(self._token_path, 'w') as token:
-                        token.write(self._creds.to_json())
-                except Exception as e:
-                    # Non-fatal error
-                    pass
+                self._save_token()
         
+        self._schedule_refresh()
         return self._creds
     
     def get_drive_service(self) -> Any:
-        """Get authenticated Google Drive service"""
+        """Get authenticated Google Drive service (built once, then reused)"""
+        if self._drive_service is not None:
+            return self._drive_service
+        
         if not self._creds:
             self.authenticate()
         
         try:
-            return build('drive', 'v3', credentials=self._creds)
+            self._drive_service = build('drive', 'v3', http=self.create_http(), cache_discovery=False)
         except HttpError as error:
             raise AuthenticationError(
                 f"Failed to build Drive service: {error}",
                 auth_type="OAuth2"
             )
+        
+        return self._drive_service
     
     def get_sheets_service(self) -> Any:
-        """Get authenticated Google Sheets service"""
+        """Get authenticated Google Sheets service (built once, then reused)"""
+        if self._sheets_service is not None:
+            return self._sheets_service
+        
         if not self._creds:
             self.authenticate()
         
         try:
-            return build('sheets', 'v4', credentials=self._creds)
+            self._sheets_service = build('sheets', 'v4', http=self.create_http(), cache_discovery=False)
         except HttpError as error:
             raise AuthenticationError(
                 f"Failed to build Sheets service: {error}",
                 auth_type="OAuth2"
             )
+        
+        return self._sheets_service
+    
+    def create_http(self) -> AuthorizedHttp:
+        """Create an authorized HTTP object with its own connection"""
+        if not self._creds:
+            self.authenticate()
+        else:
+            self._schedule_refresh()
+        
+        return AuthorizedHttp(self._creds, http=httplib2.Http(timeout=_HTTP_TIMEOUT))
     
     def is_authenticated(self) -> bool:
         """Check if currently authenticated"""
         return self._creds is not None and self._creds.valid
+    
+    def _schedule_refresh(self) -> None:
+        """Start a background refresh if the credentials expire soon"""
+        creds = self._creds
+        if not creds or not creds.refresh_token or not creds.expiry:
+            return
+        if self._refresh_future is not None and not self._refresh_future.done():
+            return
+        
+        # google-auth stores expiry as naive UTC
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        if creds.expiry - now >= _REFRESH_MARGIN:
+            return
+        
+        if self._refresh_pool is None:
+            self._refresh_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="oauth-refresh")
+        self._refresh_future = self._refresh_pool.submit(self._refresh_in_background)
+    
+    def _refresh_in_background(self) -> None:
+        """Refresh the credentials and persist the new token"""
+        try:
+            with self._refresh_lock:
+                self._creds.refresh(Request())
+        except Exception:
+            # Requests fall back to refreshing when the token expires
+            return
+        self._save_token()
+    
+    def _save_token(self) -> None:
+        """Atomically write the credentials to the token file (non-fatal)"""
+        tmp_path = self._token_path + '.tmp'
+        try:
+            with open(tmp_path, 'w') as token:
+                token.write(self._creds.to_json())
+            os.replace(tmp_path, self._token_path)
+        except OSError:
+            # Non-fatal error
+            pass
 
 
 class ServiceAccountAuthenticationService(IAuthenticationService):
@@ -134,10 +218,10 @@ class ServiceAccountAuthenticationService(IAuthenticationService):
     Implements domain-wide delegation with service account.
     """
     
-    ADMIN_SCOPES = [
+    ADMIN_SCOPES = (
         'https://www.googleapis.com/auth/drive',
         'https://www.googleapis.com/auth/admin.directory.user.readonly'
-    ]
+    )
     
     def __init__(self, service_account_path: str, admin_email: Optional[str] = None):
         """
@@ -150,6 +234,10 @@ class ServiceAccountAuthenticationService(IAuthenticationService):
         self._service_account_path = service_account_path
         self._admin_email = admin_email
         self._creds: Optional[service_account.Credentials] = None
+        
+        # Services are built once and reused so their HTTP connection is too
+        self._drive_service: Optional[Any] = None
+        self._sheets_service: Optional[Any] = None
     
     def authenticate(self) -> Any:
         """
@@ -161,12 +249,9 @@ class ServiceAccountAuthenticationService(IAuthenticationService):
         Raises:
             AuthenticationError: If authentication fails
         """
-        if not os.path.exists(self._service_account_path):
-            raise AuthenticationError(
-                f"Service account file not found at {self._service_account_path}",
-                credentials_path=self._service_account_path,
-                auth_type="ServiceAccount"
-            )
+        # New credentials invalidate services built from the old ones
+        self._drive_service = None
+        self._sheets_service = None
         
         try:
             # Load service account credentials
@@ -181,6 +266,12 @@ class ServiceAccountAuthenticationService(IAuthenticationService):
             
             return self._creds
         
+        except FileNotFoundError:
+            raise AuthenticationError(
+                f"Service account file not found at {self._service_account_path}",
+                credentials_path=self._service_account_path,
+                auth_type="ServiceAccount"
+            )
         except Exception as e:
             raise AuthenticationError(
                 f"Service account authentication failed: {e}",
@@ -189,41 +280,87 @@ class ServiceAccountAuthenticationService(IAuthenticationService):
             )
     
     def get_drive_service(self) -> Any:
-        """Get authenticated Google Drive service"""
+        """Get authenticated Google Drive service (built once, then reused)"""
+        if self._drive_service is not None:
+            return self._drive_service
+        
         if not self._creds:
             self.authenticate()
         
         try:
-            return build('drive', 'v3', credentials=self._creds)
+            self._drive_service = build('drive', 'v3', http=self.create_http(), cache_discovery=False)
         except HttpError as error:
             raise AuthenticationError(
                 f"Failed to build Drive service: {error}",
                 auth_type="ServiceAccount"
             )
+        
+        return self._drive_service
     
     def get_sheets_service(self) -> Any:
-        """Get authenticated Google Sheets service"""
+        """Get authenticated Google Sheets service (built once, then reused)"""
+        if self._sheets_service is not None:
+            return self._sheets_service
+        
         if not self._creds:
             self.authenticate()
         
         try:
-            return build('sheets', 'v4', credentials=self._creds)
+            self._sheets_service = build('sheets', 'v4', http=self.create_http(), cache_discovery=False)
         except HttpError as error:
             raise AuthenticationError(
                 f"Failed to build Sheets service: {error}",
                 auth_type="ServiceAccount"
             )
+        
+        return self._sheets_service
+    
+    def create_http(self) -> AuthorizedHttp:
+        """Create an authorized HTTP object with its own connection"""
+        if not self._creds:
+            self.authenticate()
+        
+        return AuthorizedHttp(self._creds, http=httplib2.Http(timeout=_HTTP_TIMEOUT))
     
     def is_authenticated(self) -> bool:
         """Check if currently authenticated"""
         return self._creds is not None
 
 
+@functools.lru_cache(maxsize=None)
+def get_authenticator(
+    credentials_path: str = 'credentials.json',
+    token_path: str = 'token.json',
+    service_account_path: Optional[str] = None,
+    admin_email: Optional[str] = None
+) -> IAuthenticationService:
+    """
+    Get the process-wide authenticator for a set of credentials
+    
+    Authenticators are cached per argument set, so credentials (and the
+    token file) are loaded once and the built API services are shared.
+    
+    Args:
+        credentials_path: Path to OAuth2 credentials
+        token_path: Path to token file
+        service_account_path: Path to service account JSON (uses service
+            account authentication when set)
+        admin_email: Admin email to impersonate
+        
+    Returns:
+        Shared IAuthenticationService implementation
+    """
+    if service_account_path:
+        return ServiceAccountAuthenticationService(service_account_path, admin_email)
+    return OAuth2AuthenticationService(credentials_path, token_path)
+
+
 class AuthenticationFactory:
     """
     Authentication Factory (Factory Pattern)
     
     Creates appropriate authentication service based on configuration.
+    Authenticators are shared per credential set (see get_authenticator).
     """
     
     @staticmethod
@@ -241,7 +378,7 @@ class AuthenticationFactory:
         Returns:
             OAuth2AuthenticationService instance
         """
-        return OAuth2AuthenticationService(credentials_path, token_path)
+        return get_authenticator(credentials_path, token_path, None, None)
     
     @staticmethod
     def create_service_account_authenticator(
@@ -258,7 +395,7 @@ class AuthenticationFactory:
         Returns:
             ServiceAccountAuthenticationService instance
         """
-        return ServiceAccountAuthenticationService(service_account_path, admin_email)
+        return get_authenticator('credentials.json', 'token.json', service_account_path, admin_email)
     
     @staticmethod
     def create_from_config(config: Any) -> IAuthenticationService:
@@ -3,8 +3,9 @@ Google Drive Repository Implementation
 Implements IDriveRepository using Google Drive API
 """
 
+import asyncio
 import time
-from typing import List, Optional
+from typing import AsyncIterator, Iterator, List, Optional, Tuple
 from googleapiclient.errors import HttpError
 
 from application.interfaces.repositories import IDriveRepository
@@ -18,6 +19,29 @@ from domain.exceptions.access_manager_errors import (
 )
 
 
+# Default partial-response projection for file listings
+_PERMISSION_FIELDS = "permissions(id, type, role, emailAddress, displayName, domain, deleted)"
+_FILE_LIST_FIELDS = (
+    "nextPageToken, files(id, name, mimeType, owners(emailAddress), "
+    f"{_PERMISSION_FIELDS}, shared, createdTime, modifiedTime, webViewLink, size)"
+)
+_CHANGE_LIST_FIELDS = (
+    "nextPageToken, newStartPageToken, changes(changeType, fileId, removed, "
+    "file(id, name, mimeType, owners(emailAddress), "
+    f"{_PERMISSION_FIELDS}, shared, createdTime, modifiedTime, webViewLink, size))"
+)
+_FILE_FIELDS = (
+    "id, name, mimeType, owners, permissions, shared, "
+    "createdTime, modifiedTime, webViewLink, size"
+)
+
+# Largest page the Drive API accepts; fewer pages means fewer round-trips
+MAX_PAGE_SIZE = 1000
+
+# Maximum sub-requests accepted by the Drive batch endpoint
+_BATCH_SIZE = 100
+
+
 class GoogleDriveRepository(IDriveRepository):
     """
     Google Drive Repository
@@ -26,7 +50,12 @@ class GoogleDriveRepository(IDriveRepository):
     Handles API communication, pagination, and error handling.
     """
     
-    def __init__(self, drive_service, page_size: int = 100, rate_limit_delay: float = 0.1):
+    def __init__(
+        self,
+        drive_service,
+        page_size: int = MAX_PAGE_SIZE,
+        rate_limit_delay: float = 0.1
+    ):
         """
         Initialize Google Drive Repository
         
@@ -39,12 +68,13 @@ class GoogleDriveRepository(IDriveRepository):
         self._page_size = page_size
         self._rate_limit_delay = rate_limit_delay
     
-    def list_all_files(self, page_size: int = 100) -> List[DriveFile]:
+    def list_all_files(self, page_size: Optional[int] = None) -> List[DriveFile]:
         """
         List all accessible Drive files
         
         Args:
             page_size: Number of files to fetch per API request
+                (defaults to the repository page size)
             
         Returns:
             List of DriveFile entities
@@ -53,32 +83,151 @@ class GoogleDriveRepository(IDriveRepository):
             RepositoryError: If API call fails
             RateLimitError: If rate limit exceeded
         """
-        files = []
+        return list(self.iter_all_files(page_size))
+    
+    def iter_all_files(self, page_size: Optional[int] = None) -> Iterator[DriveFile]:
+        """
+        Iterate over all accessible Drive files, one page at a time
+        
+        Args:
+            page_size: Number of files to fetch per API request
+                (defaults to the repository page size)
+            
+        Returns:
+            Iterator of DriveFile entities
+            
+        Raises:
+            RepositoryError: If API call fails
+            RateLimitError: If rate limit exceeded
+        """
         page_token = None
         actual_page_size = page_size or self._page_size
         
+        while True:
+            try:
+                response = self._fetch_page(page_token, actual_page_size)
+            except Exception as error:
+                raise self._translate_list_error(error)
+            
+            yield from self._parse_page(response)
+            
+            page_token = response.get('nextPageToken')
+            if not page_token:
+                return
+            
+            # Rate limiting
+            time.sleep(self._rate_limit_delay)
+    
+    async def list_all_files_async(self, page_size: Optional[int] = None) -> AsyncIterator[DriveFile]:
+        """
+        Stream all accessible Drive files, prefetching the next page
+        
+        The request for page N+1 is issued as soon as page N arrives,
+        so parsing and yielding one page overlaps with the server
+        producing the next. At most two pages are buffered.
+        
+        Args:
+            page_size: Number of files to fetch per API request
+                (defaults to the repository page size)
+            
+        Yields:
+            DriveFile entities
+            
+        Raises:
+            RepositoryError: If API call fails
+            RateLimitError: If rate limit exceeded
+        """
+        loop = asyncio.get_running_loop()
+        pages: asyncio.Queue = asyncio.Queue(maxsize=2)
+        actual_page_size = page_size or self._page_size
+        
+        async def fetch_pages() -> None:
+            page_token = None
+            try:
+                while True:
+                    response = await loop.run_in_executor(
+                        None, self._fetch_page, page_token, actual_page_size
+                    )
+                    await pages.put(response)
+                    
+                    page_token = response.get('nextPageToken')
+                    if not page_token:
+                        break
+                    
+                    # Rate limiting
+                    await asyncio.sleep(self._rate_limit_delay)
+                
+                await pages.put(None)
+            except Exception as error:
+                await pages.put(self._translate_list_error(error))
+        
+        fetcher = asyncio.create_task(fetch_pages())
         try:
             while True:
-                # Fetch files with permissions metadata
-                response = self._drive_service.files().list(
-                    pageSize=actual_page_size,
-                    pageToken=page_token,
-                    fields="nextPageToken, files(id, name, mimeType, owners, permissions, "
-                           "shared, createdTime, modifiedTime, webViewLink, size)",
-                    supportsAllDrives=True,
-                    includeItemsFromAllDrives=True
-                ).execute()
-                
-                batch_files = response.get('files', [])
+                response = await pages.get()
+                if response is None:
+                    break
+                if isinstance(response, Exception):
+                    raise response
                 
-                # Convert to domain entities
-                for file_data in batch_files:
-                    try:
-                        drive_file = DriveFile.from_api_response(file_data)
-                        files.append(drive_file)
-                    except (ValueError, KeyError) as e:
-                        # Skip invalid files
-                        continue
+                for drive_file in self._parse_page(response):
+                    yield drive_file
+        finally:
+            fetcher.cancel()
+    
+    def _fetch_page(
+        self,
+        page_token: Optional[str],
+        page_size: int,
+        query: Optional[str] = None,
+        fields: Optional[str] = None
+    ) -> dict:
+        """
+        Fetch a single page of files with permissions metadata
+        
+        Args:
+            page_token: Token of the page to fetch (None for the first page)
+            page_size: Number of files per page
+            query: Optional Drive search query (``q`` parameter)
+            fields: Optional partial-response projection
+            
+        Returns:
+            Raw API response dictionary
+        """
+        params = {
+            'pageSize': page_size,
+            'pageToken': page_token,
+            'fields': fields or _FILE_LIST_FIELDS,
+            'supportsAllDrives': True,
+            'includeItemsFromAllDrives': True
+        }
+        if query:
+            params['q'] = query
+        
+        return self._drive_service.files().list(**params).execute()
+    
+    def _query_files(self, query: str, fields: Optional[str] = None) -> List[DriveFile]:
+        """
+        List files matching a server-side Drive query
+        
+        Args:
+            query: Drive search query (``q`` parameter)
+            fields: Optional partial-response projection
+            
+        Returns:
+            List of matching DriveFile entities
+            
+        Raises:
+            RepositoryError: If API call fails
+            RateLimitError: If rate limit exceeded
+        """
+        files = []
+        page_token = None
+        
+        try:
+            while True:
+                response = self._fetch_page(page_token, self._page_size, query, fields)
+                files.extend(self._parse_page(response))
                 
                 page_token = response.get('nextPageToken')
                 if not page_token:
@@ -89,24 +238,129 @@ class GoogleDriveRepository(IDriveRepository):
             
             return files
         
-        except HttpError as error:
+        except Exception as error:
+            raise self._translate_list_error(error)
+    
+    @staticmethod
+    def _quote(email: Email) -> str:
+        """Quote an email address for use in a Drive query"""
+        return "'" + str(email).replace("\\", "\\\\").replace("'", "\\'") + "'"
+    
+    def _parse_page(self, response: dict) -> List[DriveFile]:
+        """
+        Convert a page of API file data to domain entities
+        
+        Args:
+            response: Raw API response dictionary
+            
+        Returns:
+            List of DriveFile entities (invalid entries are skipped)
+        """
+        return DriveFile.from_api_responses(response.get('files', []))
+    
+    def _translate_list_error(self, error: Exception) -> Exception:
+        """
+        Translate a file listing failure into a domain exception
+        
+        Args:
+            error: Exception raised while listing files
+            
+        Returns:
+            RateLimitError or RepositoryError to raise
+        """
+        if isinstance(error, HttpError):
             if error.resp.status == 429:
-                raise RateLimitError(
+                return RateLimitError(
                     "Google Drive API rate limit exceeded",
                     retry_after=60,
                     quota_type="drive_api"
                 )
-            raise RepositoryError(
+            return RepositoryError(
                 f"Failed to list files: {error}",
                 repository="GoogleDriveRepository",
                 operation="list_all_files"
             )
+        return RepositoryError(
+            f"Unexpected error listing files: {error}",
+            repository="GoogleDriveRepository",
+            operation="list_all_files"
+        )
+    
+    def get_start_page_token(self) -> str:
+        """
+        Get the change-log position representing "now"
+        
+        Returns:
+            Start page token for list_changes
+            
+        Raises:
+            RepositoryError: If API call fails
+            RateLimitError: If rate limit exceeded
+        """
+        try:
+            response = self._drive_service.changes().getStartPageToken(
+                supportsAllDrives=True
+            ).execute()
         except Exception as error:
-            raise RepositoryError(
-                f"Unexpected error listing files: {error}",
-                repository="GoogleDriveRepository",
-                operation="list_all_files"
-            )
+            raise self._translate_list_error(error)
+        
+        return response['startPageToken']
+    
+    def list_changes(self, page_token: str) -> Tuple[List[DriveFile], List[str], str]:
+        """
+        List files changed since a change-log position
+        
+        Args:
+            page_token: Token from get_start_page_token or a previous call
+            
+        Returns:
+            Tuple of (added or updated files, removed file IDs, new start
+            page token)
+            
+        Raises:
+            RepositoryError: If API call fails
+            RateLimitError: If rate limit exceeded
+        """
+        changed: List[DriveFile] = []
+        removed: List[str] = []
+        
+        while True:
+            try:
+                response = self._drive_service.changes().list(
+                    pageToken=page_token,
+                    pageSize=self._page_size,
+                    fields=_CHANGE_LIST_FIELDS,
+                    includeRemoved=True,
+                    supportsAllDrives=True,
+                    includeItemsFromAllDrives=True
+                ).execute()
+            except Exception as error:
+                raise self._translate_list_error(error)
+            
+            for change in response.get('changes', []):
+                # Shared drive changes ('drive') carry no file
+                if change.get('changeType', 'file') != 'file':
+                    continue
+                file_id = change.get('fileId')
+                if file_id is None:
+                    continue
+                file_data = change.get('file')
+                if change.get('removed') or file_data is None:
+                    removed.append(file_id)
+                    continue
+                try:
+                    changed.append(DriveFile.from_api_response(file_data))
+                except (ValueError, KeyError):
+                    # Skip invalid files
+                    continue
+            
+            if 'newStartPageToken' in response:
+                return changed, removed, response['newStartPageToken']
+            
+            page_token = response['nextPageToken']
+            
+            # Rate limiting
+            time.sleep(self._rate_limit_delay)
     
     def get_file_by_id(self, file_id: FileId) -> Optional[DriveFile]:
         """
@@ -124,8 +378,7 @@ class GoogleDriveRepository(IDriveRepository):
         try:
             file_data = self._drive_service.files().get(
                 fileId=str(file_id),
-                fields="id, name, mimeType, owners, permissions, shared, "
-                       "createdTime, modifiedTime, webViewLink, size",
+                fields=_FILE_FIELDS,
                 supportsAllDrives=True
             ).execute()
             
@@ -152,40 +405,113 @@ class GoogleDriveRepository(IDriveRepository):
                 operation="get_file_by_id"
             )
     
-    def find_files_shared_with(self, email: Email) -> List[DriveFile]:
+    def get_files_by_ids(self, file_ids: List[FileId]) -> List[Optional[DriveFile]]:
+        """
+        Get several files by ID using Drive HTTP batch requests
+        
+        Lookups are sent in chunks of up to 100 per round-trip. Batch
+        requests do not reuse the service's keep-alive connection, so
+        this only pays off for multi-file reads; use get_file_by_id()
+        for a single file.
+        
+        Args:
+            file_ids: File identifiers
+            
+        Returns:
+            List aligned with file_ids: DriveFile entity, or None if not
+            found (or not parseable)
+            
+        Raises:
+            RateLimitError: If a lookup or the batch is rate limited
+            RepositoryError: If a lookup or the batch fails
+        """
+        results: List[Optional[DriveFile]] = [None] * len(file_ids)
+        errors: List[HttpError] = []
+        
+        def on_response(request_id: str, response, exception) -> None:
+            if exception is None:
+                try:
+                    results[int(request_id)] = DriveFile.from_api_response(response)
+                except (ValueError, KeyError):
+                    pass
+            elif not (isinstance(exception, HttpError) and exception.resp.status == 404):
+                errors.append(exception)
+        
+        for start in range(0, len(file_ids), _BATCH_SIZE):
+            batch = self._drive_service.new_batch_http_request(callback=on_response)
+            for index in range(start, min(start + _BATCH_SIZE, len(file_ids))):
+                batch.add(
+                    self._drive_service.files().get(
+                        fileId=str(file_ids[index]),
+                        fields=_FILE_FIELDS,
+                        supportsAllDrives=True
+                    ),
+                    request_id=str(index)
+                )
+            
+            try:
+                batch.execute()
+                if errors:
+                    raise errors[0]
+            except HttpError as error:
+                if error.resp.status == 429:
+                    raise RateLimitError(
+                        "Google Drive API rate limit exceeded",
+                        retry_after=60,
+                        quota_type="drive_api"
+                    )
+                raise RepositoryError(
+                    f"Failed to get files: {error}",
+                    repository="GoogleDriveRepository",
+                    operation="get_files_by_ids"
+                )
+            
+            # Rate limiting
+            time.sleep(self._rate_limit_delay)
+        
+        return results
+    
+    def find_files_shared_with(
+        self,
+        email: Email,
+        fields: Optional[str] = None
+    ) -> List[DriveFile]:
         """
         Find all files shared with a specific user
         
+        Selection happens server-side; the permission check is re-applied
+        locally when permissions are part of the projection.
+        
         Args:
             email: User email address
+            fields: Optional partial-response projection
             
         Returns:
             List of DriveFile entities shared with the user
         """
-        all_files = self.list_all_files()
-        shared_files = []
+        quoted = self._quote(email)
+        files = self._query_files(
+            f"{quoted} in owners or {quoted} in writers or {quoted} in readers",
+            fields
+        )
         
-        for file in all_files:
-            if file.is_shared_with(email):
-                shared_files.append(file)
-        
-        return shared_files
+        if fields is not None and 'permissions' not in fields:
+            return files
+        return [file for file in files if file.is_shared_with(email)]
     
-    def find_files_owned_by(self, email: Email) -> List[DriveFile]:
+    def find_files_owned_by(
+        self,
+        email: Email,
+        fields: Optional[str] = None
+    ) -> List[DriveFile]:
         """
         Find all files owned by a specific user
         
         Args:
             email: Owner email address
+            fields: Optional partial-response projection
             
         Returns:
             List of DriveFile entities owned by the user
         """
-        all_files = self.list_all_files()
-        owned_files = []
-        
-        for file in all_files:
-            if file.is_owned_by(email):
-                owned_files.append(file)
-        
-        return owned_files
+        return self._query_files(f"{self._quote(email)} in owners", fields)
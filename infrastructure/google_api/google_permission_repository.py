@@ -3,11 +3,13 @@ Google Permission Repository Implementation
 Implements IPermissionRepository using Google Drive API
 """
 
+import threading
 import time
-from typing import List
+from typing import Callable, Iterator, List, Optional, Tuple
 from googleapiclient.errors import HttpError
 
 from application.interfaces.repositories import IPermissionRepository
+from application.dto.access_management_result import RevocationResult
 from domain.entities.permission import Permission
 from domain.value_objects.identifiers import FileId, PermissionId
 from domain.exceptions.access_manager_errors import (
@@ -28,16 +30,47 @@ class GooglePermissionRepository(IPermissionRepository):
     Handles permission operations with proper error handling.
     """
     
-    def __init__(self, drive_service, rate_limit_delay: float = 0.1):
+    # Maximum sub-requests accepted by the Drive batch endpoint
+    BATCH_SIZE = 100
+    
+    def __init__(
+        self,
+        drive_service,
+        rate_limit_delay: float = 0.1,
+        http_factory: Optional[Callable[[], object]] = None
+    ):
         """
         Initialize Google Permission Repository
         
         Args:
             drive_service: Authenticated Google Drive API service
             rate_limit_delay: Delay between requests to avoid rate limits
+            http_factory: Creates an authorized HTTP object per thread.
+                Required for concurrent revocation because httplib2
+                connections are not thread-safe.
         """
         self._drive_service = drive_service
         self._rate_limit_delay = rate_limit_delay
+        self._http_factory = http_factory
+        self._local = threading.local()
+    
+    def _execute(self, request):
+        """
+        Execute an API request on this thread's HTTP object
+        
+        Args:
+            request: googleapiclient HttpRequest
+            
+        Returns:
+            API response
+        """
+        if self._http_factory is None:
+            return request.execute()
+        
+        http = getattr(self._local, 'http', None)
+        if http is None:
+            http = self._local.http = self._http_factory()
+        return request.execute(http=http)
     
     def get_file_permissions(self, file_id: FileId) -> List[Permission]:
         """
@@ -119,12 +152,12 @@ class GooglePermissionRepository(IPermissionRepository):
             RepositoryError: If API call fails
         """
         try:
-            self._drive_service.permissions().delete(
+            self._execute(self._drive_service.permissions().delete(
                 fileId=str(file_id),
                 permissionId=str(permission_id),
                 supportsAllDrives=True,
                 useDomainAdminAccess=use_admin_access
-            ).execute()
+            ))
             
             # Small delay to avoid rate limiting
             time.sleep(self._rate_limit_delay)
@@ -163,6 +196,142 @@ class GooglePermissionRepository(IPermissionRepository):
                 operation="revoke_permission"
             )
     
+    def revoke_permissions_concurrent(
+        self,
+        items: List[Tuple[FileId, PermissionId]],
+        max_in_flight: int = 8,
+        use_admin_access: bool = False
+    ) -> Iterator[RevocationResult]:
+        """
+        Revoke permissions with bounded concurrency
+        
+        Without an http_factory the shared service connection is not
+        thread-safe, so revocations run one at a time.
+        
+        Args:
+            items: (file_id, permission_id) pairs to revoke
+            max_in_flight: Maximum concurrent revocations
+            use_admin_access: Use domain admin access override
+            
+        Returns:
+            Iterator of RevocationResult in completion order
+        """
+        if self._http_factory is None:
+            max_in_flight = 1
+        
+        return super().revoke_permissions_concurrent(
+            items,
+            max_in_flight,
+            use_admin_access
+        )
+    
+    def revoke_permissions_batch(
+        self,
+        items: List[Tuple[FileId, PermissionId]],
+        use_admin_access: bool = False
+    ) -> List[RevocationResult]:
+        """
+        Revoke many permissions using Drive HTTP batch requests
+        
+        Items are sent in chunks of BATCH_SIZE, so N revocations cost
+        ceil(N / 100) round-trips instead of N.
+        
+        Args:
+            items: (file_id, permission_id) pairs to revoke
+            use_admin_access: Use domain admin access override
+            
+        Returns:
+            List of RevocationResult aligned with items
+            
+        Raises:
+            RateLimitError: If the batch request itself is rate limited
+            RepositoryError: If the batch request itself fails
+        """
+        results: List[Optional[RevocationResult]] = [None] * len(items)
+        
+        def on_response(request_id: str, response, exception) -> None:
+            index = int(request_id)
+            file_id, permission_id = items[index]
+            results[index] = self._to_revocation_result(file_id, permission_id, exception)
+        
+        for start in range(0, len(items), self.BATCH_SIZE):
+            batch = self._drive_service.new_batch_http_request(callback=on_response)
+            
+            for index in range(start, min(start + self.BATCH_SIZE, len(items))):
+                file_id, permission_id = items[index]
+                batch.add(
+                    self._drive_service.permissions().delete(
+                        fileId=str(file_id),
+                        permissionId=str(permission_id),
+                        supportsAllDrives=True,
+                        useDomainAdminAccess=use_admin_access
+                    ),
+                    request_id=str(index)
+                )
+            
+            try:
+                batch.execute()
+            except HttpError as error:
+                if error.resp.status == 429:
+                    raise RateLimitError(
+                        "Google Drive API rate limit exceeded",
+                        retry_after=60,
+                        quota_type="drive_api"
+                    )
+                raise RepositoryError(
+                    f"Failed to execute revocation batch: {error}",
+                    repository="GooglePermissionRepository",
+                    operation="revoke_permissions_batch"
+                )
+            
+            # Small delay to avoid rate limiting
+            time.sleep(self._rate_limit_delay)
+        
+        return results  # type: ignore[return-value]
+    
+    def _to_revocation_result(
+        self,
+        file_id: FileId,
+        permission_id: PermissionId,
+        exception: Optional[Exception]
+    ) -> RevocationResult:
+        """
+        Map a batch sub-response to a RevocationResult
+        
+        Args:
+            file_id: File identifier
+            permission_id: Permission identifier
+            exception: Exception reported for the sub-request, if any
+            
+        Returns:
+            RevocationResult with status derived from the HTTP status
+        """
+        if exception is None:
+            status, error, reason = 'success', None, None
+        elif isinstance(exception, HttpError):
+            reason = self._extract_error_reason(exception)
+            error = str(exception)
+            if exception.resp.status == 404:
+                status = 'skipped'
+            elif exception.resp.status == 403 or reason in [
+                'cannotDeletePermission',
+                'insufficientPermissions'
+            ]:
+                status = 'permission_denied'
+            else:
+                status = 'failed'
+        else:
+            status, error, reason = 'failed', str(exception), None
+        
+        return RevocationResult(
+            file_id=str(file_id),
+            file_name='',
+            permission_id=str(permission_id),
+            status=status,
+            error=error,
+            error_reason=reason
+        )
+    
     def update_permission_role(
         self,
         file_id: FileId,
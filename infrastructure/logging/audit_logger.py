@@ -259,4 +259,4 @@ class AuditLogger:
             **data
         }
         
-        self._logger.info(json.dumps(log_entry))
+        self._logger.info(json.dumps(log_entry, separators=(',', ':')))
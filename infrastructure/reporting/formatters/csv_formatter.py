@@ -4,8 +4,7 @@ Implements IReportFormatter for CSV format
 """
 
 import csv
-import io
-from typing import Dict, Any, List
+from typing import Dict, Any, TextIO
 
 from application.interfaces.services import IReportFormatter
 
@@ -28,70 +27,72 @@ class CSVReportFormatter(IReportFormatter):
         self._delimiter = delimiter
         self._include_header = include_header
     
-    def format(self, data: Dict[str, Any]) -> str:
+    def format(self, data: Dict[str, Any], out: TextIO) -> None:
         """
-        Format data as CSV
+        Format data as CSV, writing rows to the stream as they are built
         
         Args:
             data: Report data containing 'files' and 'metadata'
-            
-        Returns:
-            CSV-formatted string
+            out: Text stream to write to
         """
-        output = io.StringIO()
-        
-        files = data.get('files', [])
-        if not files:
-            return ""
-        
-        # Prepare rows
-        rows = []
-        for file_entry in files:
-            if isinstance(file_entry, dict):
-                # Handle dict format from old system
-                file_data = file_entry.get('file', {})
-                permission_data = file_entry.get('permission', {})
-                
-                row = {
-                    'File Name': file_data.get('name', 'Unknown'),
-                    'File ID': file_data.get('id', ''),
-                    'Owner': self._get_owner_email(file_data),
-                    'Permission Type': permission_data.get('type', ''),
-                    'Permission Role': permission_data.get('role', ''),
-                    'Permission Email': permission_data.get('emailAddress', ''),
-                    'Shared': file_data.get('shared', False),
-                    'Web Link': file_data.get('webViewLink', '')
-                }
-            else:
-                # Handle DriveFile entity
-                row = {
-                    'File Name': file_entry.name,
-                    'File ID': str(file_entry.file_id),
-                    'Owner': ', '.join(str(owner) for owner in file_entry.owners),
-                    'Permission Count': len(file_entry.permissions),
-                    'Shared': file_entry.shared,
-                    'Web Link': file_entry.web_view_link or ''
-                }
-            
-            rows.append(row)
-        
-        if not rows:
-            return ""
+        rows = (self._build_row(file_entry) for file_entry in data.get('files', []))
         
-        # Write CSV
-        fieldnames = list(rows[0].keys())
+        # Header is taken from the first row
+        first_row = next(rows, None)
+        if first_row is None:
+            return
         writer = csv.DictWriter(
-            output,
-            fieldnames=fieldnames,
+            out,
+            fieldnames=list(first_row.keys()),
             delimiter=self._delimiter
         )
         
         if self._include_header:
             writer.writeheader()
         
-        writer.writerows(rows)
+        writer.writerow(first_row)
+        for row in rows:
+            writer.writerow(row)
+    
+    def _build_row(self, file_entry: Any) -> Dict[str, Any]:
+        """
+        Build a CSV row for a file entry
         
-        return output.getvalue()
+        Args:
+            file_entry: DriveFile entity or legacy dict entry
+            
+        Returns:
+            Row dictionary keyed by column name
+        """
+        if isinstance(file_entry, dict):
+            # Handle dict format from old system
+            file_data = file_entry.get('file', {})
+            permission_data = file_entry.get('permission', {})
+            
+            return {
+                'File Name': file_data.get('name', 'Unknown'),
+                'File ID': file_data.get('id', ''),
+                'Owner': self._get_owner_email(file_data),
+                'Permission Type': permission_data.get('type', ''),
+                'Permission Role': permission_data.get('role', ''),
+                'Permission Email': permission_data.get('emailAddress', ''),
+                'Shared': file_data.get('shared', False),
+                'Web Link': file_data.get('webViewLink', '')
+            }
+        
+        # Handle DriveFile entity
+        return {
+            'File Name': file_entry.name,
+            'File ID': str(file_entry.file_id),
+            'Owner': ', '.join(str(owner) for owner in file_entry.owners),
+            'Permission Count': len(file_entry.permissions),
+            'Shared': file_entry.shared,
+            'Web Link': file_entry.web_view_link or ''
+        }
+    
+    def supports_streaming(self) -> bool:
+        """CSV rows are written as files are read"""
+        return True
     
     def get_extension(self) -> str:
         """Get file extension"""
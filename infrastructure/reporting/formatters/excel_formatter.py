@@ -3,8 +3,7 @@ Excel Report Formatter
 Implements IReportFormatter for Excel format
 """
 
-from typing import Dict, Any, List, TYPE_CHECKING
-import io
+from typing import Dict, Any, List, BinaryIO, Union, TYPE_CHECKING
 
 if TYPE_CHECKING:
     import pandas as pd
@@ -41,44 +40,22 @@ class ExcelReportFormatter(IReportFormatter):
         self._engine = engine
         self._include_metadata = include_metadata
     
-    def format(self, data: Dict[str, Any]) -> str:
+    def format(self, data: Dict[str, Any], out: BinaryIO) -> None:
         """
-        Format data as Excel (returns base64-encoded bytes)
+        Format data as Excel, writing the workbook to the stream
         
         Args:
             data: Report data containing 'files' and 'metadata'
-            
-        Returns:
-            Excel file content as base64-encoded string
+            out: Binary stream to write to
         """
         if not PANDAS_AVAILABLE or pd is None:
             raise ImportError("pandas not available")
         
-        files = data.get('files', [])
-        metadata = data.get('metadata', {})
-        
-        # Create DataFrames
-        dfs = self._create_dataframes(files, metadata)
-        
-        # Write to Excel buffer
-        output = io.BytesIO()
-        
-        with pd.ExcelWriter(output, engine=self._engine) as writer:  # type: ignore
-            # Write main files sheet
-            if 'files' in dfs and not dfs['files'].empty:  # type: ignore
-                dfs['files'].to_excel(writer, sheet_name='Files', index=False)  # type: ignore
-            
-            # Write permissions detail sheet if available
-            if 'permissions' in dfs and not dfs['permissions'].empty:  # type: ignore
-                dfs['permissions'].to_excel(writer, sheet_name='Permissions', index=False)  # type: ignore
-            
-            # Write metadata sheet
-            if self._include_metadata and 'metadata' in dfs and not dfs['metadata'].empty:  # type: ignore
-                dfs['metadata'].to_excel(writer, sheet_name='Metadata', index=False)  # type: ignore
-        
-        # Return base64 encoded for string representation
-        import base64
-        return base64.b64encode(output.getvalue()).decode('utf-8')
+        self._write_workbook(data, out)
+    
+    def is_binary(self) -> bool:
+        """Excel workbooks are binary"""
+        return True
     
     def get_extension(self) -> str:
         """Get file extension"""
@@ -195,17 +172,30 @@ class ExcelReportFormatter(IReportFormatter):
         if not PANDAS_AVAILABLE or pd is None:
             raise ImportError("pandas not available")
         
+        self._write_workbook(data, file_path)
+    
+    def _write_workbook(self, data: Dict[str, Any], target: Union[str, BinaryIO]) -> None:
+        """
+        Write report sheets to a path or binary stream
+        
+        Args:
+            data: Report data
+            target: File path or binary stream
+        """
         files = data.get('files', [])
         metadata = data.get('metadata', {})
         
         dfs = self._create_dataframes(files, metadata)
         
-        with pd.ExcelWriter(file_path, engine=self._engine) as writer:  # type: ignore
+        with pd.ExcelWriter(target, engine=self._engine) as writer:  # type: ignore
+            # Write main files sheet
             if 'files' in dfs and not dfs['files'].empty:  # type: ignore
                 dfs['files'].to_excel(writer, sheet_name='Files', index=False)  # type: ignore
             
+            # Write permissions detail sheet if available
             if 'permissions' in dfs and not dfs['permissions'].empty:  # type: ignore
                 dfs['permissions'].to_excel(writer, sheet_name='Permissions', index=False)  # type: ignore
             
+            # Write metadata sheet
             if self._include_metadata and 'metadata' in dfs and not dfs['metadata'].empty:  # type: ignore
                 dfs['metadata'].to_excel(writer, sheet_name='Metadata', index=False)  # type: ignore
@@ -4,7 +4,7 @@ Implements IReportFormatter for JSON format
 """
 
 import json
-from typing import Dict, Any, List
+from typing import Dict, Any, List, TextIO
 from datetime import datetime
 
 from application.interfaces.services import IReportFormatter
@@ -28,15 +28,13 @@ class JSONReportFormatter(IReportFormatter):
         self._indent = indent
         self._ensure_ascii = ensure_ascii
     
-    def format(self, data: Dict[str, Any]) -> str:
+    def format(self, data: Dict[str, Any], out: TextIO) -> None:
         """
-        Format data as JSON
+        Format data as JSON, writing it to the stream
         
         Args:
             data: Report data containing 'files' and 'metadata'
-            
-        Returns:
-            JSON-formatted string
+            out: Text stream to write to
         """
         files = data.get('files', [])
         metadata = data.get('metadata', {})
@@ -51,8 +49,9 @@ class JSONReportFormatter(IReportFormatter):
             }
         }
         
-        return json.dumps(
+        json.dump(
             serializable_data,
+            out,
             indent=self._indent,
             ensure_ascii=self._ensure_ascii,
             default=str
@@ -3,7 +3,8 @@ Report Generator with Strategy Pattern
 Generates reports in multiple formats
 """
 
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, List, Dict, Any, Optional
 from pathlib import Path
 from datetime import datetime
 
@@ -19,6 +20,10 @@ except ImportError:
     EXCEL_AVAILABLE = False
 
 
+# Write buffer for report files
+_WRITE_BUFFER_SIZE = 1 << 20
+
+
 class ReportGenerator(IReportService):
     """
     Report Generator (Strategy Pattern)
@@ -78,9 +83,67 @@ class ReportGenerator(IReportService):
             'metadata': metadata or self._generate_default_metadata(files)
         }
         
-        # Format data
-        formatted_content = formatter.format(report_data)
+        return self._write_report(formatter, report_data, output_path)
+    
+    def generate_report_streaming(
+        self,
+        files: Iterable[DriveFile],
+        output_path: str,
+        report_format: ReportFormat,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """
+        Generate a report from an iterable of files
+        
+        Streaming formats (CSV) write each file as it is read; other
+        formats collect the files first.
+        
+        Args:
+            files: Iterable of files to include in report
+            output_path: Path to save report (relative to output_dir)
+            report_format: Desired output format
+            metadata: Additional metadata to include
+            
+        Returns:
+            Path to generated report file
+        """
+        if report_format not in self._formatters:
+            raise ValueError(f"Unsupported report format: {report_format}")
+        
+        formatter = self._formatters[report_format]
+        
+        if not formatter.supports_streaming():
+            return self.generate_report(list(files), output_path, report_format, metadata)
+        
+        # Totals are unknown until the stream is exhausted
+        report_data = {
+            'files': files,
+            'metadata': metadata or {
+                'generated_at': datetime.now().isoformat(),
+                'tool': 'Google Drive Access Manager',
+                'version': '2.0.0'
+            }
+        }
+        
+        return self._write_report(formatter, report_data, output_path)
+    
+    def _write_report(
+        self,
+        formatter: IReportFormatter,
+        report_data: Dict[str, Any],
+        output_path: str
+    ) -> str:
+        """
+        Resolve the output path and stream formatted data to it
         
+        Args:
+            formatter: Formatter for the requested format
+            report_data: Report data containing 'files' and 'metadata'
+            output_path: Path to save report (relative to output_dir)
+            
+        Returns:
+            Path to generated report file
+        """
         # Determine output path
         if not output_path.endswith(f".{formatter.get_extension()}"):
             output_path = f"{output_path}.{formatter.get_extension()}"
@@ -88,17 +151,13 @@ class ReportGenerator(IReportService):
         full_path = self._output_dir / output_path
         full_path.parent.mkdir(parents=True, exist_ok=True)
         
-        # Write file
-        if report_format == ReportFormat.EXCEL:
-            # Excel returns base64-encoded content
-            import base64
-            content_bytes = base64.b64decode(formatted_content)
-            with open(full_path, 'wb') as f:
-                f.write(content_bytes)
+        # Stream formatted output straight to the file
+        if formatter.is_binary():
+            with open(full_path, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
+                formatter.format(report_data, f)
         else:
-            # Text formats (CSV, JSON)
-            with open(full_path, 'w', encoding='utf-8') as f:
-                f.write(formatted_content)
+            with open(full_path, 'w', encoding='utf-8', newline='', buffering=_WRITE_BUFFER_SIZE) as f:
+                formatter.format(report_data, f)
         
         return str(full_path)
     
@@ -121,6 +180,9 @@ class ReportGenerator(IReportService):
         """
         Generate reports in multiple formats
         
+        Formats are written concurrently, one thread each, so the total
+        time is that of the slowest format rather than the sum.
+        
         Args:
             files: List of files to include
             base_name: Base name for report files
@@ -130,13 +192,23 @@ class ReportGenerator(IReportService):
         Returns:
             List of paths to generated reports
         """
+        formats = [fmt for fmt in formats if fmt in self._formatters]
+        if not formats:
+            return []
+        
+        # Shared by every format instead of recomputed per report
+        metadata = metadata or self._generate_default_metadata(files)
+        
         report_paths = []
         
-        for fmt in formats:
-            if fmt in self._formatters:
+        with ThreadPoolExecutor(max_workers=len(formats)) as executor:
+            futures = [
+                (fmt, executor.submit(self.generate_report, files, base_name, fmt, metadata))
+                for fmt in formats
+            ]
+            for fmt, future in futures:
                 try:
-                    path = self.generate_report(files, base_name, fmt, metadata)
-                    report_paths.append(path)
+                    report_paths.append(future.result())
                 except Exception as e:
                     # Log error but continue with other formats
                     print(f"Warning: Failed to generate {fmt.value} report: {e}")
@@ -154,7 +226,7 @@ class ReportGenerator(IReportService):
             Dictionary of metadata
         """
         shared_count = sum(1 for f in files if f.shared)
-        total_permissions = sum(len(f.permissions) for f in files)
+        total_permissions = sum(f.permission_count for f in files)
         
         return {
             'generated_at': datetime.now().isoformat(),
@@ -0,0 +1,90 @@
+"""
+Result Sinks
+Stream revocation results to storage as they are produced
+"""
+
+import csv
+import io
+from typing import Optional, TextIO
+
+from application.interfaces.services import IResultSink
+from application.dto.access_management_result import RevocationResult
+
+
+class CSVResultSink(IResultSink):
+    """
+    CSV Result Sink
+    
+    Writes each revocation result as a CSV row. Defaults to an in-memory
+    buffer; pass an open file, or use to_file(), to stream results
+    straight to disk.
+    """
+    
+    FIELDNAMES = (
+        'file_id',
+        'file_name',
+        'permission_id',
+        'status',
+        'error',
+        'error_reason'
+    )
+    
+    def __init__(
+        self,
+        stream: Optional[TextIO] = None,
+        delimiter: str = ',',
+        include_header: bool = True
+    ):
+        """
+        Initialize CSV result sink
+        
+        Args:
+            stream: Text stream to write to (defaults to an in-memory buffer)
+            delimiter: CSV delimiter character
+            include_header: Whether to write a header row
+        """
+        self._stream = stream if stream is not None else io.StringIO()
+        self._owns_stream = False
+        self._writer = csv.writer(self._stream, delimiter=delimiter)
+        
+        if include_header:
+            self._writer.writerow(self.FIELDNAMES)
+    
+    @classmethod
+    def to_file(cls, path: str, delimiter: str = ',') -> 'CSVResultSink':
+        """
+        Create a sink writing to a new CSV file, closed by close()
+        
+        Args:
+            path: Output file path (created or truncated)
+            delimiter: CSV delimiter character
+            
+        Returns:
+            CSVResultSink owning the opened file
+        """
+        sink = cls(open(path, 'w', newline='', encoding='utf-8'), delimiter=delimiter)
+        sink._owns_stream = True
+        return sink
+    
+    @property
+    def stream(self) -> TextIO:
+        """Get the underlying stream"""
+        return self._stream
+    
+    def write(self, result: RevocationResult) -> None:
+        """Write a single revocation result as a CSV row"""
+        self._writer.writerow((
+            result.file_id,
+            result.file_name,
+            result.permission_id,
+            result.status,
+            result.error or '',
+            result.error_reason or ''
+        ))
+    
+    def close(self) -> None:
+        """Flush the underlying stream, closing it if opened by to_file()"""
+        if self._owns_stream:
+            self._stream.close()
+        else:
+            self._stream.flush()
@@ -3,6 +3,8 @@ CLI Progress Observer
 Implements IProgressObserver for console output
 """
 
+from typing import Sequence, Tuple
+
 from application.interfaces.services import IProgressObserver
 
 try:
@@ -48,6 +50,20 @@ class CLIProgressObserver(IProgressObserver):
         elif current % 100 == 0 or current == total:
             print(f"  Scanned {current}/{total} files...", end='\r')
     
+    def on_files_scanned_batch(self, file_names: Sequence[str], start: int, total: int) -> None:
+        """Called when a batch of files is scanned"""
+        if not file_names:
+            return
+        
+        if self._current_bar:
+            self._current_bar.update(len(file_names))
+        else:
+            scanned = start + len(file_names) - 1
+            if total > 0:
+                print(f"  Scanned {scanned}/{total} files...", end='\r')
+            else:
+                print(f"  Scanned {scanned} files...", end='\r')
+    
     def on_scan_completed(self, total_files: int) -> None:
         """Called when scan completes"""
         if self._current_bar:
@@ -58,7 +74,7 @@ class CLIProgressObserver(IProgressObserver):
     
     def on_revocation_started(self, total_permissions: int) -> None:
         """Called when permission revocation starts"""
-        print(f"\n🔒 Revoking permissions ({total_permissions} files to process)...")
+        print(f"\n🔒 Revoking permissions ({total_permissions} to process)...")
         
         if self._use_progress_bar and total_permissions > 0:
             self._current_bar = tqdm(total=total_permissions, desc="Revoking", unit="permission")  # type: ignore
@@ -79,6 +95,25 @@ class CLIProgressObserver(IProgressObserver):
             status = "✓" if success else "✗"
             print(f"  {status} [{current}/{total}] {file_name[:50]}", end='\r')
     
+    def on_permissions_revoked_batch(
+        self,
+        results: Sequence[Tuple[str, bool]],
+        start: int,
+        total: int
+    ) -> None:
+        """Called when a batch of permissions is revoked"""
+        if not results:
+            return
+        
+        file_name, success = results[-1]
+        status = "✓" if success else "✗"
+        if self._current_bar:
+            self._current_bar.update(len(results))
+            self._current_bar.set_postfix_str(f"{status} {file_name[:30]}")
+        else:
+            current = start + len(results) - 1
+            print(f"  {status} [{current}/{total}] {file_name[:50]}", end='\r')
+    
     def on_revocation_completed(
         self,
         total: int,
@@ -106,6 +141,9 @@ class SilentProgressObserver(IProgressObserver):
     def on_file_scanned(self, file_name: str, current: int, total: int) -> None:
         pass
     
+    def on_files_scanned_batch(self, file_names: Sequence[str], start: int, total: int) -> None:
+        pass
+    
     def on_scan_completed(self, total_files: int) -> None:
         pass
     
@@ -121,5 +159,13 @@ class SilentProgressObserver(IProgressObserver):
     ) -> None:
         pass
     
+    def on_permissions_revoked_batch(
+        self,
+        results: Sequence[Tuple[str, bool]],
+        start: int,
+        total: int
+    ) -> None:
+        pass
+    
     def on_revocation_completed(self, total: int, successful: int, failed: int) -> None:
         pass
@@ -7,6 +7,7 @@ Main entry point - refactored to use Clean Architecture with Dependency Injectio
 import sys
 import os
 import argparse
+from dataclasses import replace
 from typing import Optional
 from datetime import timedelta
 
@@ -20,7 +21,7 @@ from application.use_cases.manage_user_access_use_case import ManageUserAccessUs
 
 # Configuration and DI
 from config.configuration import ConfigurationLoader
-from config.dependency_injection import ServiceContainer
+from config.dependency_injection import ServiceContainer, configure_services
 
 # Domain exceptions
 from domain.exceptions.access_manager_errors import (
@@ -87,6 +88,12 @@ Examples:
         help='Report formats (comma-separated): csv,excel,json'
     )
 
+    parser.add_argument(
+        '--results-file',
+        type=str,
+        help='Stream per-permission results to this CSV file instead of keeping them in memory'
+    )
+
     # Execution options
     parser.add_argument(
         '--dry-run',
@@ -163,72 +170,12 @@ def setup_container(args: argparse.Namespace) -> ServiceContainer:
     else:
         config = config_loader.load_default()
     
-    # Override with CLI args if provided
+    # Override with CLI args if provided (loaded configs are shared)
     if args.cache_days is not None:
-        config.cache.default_ttl_days = args.cache_days
-    
-    # Create container and store config
-    container = ServiceContainer()
-    container.set_configuration(config)
-    
-    return container
-
-
-def create_use_case(container: ServiceContainer) -> ManageUserAccessUseCase:
-    """
-    Create ManageUserAccessUseCase with dependencies
-    
-    Args:
-        container: Service container with configuration
-        
-    Returns:
-        Configured use case instance
-    """
-    config = container.get_configuration()
-    
-    # Create infrastructure services
-    from infrastructure.google_api.authentication_service import AuthenticationFactory
-    from infrastructure.google_api.google_drive_repository import GoogleDriveRepository
-    from infrastructure.google_api.google_permission_repository import GooglePermissionRepository
-    from infrastructure.cache.file_cache_repository import FileCacheRepository
-    from infrastructure.reporting.report_generator import ReportGenerator
-    from infrastructure.logging.audit_logger import AuditLogger
-    
-    # Create domain services
-    from domain.services.permission_service import PermissionService
-    from domain.services.file_analysis_service import FileAnalysisService
-    
-    # Setup authentication
-    auth_service = AuthenticationFactory.create_oauth2_authenticator(
-        credentials_path=config.google_api.credentials_path,
-        token_path=config.google_api.token_path
-    )
-    auth_service.authenticate()
-    drive_service = auth_service.get_drive_service()
+        config = replace(config, cache=replace(config.cache, default_ttl_days=args.cache_days))
     
-    # Create repositories
-    drive_repo = GoogleDriveRepository(drive_service)
-    permission_repo = GooglePermissionRepository(drive_service)
-    cache_repo = FileCacheRepository(cache_dir=config.cache.cache_dir)
-    
-    # Create other services
-    report_service = ReportGenerator(output_dir=config.reporting.output_dir)
-    audit_logger = AuditLogger(log_dir=config.logging.log_dir)
-    
-    # Create domain services
-    permission_service = PermissionService()
-    file_analysis_service = FileAnalysisService()
-    
-    # Create use case
-    use_case = ManageUserAccessUseCase(
-        drive_repository=drive_repo,
-        permission_repository=permission_repo,
-        cache_repository=cache_repo,
-        report_service=report_service,
-        audit_logger=audit_logger
-    )
-    
-    return use_case
+    # Wire all services once, at startup
+    return configure_services(config)
 
 
 def run_interactive_mode(
@@ -337,6 +284,9 @@ def run_batch_mode(
         elif args.refresh_cache:
             builder.force_refresh_cache()
         
+        if args.results_file:
+            builder.stream_results_to(args.results_file)
+        
         request = builder.build()
         
         # Execute
@@ -385,7 +335,7 @@ def main() -> int:
             progress_observer = CLIProgressObserver(use_progress_bar=True)
         
         # Resolve use case with observer
-        use_case = container.resolve(ManageUserAccessUseCase)
+        use_case = container.manage_access_use_case
         use_case.set_progress_observer(progress_observer)
         
         # Choose mode
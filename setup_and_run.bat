@@ -14,7 +14,7 @@ echo [INFO] Checking Python installation...
 python --version >nul 2>&1
 if %errorlevel% neq 0 (
     echo [ERROR] Python is not installed!
-    echo [INFO] Please install Python 3.7 or higher from https://www.python.org/
+    echo [INFO] Please install Python 3.10 or higher from https://www.python.org/
     pause
     exit /b 1
 )
@@ -52,7 +52,7 @@ check_python() {
         print_success "Found Python $PYTHON_VERSION"
     else
         print_error "Python is not installed!"
-        print_info "Please install Python 3.7 or higher from https://www.python.org/"
+        print_info "Please install Python 3.10 or higher from https://www.python.org/"
         exit 1
     fi
 
@@ -60,8 +60,8 @@ check_python() {
     PYTHON_MAJOR=$($PYTHON_CMD -c 'import sys; print(sys.version_info[0])')
     PYTHON_MINOR=$($PYTHON_CMD -c 'import sys; print(sys.version_info[1])')
 
-    if [ "$PYTHON_MAJOR" -lt 3 ] || ([ "$PYTHON_MAJOR" -eq 3 ] && [ "$PYTHON_MINOR" -lt 7 ]); then
-        print_error "Python 3.7 or higher is required (found $PYTHON_VERSION)"
+    if [ "$PYTHON_MAJOR" -lt 3 ] || ([ "$PYTHON_MAJOR" -eq 3 ] && [ "$PYTHON_MINOR" -lt 10 ]); then
+        print_error "Python 3.10 or higher is required (found $PYTHON_VERSION)"
         exit 1
     fi
 }
@@ -0,0 +1,83 @@
+"""
+Unit Tests for ConfigurationLoader
+Merging of defaults, environment variables and configuration files
+"""
+
+import pytest
+
+from config.configuration import ConfigurationLoader, CacheConfig, _ENV_BINDINGS
+from domain.exceptions.access_manager_errors import ConfigurationError
+
+
+@pytest.fixture(autouse=True)
+def isolated(tmp_path, monkeypatch):
+    """Run in a temporary directory with no GDAM_* variables set"""
+    monkeypatch.chdir(tmp_path)
+    for var, *_ in _ENV_BINDINGS:
+        monkeypatch.delenv(var, raising=False)
+
+
+def _write(tmp_path, name, text):
+    """Write a configuration file and return its path"""
+    path = tmp_path / name
+    path.write_text(text)
+    return str(path)
+
+
+class TestMergePriority:
+    """Test that later sources override earlier ones"""
+    
+    def test_defaults_only(self):
+        """Test loading without file or environment gives the defaults"""
+        config = ConfigurationLoader.load()
+        
+        assert config.cache == CacheConfig()
+    
+    def test_environment_overrides_defaults(self, monkeypatch):
+        """Test environment variables replace default values"""
+        monkeypatch.setenv('GDAM_CACHE_ENABLED', 'false')
+        monkeypatch.setenv('GDAM_CACHE_TTL_DAYS', '3')
+        
+        config = ConfigurationLoader.load()
+        
+        assert config.cache.enabled is False
+        assert config.cache.default_ttl_days == 3
+    
+    def test_file_can_restore_default_set_by_environment(self, tmp_path, monkeypatch):
+        """Test a file value equal to the default still beats the environment"""
+        monkeypatch.setenv('GDAM_CACHE_ENABLED', 'false')
+        monkeypatch.setenv('GDAM_DEBUG', 'true')
+        path = _write(tmp_path, 'config.yaml', "cache:\n  enabled: true\ndebug_mode: false\n")
+        
+        config = ConfigurationLoader.load(path)
+        
+        assert config.cache.enabled is True
+        assert config.debug_mode is False
+    
+    def test_file_keeps_settings_it_does_not_mention(self, tmp_path, monkeypatch):
+        """Test a partial file leaves other environment settings in place"""
+        monkeypatch.setenv('GDAM_CACHE_DIR', 'env_cache')
+        monkeypatch.setenv('GDAM_LOG_LEVEL', 'DEBUG')
+        path = _write(tmp_path, 'config.yaml', "cache:\n  max_size_mb: 50\n")
+        
+        config = ConfigurationLoader.load(path)
+        
+        assert config.cache.cache_dir == 'env_cache'
+        assert config.cache.max_size_mb == 50
+        assert config.logging.log_level == 'DEBUG'
+    
+    def test_toml_file(self, tmp_path, monkeypatch):
+        """Test TOML files merge the same way as YAML"""
+        monkeypatch.setenv('GDAM_CACHE_ENABLED', 'false')
+        path = _write(tmp_path, 'config.toml', "[cache]\nenabled = true\n")
+        
+        config = ConfigurationLoader.load(path)
+        
+        assert config.cache.enabled is True
+    
+    def test_unknown_setting_is_rejected(self, tmp_path):
+        """Test a misspelled setting raises ConfigurationError"""
+        path = _write(tmp_path, 'config.yaml', "cache:\n  enabeld: true\n")
+        
+        with pytest.raises(ConfigurationError):
+            ConfigurationLoader.load(path)
@@ -0,0 +1,243 @@
+"""
+Unit Tests for FileCacheRepository
+Round trips, expiry, failed writes and shards from older runs
+"""
+
+import gc
+import json
+import logging
+import os
+import weakref
+from datetime import datetime, timedelta
+
+import pytest
+
+import infrastructure.cache.file_cache_repository as file_cache
+from infrastructure.cache.file_cache_repository import FileCacheRepository
+from domain.exceptions.access_manager_errors import CacheError
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Cache repository in a temporary directory"""
+    repo = FileCacheRepository(str(tmp_path))
+    yield repo
+    repo.close()
+
+
+def _shards(path):
+    """Shard files in a cache directory"""
+    return sorted(name for name in os.listdir(path) if name != "cache_metadata.json")
+
+
+class TestRoundTrip:
+    """Test saving and loading entries"""
+    
+    def test_save_then_load(self, cache):
+        """Test data comes back unchanged"""
+        data = {'files': [{'id': 'a', 'size': 3}], 'name': 'résumé'}
+        cache.save('key', data).result()
+        
+        assert cache.load('key') == data
+        assert cache.is_valid('key')
+    
+    def test_load_waits_for_pending_write(self, cache):
+        """Test load sees a write that has not completed yet"""
+        cache.save('key', [1, 2, 3])
+        assert cache.load('key') == [1, 2, 3]
+    
+    def test_entries_survive_reopen(self, tmp_path, cache):
+        """Test a new instance reads entries from the metadata index"""
+        cache.save('key', {'a': 1}).result()
+        cache.close()
+        
+        reopened = FileCacheRepository(str(tmp_path))
+        try:
+            assert reopened.load('key') == {'a': 1}
+        finally:
+            reopened.close()
+    
+    def test_uncompressed_round_trip(self, tmp_path):
+        """Test entries round-trip with compression disabled"""
+        repo = FileCacheRepository(str(tmp_path), compression_enabled=False)
+        try:
+            repo.save('key', {'a': 1}).result()
+            assert repo.load('key') == {'a': 1}
+            assert _shards(tmp_path)[0].endswith('.json')
+        finally:
+            repo.close()
+    
+    def test_missing_key_returns_none(self, cache):
+        """Test loading an unknown key is a miss"""
+        assert cache.load('missing') is None
+        assert cache.get_info('missing') is None
+    
+    def test_mset_and_mget(self, cache):
+        """Test multi-key save and load"""
+        cache.mset({'a': ([1], None), 'b': ({'x': 2}, timedelta(days=1))})
+        
+        assert cache.mget(['a', 'b', 'c']) == {'a': [1], 'b': {'x': 2}}
+    
+    def test_invalidate_prefix(self, tmp_path, cache):
+        """Test only keys with the prefix are removed, shards included"""
+        cache.mset({'run_1': (1, None), 'run_2': (2, None), 'other': (3, None)})
+        cache.invalidate_prefix('run_')
+        
+        assert cache.mget(['run_1', 'run_2', 'other']) == {'other': 3}
+        assert len(_shards(tmp_path)) == 1
+    
+    def test_get_info_reports_size_and_items(self, cache):
+        """Test get_info describes an entry without loading it"""
+        cache.save('key', [1, 2, 3]).result()
+        info = cache.get_info('key')
+        
+        assert info['items'] == 3
+        assert info['size'] > 0
+        assert info['valid'] is True
+
+
+class TestExpiry:
+    """Test TTL handling"""
+    
+    def test_expired_entry_is_a_miss(self, tmp_path, cache, monkeypatch):
+        """Test an entry past its TTL is dropped on load"""
+        cache.save('key', [1], ttl=timedelta(seconds=60)).result()
+        now = file_cache.time.time()
+        monkeypatch.setattr(file_cache.time, 'time', lambda: now + 120)
+        
+        assert cache.is_valid('key') is False
+        assert cache.load('key') is None
+        assert cache.get_info('key') is None
+        assert _shards(tmp_path) == []
+    
+    def test_entry_without_ttl_never_expires(self, cache, monkeypatch):
+        """Test entries saved without a TTL stay valid"""
+        cache.save('key', [1]).result()
+        now = file_cache.time.time()
+        monkeypatch.setattr(file_cache.time, 'time', lambda: now + 10 ** 9)
+        
+        assert cache.load('key') == [1]
+
+
+class TestFailedWrites:
+    """Test background write failures"""
+    
+    def test_failed_write_raises_on_result_and_load(self, cache):
+        """Test a failed save surfaces as CacheError"""
+        future = cache.save('key', {1, 2})  # sets are not JSON-serializable
+        
+        with pytest.raises(CacheError):
+            future.result()
+        
+        cache.save('other', {2, 3})
+        with pytest.raises(CacheError):
+            cache.load('other')
+    
+    def test_next_save_supersedes_failed_write(self, cache):
+        """Test a failed write does not make the next save of the key raise"""
+        cache.save('key', {1, 2})
+        cache.save('key', [1, 2]).result()
+        
+        assert cache.load('key') == [1, 2]
+    
+    def test_wait_raises_first_failure(self, cache):
+        """Test wait() reports failed pending writes"""
+        cache.save('key', {1, 2})
+        
+        with pytest.raises(CacheError):
+            cache.wait()
+    
+    def test_close_logs_failed_write(self, tmp_path, caplog):
+        """Test close() logs a failed write nobody waited for"""
+        repo = FileCacheRepository(str(tmp_path))
+        repo.save('key', {1, 2})
+        
+        with caplog.at_level(logging.WARNING, logger=file_cache.__name__):
+            repo.close()
+        
+        assert "Background cache write of key failed" in caplog.text
+
+
+class TestLifetime:
+    """Test closing repositories at interpreter exit"""
+    
+    def test_open_repository_is_not_pinned(self, tmp_path):
+        """Test the exit registry does not keep a dropped repository alive"""
+        repo = FileCacheRepository(str(tmp_path))
+        repo.save('key', [1]).result()
+        ref = weakref.ref(repo)
+        
+        del repo
+        gc.collect()
+        
+        assert ref() is None
+    
+    def test_close_unregisters_repository(self, tmp_path):
+        """Test a closed repository is not closed again at exit"""
+        repo = FileCacheRepository(str(tmp_path))
+        assert repo in file_cache._open_repositories
+        
+        repo.close()
+        
+        assert repo not in file_cache._open_repositories
+
+
+class TestShardsFromOlderRuns:
+    """Test entries written by earlier versions or settings"""
+    
+    def test_legacy_entry_without_epoch_expiry(self, tmp_path, cache):
+        """Test entries with only an ISO expires_at are still honoured"""
+        cache.save('fresh', [1], ttl=timedelta(days=1)).result()
+        cache.save('stale', [2], ttl=timedelta(days=1)).result()
+        cache.close()
+        
+        metadata_path = tmp_path / "cache_metadata.json"
+        metadata = json.loads(metadata_path.read_text())
+        for entry in metadata.values():
+            del entry['expires_at_ts']
+        metadata['stale']['expires_at'] = (datetime.now() - timedelta(hours=1)).isoformat()
+        metadata_path.write_text(json.dumps(metadata))
+        
+        reopened = FileCacheRepository(str(tmp_path))
+        try:
+            assert reopened.load('fresh') == [1]
+            assert reopened.load('stale') is None
+        finally:
+            reopened.close()
+    
+    def test_rewrite_removes_shard_in_old_format(self, tmp_path, cache):
+        """Test changing compression does not orphan the previous shard"""
+        cache.save('key', [1]).result()
+        cache.close()
+        
+        uncompressed = FileCacheRepository(str(tmp_path), compression_enabled=False)
+        try:
+            assert uncompressed.load('key') == [1]
+            uncompressed.save('key', [2]).result()
+            
+            shards = _shards(tmp_path)
+            assert len(shards) == 1
+            assert shards[0].endswith('.json')
+        finally:
+            uncompressed.close()
+    
+    def test_undecodable_shard_is_dropped(self, tmp_path, cache, monkeypatch):
+        """Test a zstd shard without zstandard installed is removed on load"""
+        cache.save('key', [1]).result()
+        shard = cache._metadata['key']['file']
+        zst_shard = shard.split('.json')[0] + '.json.zst'
+        os.replace(tmp_path / shard, tmp_path / zst_shard)
+        cache._metadata['key']['file'] = zst_shard
+        monkeypatch.setattr(file_cache, 'ZSTD_AVAILABLE', False)
+        
+        assert cache.load('key') is None
+        assert cache.get_info('key') is None
+        assert _shards(tmp_path) == []
+    
+    def test_corrupt_shard_is_a_miss(self, tmp_path, cache):
+        """Test a corrupt shard is treated as a miss and dropped"""
+        cache.save('key', [1]).result()
+        (tmp_path / cache._metadata['key']['file']).write_bytes(b'not compressed json')
+        
+        assert cache.load('key') is None
+        assert _shards(tmp_path) == []
@@ -0,0 +1,350 @@
+"""
+Unit Tests for ManageUserAccessUseCase
+Revocation checkpointing against in-memory repositories
+"""
+
+import csv
+
+import pytest
+
+import application.use_cases.manage_user_access_use_case as manage_module
+from application.use_cases.manage_user_access_use_case import ManageUserAccessUseCase
+from application.dto.access_management_request import AccessManagementRequest
+from application.dto.access_management_result import RevocationResult
+from application.interfaces.repositories import (
+    IDriveRepository, IPermissionRepository, ICacheRepository
+)
+from application.interfaces.services import IReportService, IResultSink
+from domain.entities.drive_file import DriveFile
+from domain.exceptions.access_manager_errors import CacheError
+from infrastructure.reporting.result_sinks import CSVResultSink
+
+
+TARGET = 'leaver@example.com'
+CHECKPOINT_KEY = 'revoke_progress_' + TARGET
+
+
+def _make_file(index):
+    """Drive file owned by someone else and shared with the target user"""
+    return DriveFile.from_api_response({
+        'id': f'file{index:012d}',
+        'name': f'Document {index}',
+        'owners': [{'emailAddress': 'owner@example.com'}],
+        'shared': True,
+        'permissions': [
+            {'id': f'owner{index}', 'type': 'user', 'role': 'owner',
+             'emailAddress': 'owner@example.com'},
+            {'id': f'perm{index}', 'type': 'user', 'role': 'writer',
+             'emailAddress': TARGET},
+        ],
+    })
+
+
+class FakeDriveRepository(IDriveRepository):
+    """Drive repository serving a fixed list of files"""
+    
+    def __init__(self, files):
+        self.files = files
+    
+    def list_all_files(self, page_size=None):
+        return list(self.files)
+    
+    def iter_all_files(self, page_size=None):
+        return iter(self.files)
+    
+    async def list_all_files_async(self, page_size=None):
+        for file in self.files:
+            yield file
+    
+    def get_start_page_token(self):
+        return 'token'
+    
+    def list_changes(self, page_token):
+        return [], [], page_token
+    
+    def get_file_by_id(self, file_id):
+        return None
+    
+    def find_files_shared_with(self, email, fields=None):
+        return [file for file in self.files if file.is_shared_with(email)]
+    
+    def find_files_owned_by(self, email, fields=None):
+        return [file for file in self.files if file.is_owned_by(email)]
+
+
+class FakePermissionRepository(IPermissionRepository):
+    """
+    Permission repository recording revoked (file_id, permission_id) pairs
+    
+    Files in ``failing`` report a failed revocation; the batch call
+    numbered ``interrupt_on`` raises KeyboardInterrupt, simulating a run
+    killed part way through.
+    """
+    
+    def __init__(self, failing=(), interrupt_on=None):
+        self.failing = set(failing)
+        self.interrupt_on = interrupt_on
+        self.batches = 0
+        self.revoked = []
+    
+    def get_file_permissions(self, file_id):
+        return []
+    
+    def revoke_permission(self, file_id, permission_id, use_admin_access=False):
+        self.revoked.append((str(file_id), str(permission_id)))
+        return True
+    
+    def revoke_permissions_batch(self, items, use_admin_access=False):
+        self.batches += 1
+        if self.batches == self.interrupt_on:
+            raise KeyboardInterrupt
+        
+        results = []
+        for file_id, permission_id in items:
+            key = (str(file_id), str(permission_id))
+            if key[0] in self.failing:
+                results.append(RevocationResult(key[0], '', key[1], 'failed', 'Backend error'))
+            else:
+                self.revoked.append(key)
+                results.append(RevocationResult(key[0], '', key[1], 'success'))
+        return results
+    
+    def update_permission_role(self, file_id, permission_id, new_role):
+        pass
+
+
+class FakeCacheRepository(ICacheRepository):
+    """Dictionary-backed cache recording every save"""
+    
+    def __init__(self, fail_saves=False):
+        self.data = {}
+        self.saves = []
+        self.fail_saves = fail_saves
+    
+    def save(self, key, data, ttl=None):
+        self.saves.append(key)
+        if self.fail_saves:
+            raise CacheError(f"Failed to save cache {key}")
+        self.data[key] = data
+    
+    def load(self, key):
+        return self.data.get(key)
+    
+    def invalidate(self, key):
+        self.data.pop(key, None)
+    
+    def invalidate_prefix(self, prefix):
+        for key in [key for key in self.data if key.startswith(prefix)]:
+            del self.data[key]
+    
+    def is_valid(self, key):
+        return key in self.data
+    
+    def clear_all(self):
+        self.data.clear()
+
+
+class FakeReportService(IReportService):
+    """Report service that writes nothing"""
+    
+    def generate_report(self, files, output_path, format, metadata=None):
+        return output_path
+    
+    def generate_report_streaming(self, files, output_path, format, metadata=None):
+        return output_path
+    
+    def set_formatter(self, formatter):
+        pass
+
+
+class ListResultSink(IResultSink):
+    """Result sink collecting results in a list"""
+    
+    def __init__(self, path):
+        self.path = path
+        self.results = []
+        self.closed = False
+    
+    def write(self, result):
+        self.results.append(result)
+    
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture(autouse=True)
+def small_chunks(monkeypatch):
+    """Revoke two permissions per batch call and checkpoint after every chunk"""
+    monkeypatch.setattr(manage_module, '_REVOCATION_CHUNK_SIZE', 2)
+    monkeypatch.setattr(manage_module, '_CHECKPOINT_INTERVAL', 1)
+    monkeypatch.setattr(manage_module, '_BATCH_THRESHOLD', 1)
+
+
+@pytest.fixture
+def files():
+    """Six files, each with one revocable permission for the target user"""
+    return [_make_file(index) for index in range(6)]
+
+
+def _run(
+    files,
+    permission_repo,
+    cache_repo,
+    dry_run=False,
+    sink_factory=None,
+    results_path=None
+):
+    """Run a revocation for the target user"""
+    use_case = ManageUserAccessUseCase(
+        drive_repository=FakeDriveRepository(files),
+        permission_repository=permission_repo,
+        report_service=FakeReportService(),
+        cache_repository=cache_repo,
+        result_sink_factory=sink_factory
+    )
+    request = AccessManagementRequest.revoking(
+        TARGET,
+        formats=(),
+        dry_run=dry_run,
+        cache_enabled=False,
+        results_path=results_path
+    )
+    return use_case.execute(request)
+
+
+def _pair(index):
+    """(file_id, permission_id) of the target's permission on a test file"""
+    return (f'file{index:012d}', f'perm{index}')
+
+
+class TestRevocationCheckpoint:
+    """Test checkpointing of revocation progress"""
+    
+    def test_checkpoint_removed_on_completion(self, files):
+        """Test a completed run leaves no checkpoint behind"""
+        cache = FakeCacheRepository()
+        result = _run(files, FakePermissionRepository(), cache)
+        
+        assert result.success_count == 6
+        assert CHECKPOINT_KEY in cache.saves
+        assert CHECKPOINT_KEY not in cache.data
+    
+    def test_interrupted_run_leaves_checkpoint(self, files):
+        """Test completed revocations are checkpointed before an interruption"""
+        cache = FakeCacheRepository()
+        with pytest.raises(KeyboardInterrupt):
+            _run(files, FakePermissionRepository(interrupt_on=2), cache)
+        
+        completed = cache.data[CHECKPOINT_KEY]['completed']
+        assert [(file_id, permission_id) for file_id, _, permission_id, _ in completed] == [
+            _pair(0), _pair(1)
+        ]
+    
+    def test_resume_skips_completed_permissions(self, files):
+        """Test a rerun does not revoke checkpointed permissions again"""
+        cache = FakeCacheRepository()
+        with pytest.raises(KeyboardInterrupt):
+            _run(files, FakePermissionRepository(interrupt_on=3), cache)
+        
+        permission_repo = FakePermissionRepository()
+        result = _run(files, permission_repo, cache)
+        
+        assert permission_repo.revoked == [_pair(4), _pair(5)]
+        assert result.success_count == 6
+        assert {revocation.file_name for revocation in result.successful_revocations} == {
+            f'Document {index}' for index in range(6)
+        }
+        assert CHECKPOINT_KEY not in cache.data
+    
+    def test_failed_revocations_are_retried(self, files):
+        """Test failures are not checkpointed, so a rerun retries them"""
+        cache = FakeCacheRepository()
+        with pytest.raises(KeyboardInterrupt):
+            _run(files, FakePermissionRepository(failing={_pair(1)[0]}, interrupt_on=2), cache)
+        
+        permission_repo = FakePermissionRepository()
+        result = _run(files, permission_repo, cache)
+        
+        assert permission_repo.revoked == [_pair(index) for index in range(1, 6)]
+        assert result.success_count == 6
+        assert result.failure_count == 0
+    
+    def test_dry_run_does_not_checkpoint(self, files):
+        """Test dry runs neither read nor write a checkpoint"""
+        cache = FakeCacheRepository()
+        file_id, permission_id = _pair(0)
+        cache.data[CHECKPOINT_KEY] = {
+            'completed': [[file_id, 'Document 0', permission_id, 'success']]
+        }
+        
+        result = _run(files, FakePermissionRepository(), cache, dry_run=True)
+        
+        assert len(result.successful_revocations) == 6
+        assert cache.saves == []
+        assert CHECKPOINT_KEY in cache.data
+    
+    def test_checkpoint_save_failure_does_not_stop_revocation(self, files):
+        """Test a failing cache write is logged, not raised"""
+        cache = FakeCacheRepository(fail_saves=True)
+        permission_repo = FakePermissionRepository()
+        result = _run(files, permission_repo, cache)
+        
+        assert CHECKPOINT_KEY in cache.saves
+        assert len(permission_repo.revoked) == 6
+        assert result.success_count == 6
+
+
+class TestResultSink:
+    """Test streaming revocation results to a sink"""
+    
+    def test_results_streamed_instead_of_retained(self, files):
+        """Test a results_path streams every result and closes the sink"""
+        sinks = []
+        
+        def open_sink(path):
+            sinks.append(ListResultSink(path))
+            return sinks[-1]
+        
+        permission_repo = FakePermissionRepository(failing={_pair(2)[0]})
+        result = _run(
+            files, permission_repo, None, sink_factory=open_sink, results_path='results.csv'
+        )
+        
+        [sink] = sinks
+        assert sink.path == 'results.csv'
+        assert sink.closed
+        assert len(sink.results) == 6
+        assert (result.success_count, result.failure_count) == (5, 1)
+        assert result.successful_revocations == []
+        assert result.failed_revocations == []
+    
+    def test_sink_closed_when_run_is_interrupted(self, files):
+        """Test the sink is closed even if the run raises"""
+        sinks = []
+        
+        def open_sink(path):
+            sinks.append(ListResultSink(path))
+            return sinks[-1]
+        
+        with pytest.raises(KeyboardInterrupt):
+            _run(files, FakePermissionRepository(interrupt_on=1), None,
+                 sink_factory=open_sink, results_path='results.csv')
+        
+        assert sinks[0].closed
+    
+    def test_results_path_without_factory_is_rejected(self, files):
+        """Test a results_path needs a configured sink factory"""
+        with pytest.raises(ValueError):
+            _run(files, FakePermissionRepository(), None, results_path='results.csv')
+    
+    def test_csv_file_sink(self, files, tmp_path):
+        """Test CSVResultSink.to_file writes one row per result"""
+        path = tmp_path / 'results.csv'
+        _run(files, FakePermissionRepository(), None,
+             sink_factory=CSVResultSink.to_file, results_path=str(path))
+        
+        with open(path, newline='', encoding='utf-8') as f:
+            rows = list(csv.DictReader(f))
+        
+        assert [row['status'] for row in rows] == ['success'] * 6
+        assert rows[0]['file_name'] == 'Document 0'